@@ -0,0 +1,90 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from .corpus import CORPUS_SIZES, MB, Corpus, make_corpus
+
+BASELINE_STORAGE = Path(__file__).resolve().parent / "baselines"
+
+# Допустимое замедление относительно базовой линии при --benchmark-compare.
+REGRESSION_THRESHOLD = os.environ.get("TEXTSUMMARIZER_BENCH_THRESHOLD", "mean:15%")
+
+# 10MB и 100MB включаются явно: --corpus-sizes=1KB,100KB,10MB,100MB
+DEFAULT_SIZES = os.environ.get("TEXTSUMMARIZER_BENCH_SIZES", "1KB,100KB")
+
+LANGUAGES = ("ru", "en")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--corpus-sizes",
+        default=DEFAULT_SIZES,
+        help=f"Размеры корпусов через запятую из {', '.join(CORPUS_SIZES)}",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Базовые линии хранятся в репозитории, а не в ./.benchmarks текущей
+    # директории; порог регрессии применяется, если его не задали явно.
+    if config.getoption("benchmark_storage") == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BASELINE_STORAGE}"
+    if config.getoption("benchmark_compare") and not config.getoption(
+        "benchmark_compare_fail"
+    ):
+        from argparse import ArgumentTypeError
+        from pytest_benchmark.utils import parse_compare_fail
+
+        try:
+            config.option.benchmark_compare_fail = [
+                parse_compare_fail(check) for check in REGRESSION_THRESHOLD.split(",")
+            ]
+        except ArgumentTypeError as e:
+            raise pytest.UsageError(f"TEXTSUMMARIZER_BENCH_THRESHOLD: {e}")
+
+
+def pytest_generate_tests(metafunc):
+    if "corpus" not in metafunc.fixturenames:
+        return
+
+    sizes = [s.strip() for s in metafunc.config.getoption("corpus_sizes").split(",")]
+    unknown = set(sizes) - CORPUS_SIZES.keys()
+    if unknown:
+        raise pytest.UsageError(f"Неизвестные размеры корпуса: {', '.join(unknown)}")
+
+    params = [(language, size) for size in sizes for language in LANGUAGES]
+    metafunc.parametrize(
+        "corpus",
+        params,
+        ids=[f"{language}-{size}" for language, size in params],
+        indirect=True,
+    )
+
+
+_corpora = {}
+
+
+@pytest.fixture
+def corpus(request):
+    language, size_name = request.param
+    key = (language, size_name)
+    if key not in _corpora:
+        _corpora[key] = Corpus(
+            language, size_name, make_corpus(language, CORPUS_SIZES[size_name])
+        )
+    return _corpora[key]
+
+
+@pytest.fixture
+def run(benchmark, corpus):
+    """Запускает замер; большие корпуса - одним раундом без прогрева."""
+
+    def runner(func, *args, **kwargs):
+        if corpus.size >= 10 * MB:
+            return benchmark.pedantic(
+                func, args=args, kwargs=kwargs, rounds=1, iterations=1
+            )
+        return benchmark(func, *args, **kwargs)
+
+    return runner
@@ -0,0 +1,82 @@
+import random
+from dataclasses import dataclass, field
+from typing import List
+
+from src.textsummarizer.utils.text_processing import split_into_sentences
+
+KB = 1024
+MB = 1024 * KB
+
+CORPUS_SIZES = {"1KB": KB, "100KB": 100 * KB, "10MB": 10 * MB, "100MB": 100 * MB}
+
+_WORDS = {
+    "ru": (
+        "анализ данных система метод результат исследование модель задача "
+        "решение алгоритм процесс время работа вопрос развитие основной "
+        "важный новый большой высокий общий первый последний главный "
+        "показывает позволяет требует является использует определяет "
+        "текст предложение слово документ значение оценка структура "
+        "обучение сеть информация качество скорость точность пример "
+        "очень быстро значительно также однако поэтому следовательно "
+        "в на с по для при о из к от до"
+    ).split(),
+    "en": (
+        "analysis data system method result research model problem solution "
+        "algorithm process time work question development main important new "
+        "large high general first last primary shows allows requires is uses "
+        "defines text sentence word document value estimate structure learning "
+        "network information quality speed accuracy example very quickly "
+        "significantly also however therefore thus in on with by for at of "
+        "from to the a an and"
+    ).split(),
+}
+
+_PROPER_NOUNS = {
+    "ru": "Москва Россия Иванов Петров Сибирь Волга Яндекс Байкал".split(),
+    "en": "London Google Smith Johnson Europe Thames Oxford Amazon".split(),
+}
+
+
+def make_corpus(language: str, size: int, seed: int = 0) -> str:
+    """Детерминированный синтетический текст размером около size байт UTF-8."""
+    rng = random.Random(seed)
+    words = _WORDS[language]
+    proper_nouns = _PROPER_NOUNS[language]
+
+    parts: List[str] = []
+    total = 0
+    while total < size:
+        sentence_words = rng.choices(words, k=rng.randint(5, 25))
+        if rng.random() < 0.3:
+            sentence_words.insert(
+                rng.randrange(len(sentence_words)), rng.choice(proper_nouns)
+            )
+        if rng.random() < 0.2:
+            sentence_words.append(str(rng.randint(1, 2024)))
+
+        sentence = " ".join(sentence_words)
+        sentence = sentence[0].upper() + sentence[1:] + rng.choice("...!?")
+        separator = "\n\n" if rng.random() < 0.1 else " "
+
+        parts.append(sentence + separator)
+        total += len(sentence.encode("utf-8")) + len(separator)
+
+    return "".join(parts)
+
+
+@dataclass
+class Corpus:
+    language: str
+    size_name: str
+    text: str
+    _sentences: List[str] = field(default_factory=list, repr=False)
+
+    @property
+    def size(self) -> int:
+        return CORPUS_SIZES[self.size_name]
+
+    @property
+    def sentences(self) -> List[str]:
+        if not self._sentences:
+            self._sentences = split_into_sentences(self.text)
+        return self._sentences
@@ -0,0 +1,22 @@
+import pytest
+from src.textsummarizer.methods import FeatureBasedSummarizer, FrequencyBasedSummarizer
+from src.textsummarizer.statistics import StatisticsCalculator
+
+
+@pytest.mark.benchmark(group="FeatureBasedSummarizer.summarize")
+def test_feature_based_summarize(run, corpus):
+    sentences = corpus.sentences
+    assert run(FeatureBasedSummarizer().summarize, sentences, 0.3)
+
+
+@pytest.mark.benchmark(group="FrequencyBasedSummarizer.summarize")
+def test_frequency_based_summarize(run, corpus):
+    sentences = corpus.sentences
+    assert run(FrequencyBasedSummarizer().summarize, sentences, 0.3)
+
+
+@pytest.mark.benchmark(group="StatisticsCalculator.calculate_stats")
+def test_calculate_stats(run, corpus):
+    summary = " ".join(corpus.sentences[::3])
+    stats = run(StatisticsCalculator().calculate_stats, corpus.text, summary)
+    assert stats.original_words_count > stats.summary_words_count
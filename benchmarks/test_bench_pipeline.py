@@ -0,0 +1,14 @@
+import pytest
+from src.textsummarizer.core import TextSummarizer
+from src.textsummarizer.entities import SummaryMethod
+
+
+@pytest.mark.benchmark(group="TextSummarizer.summarize")
+@pytest.mark.parametrize(
+    "method",
+    [SummaryMethod.FEATURE_BASED, SummaryMethod.FREQUENCY_BASED],
+    ids=["feature", "frequency"],
+)
+def test_text_summarizer_summarize(run, corpus, method):
+    result = run(TextSummarizer(method=method).summarize, corpus.text, 0.3)
+    assert result.important_sentences
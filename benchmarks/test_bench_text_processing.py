@@ -0,0 +1,59 @@
+import pytest
+from src.textsummarizer.utils.normalization import DEFAULT_NORMALIZER
+from src.textsummarizer.utils.text_processing import (
+    calculate_readability_metrics,
+    preprocess_text,
+    split_into_sentences,
+    tokenize_many,
+    tokenize_words,
+)
+
+
+@pytest.mark.benchmark(group="split_into_sentences")
+def test_split_into_sentences(run, corpus):
+    assert run(split_into_sentences, corpus.text)
+
+
+@pytest.mark.benchmark(group="split_into_sentences")
+def test_split_into_sentences_fast(run, corpus):
+    assert run(split_into_sentences, corpus.text, segmenter="fast")
+
+
+@pytest.mark.benchmark(group="preprocess_text")
+def test_preprocess_text(run, corpus):
+    assert run(preprocess_text, corpus.text)
+
+
+@pytest.mark.benchmark(group="normalize_sentences")
+def test_preprocess_text_per_sentence(run, corpus):
+    sentences = split_into_sentences(corpus.text)
+    assert run(lambda: [preprocess_text(s) for s in sentences])
+
+
+@pytest.mark.benchmark(group="normalize_sentences")
+def test_normalize_many(run, corpus):
+    sentences = split_into_sentences(corpus.text)
+    assert run(DEFAULT_NORMALIZER.normalize_many, sentences)
+
+
+@pytest.mark.benchmark(group="tokenize_sentences")
+def test_tokenize_preprocess_chain(run, corpus):
+    sentences = split_into_sentences(corpus.text)
+    assert run(lambda: [tokenize_words(preprocess_text(s)) for s in sentences])
+
+
+@pytest.mark.benchmark(group="tokenize_sentences")
+def test_tokenize_legacy(run, corpus):
+    sentences = split_into_sentences(corpus.text)
+    assert run(tokenize_many, sentences)
+
+
+@pytest.mark.benchmark(group="tokenize_sentences")
+def test_tokenize_unicode(run, corpus):
+    sentences = split_into_sentences(corpus.text)
+    assert run(tokenize_many, sentences, "unicode")
+
+
+@pytest.mark.benchmark(group="calculate_readability_metrics")
+def test_calculate_readability_metrics(run, corpus):
+    assert run(calculate_readability_metrics, corpus.text)["total_words"] > 0
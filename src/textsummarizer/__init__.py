@@ -1,10 +1,14 @@
 __version__ = "0.1.0"
 
+from .cache import SummaryCache
 from .core import TextSummarizer
 from .entities import SummaryMethod, SummaryResult
+from .profiling import StageTimer
 
 __all__ = [
     "TextSummarizer",
+    "SummaryCache",
     "SummaryMethod",
     "SummaryResult",
+    "StageTimer",
 ]
@@ -0,0 +1,283 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from .entities import SummaryMethod, SummaryResult
+from .utils.file_io import read_text_file, write_text_file, save_json
+
+# Экземпляр TextSummarizer, создаваемый один раз в каждом процессе пула.
+_worker_summarizer: Any = None
+
+
+def _init_worker(
+    method: SummaryMethod,
+    frequency_backend: str,
+    keywords: Any = None,
+    segmenter: str = "legacy",
+    idf: Any = None,
+    tokenizer: str = "legacy",
+) -> None:
+    global _worker_summarizer
+    from .core import TextSummarizer
+
+    _worker_summarizer = TextSummarizer(
+        method=method,
+        frequency_backend=frequency_backend,
+        keywords=keywords,
+        segmenter=segmenter,
+        idf=idf,
+        tokenizer=tokenizer,
+    )
+
+
+def _detach(result: SummaryResult) -> SummaryResult:
+    # Разбор предложений нужен только для статистики; не гоняем его через IPC.
+    for sentence in result.important_sentences:
+        sentence.analysis = None
+    return result
+
+
+def _summarize_texts(texts: List[str], compression_ratio: float) -> List[SummaryResult]:
+    return [
+        _detach(_worker_summarizer.summarize(text, compression_ratio)) for text in texts
+    ]
+
+
+def _summarize_paths(
+    paths: List[Path], compression_ratio: float
+) -> List[Tuple[Path, SummaryResult]]:
+    return [
+        (
+            path,
+            _detach(
+                _worker_summarizer.summarize(read_text_file(path), compression_ratio)
+            ),
+        )
+        for path in paths
+    ]
+
+
+def summary_output_paths(
+    input_path: Path, output_dir: Optional[Path] = None
+) -> Tuple[Path, Path]:
+    """Пути <stem>_summary.txt и <stem>_stats.json, как у команды summarize."""
+    output_dir = output_dir if output_dir is not None else input_path.parent
+    return (
+        output_dir / f"{input_path.stem}_summary.txt",
+        output_dir / f"{input_path.stem}_stats.json",
+    )
+
+
+def summary_stats_data(result: SummaryResult) -> Dict[str, Any]:
+    stats = result.statistics
+    return {
+        "original_sentences_count": stats.original_sentences_count,
+        "original_words_count": stats.original_words_count,
+        "summary_sentences_count": stats.summary_sentences_count,
+        "summary_words_count": stats.summary_words_count,
+        "compression_ratio": stats.compression_ratio,
+        "reading_time_minutes": stats.reading_time_minutes,
+        "method_used": result.method_used.value,
+        "original_readability": {
+            "flesch_score": stats.original_readability.flesch_score,
+            "avg_sentence_length": stats.original_readability.avg_sentence_length,
+            "avg_word_length": stats.original_readability.avg_word_length,
+            "lexical_diversity": stats.original_readability.lexical_diversity,
+        },
+        "summary_readability": {
+            "flesch_score": stats.summary_readability.flesch_score,
+            "avg_sentence_length": stats.summary_readability.avg_sentence_length,
+            "avg_word_length": stats.summary_readability.avg_word_length,
+            "lexical_diversity": stats.summary_readability.lexical_diversity,
+        },
+    }
+
+
+def _summarize_to_files(
+    paths: List[Path],
+    compression_ratio: float,
+    output_dir: Optional[Path],
+    save_stats: bool,
+) -> List[Tuple[Path, int, float, Optional[str]]]:
+    """Саммаризирует и сразу пишет результаты; в родителя уходят только метрики."""
+    report = []
+    for path in paths:
+        started = time.perf_counter()
+        size = 0
+        try:
+            # Файл могли удалить после раскрытия шаблонов: это ошибка одного
+            # файла, а не всей пачки.
+            size = path.stat().st_size
+            result = _worker_summarizer.summarize(
+                read_text_file(path), compression_ratio
+            )
+            summary_file, stats_file = summary_output_paths(path, output_dir)
+            write_text_file(summary_file, result.summary_text)
+            if save_stats:
+                save_json(stats_file, summary_stats_data(result))
+            error = None
+        except Exception as e:
+            error = str(e)
+        report.append((path, size, time.perf_counter() - started, error))
+    return report
+
+
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_in_pool(
+    items: Iterable[Any],
+    task: Callable[..., List[Any]],
+    task_args: Sequence[Any],
+    initializer: Optional[Callable[..., None]],
+    initargs: Sequence[Any],
+    workers: Optional[int] = None,
+    chunk_size: int = 32,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+) -> Iterator[Any]:
+    """Раздает элементы пачками по процессам и отдает результаты по мере готовности.
+
+    В работе одновременно не больше max_pending пачек, поэтому входной итератор
+    читается лениво, а память ограничена независимо от числа документов.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size должен быть положительным")
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    chunks = iter_chunks(items, chunk_size)
+
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for chunk in chunks:
+            yield from task(chunk, *task_args)
+        return
+
+    # concurrent.futures.process тянет multiprocessing; не платим за него при
+    # импорте пакета.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=tuple(initargs)
+    ) as executor:
+        if ordered:
+            queue: Deque[Future] = deque()
+            for chunk in chunks:
+                queue.append(executor.submit(task, chunk, *task_args))
+                if len(queue) >= max_pending:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+        else:
+            pending: Set[Future] = set()
+            for chunk in chunks:
+                pending.add(executor.submit(task, chunk, *task_args))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+def summarize_many(
+    texts: Iterable[str],
+    method: SummaryMethod,
+    frequency_backend: str = "python",
+    compression_ratio: float = 0.3,
+    workers: Optional[int] = None,
+    chunk_size: int = 32,
+    ordered: bool = True,
+    keywords: Any = None,
+    segmenter: str = "legacy",
+    idf: Any = None,
+    tokenizer: str = "legacy",
+) -> Iterator[SummaryResult]:
+    return run_in_pool(
+        texts,
+        _summarize_texts,
+        (compression_ratio,),
+        _init_worker,
+        (method, frequency_backend, keywords, segmenter, idf, tokenizer),
+        workers=workers,
+        chunk_size=chunk_size,
+        ordered=ordered,
+    )
+
+
+def summarize_files(
+    paths: Iterable[Union[str, Path]],
+    method: SummaryMethod,
+    frequency_backend: str = "python",
+    compression_ratio: float = 0.3,
+    workers: Optional[int] = None,
+    chunk_size: int = 8,
+    ordered: bool = True,
+    keywords: Any = None,
+    segmenter: str = "legacy",
+    idf: Any = None,
+    tokenizer: str = "legacy",
+) -> Iterator[Tuple[Path, SummaryResult]]:
+    return run_in_pool(
+        (Path(path) for path in paths),
+        _summarize_paths,
+        (compression_ratio,),
+        _init_worker,
+        (method, frequency_backend, keywords, segmenter, idf, tokenizer),
+        workers=workers,
+        chunk_size=chunk_size,
+        ordered=ordered,
+    )
+
+
+def summarize_files_to_dir(
+    paths: Iterable[Path],
+    method: SummaryMethod,
+    output_dir: Optional[Path] = None,
+    save_stats: bool = False,
+    frequency_backend: str = "python",
+    compression_ratio: float = 0.3,
+    workers: Optional[int] = None,
+    chunk_size: int = 8,
+    keywords: Any = None,
+    segmenter: str = "legacy",
+    idf: Any = None,
+    tokenizer: str = "legacy",
+) -> Iterator[Tuple[Path, int, float, Optional[str]]]:
+    """Пишет саммари файлов в output_dir и отдает (путь, байты, секунды, ошибка)."""
+    return run_in_pool(
+        paths,
+        _summarize_to_files,
+        (compression_ratio, output_dir, save_stats),
+        _init_worker,
+        (method, frequency_backend, keywords, segmenter, idf, tokenizer),
+        workers=workers,
+        chunk_size=chunk_size,
+        ordered=False,
+    )
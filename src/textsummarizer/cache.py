@@ -0,0 +1,235 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from .entities import (
+    ReadabilityMetrics,
+    Sentence,
+    SummaryMethod,
+    SummaryResult,
+    TextStats,
+)
+
+logger = logging.getLogger(__name__)
+
+# Меняется при изменении формата записи или алгоритмов оценки, чтобы старые
+# записи на диске не подхватывались.
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+    disk_writes: int = 0
+    memory_bytes: int = 0
+    memory_entries: int = 0
+
+
+def make_cache_key(
+    text: str,
+    method: SummaryMethod,
+    compression_ratio: float,
+    config: Optional[Dict[str, Any]] = None,
+) -> str:
+    header = json.dumps(
+        {
+            "version": CACHE_FORMAT_VERSION,
+            "method": method.value,
+            "compression_ratio": compression_ratio,
+            "config": config or {},
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    digest = hashlib.sha256(header.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def serialize_result(result: SummaryResult) -> bytes:
+    """Сжатое представление результата без исходного текста."""
+    payload = {
+        "summary_text": result.summary_text,
+        "sentences": [
+            [sent.text, sent.position, sent.importance_score, sent.features]
+            for sent in result.important_sentences
+        ],
+        "statistics": asdict(result.statistics),
+        "method_used": result.method_used.value,
+    }
+    return zlib.compress(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+
+
+def deserialize_result(data: bytes, original_text: str) -> SummaryResult:
+    payload = json.loads(zlib.decompress(data).decode("utf-8"))
+
+    stats = payload["statistics"]
+    stats["original_readability"] = ReadabilityMetrics(**stats["original_readability"])
+    stats["summary_readability"] = ReadabilityMetrics(**stats["summary_readability"])
+
+    return SummaryResult(
+        original_text=original_text,
+        summary_text=payload["summary_text"],
+        important_sentences=[
+            Sentence(
+                text=text,
+                position=position,
+                importance_score=score,
+                is_important=True,
+                features=features,
+            )
+            for text, position, score, features in payload["sentences"]
+        ],
+        statistics=TextStats(**stats),
+        method_used=SummaryMethod(payload["method_used"]),
+    )
+
+
+class SummaryCache:
+    """Кэш результатов по хэшу (текст, метод, коэффициент, настройки).
+
+    Первый уровень - LRU в памяти, ограниченный суммарным размером записей в
+    байтах. Второй, необязательный, - файлы в cache_dir; при попадании на диск
+    запись поднимается в память.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str, original_text: str) -> Optional[SummaryResult]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+
+        from_disk = data is None
+        if from_disk:
+            data = self._read_disk(key)
+
+        result = None
+        if data is not None:
+            try:
+                result = deserialize_result(data, original_text)
+            except Exception as e:
+                # Поврежденная запись - промах: она удаляется с обоих уровней,
+                # и результат пересчитывается, а не падает при каждом вызове.
+                logger.warning(f"Поврежденная запись кэша {key}: {e}")
+                self._discard(key)
+
+        with self._lock:
+            if result is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            if from_disk:
+                self.stats.disk_hits += 1
+                self._store(key, data)
+        return result
+
+    def put(self, key: str, result: SummaryResult) -> None:
+        data = serialize_result(result)
+        with self._lock:
+            self._store(key, data)
+        self._write_disk(key, data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats.memory_bytes = 0
+            self.stats.memory_entries = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _store(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.stats.memory_bytes -= len(previous)
+
+        self._entries[key] = data
+        self.stats.memory_bytes += len(data)
+
+        while self.stats.memory_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.stats.memory_bytes -= len(evicted)
+            self.stats.evictions += 1
+
+        self.stats.memory_entries = len(self._entries)
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            data = self._entries.pop(key, None)
+            if data is not None:
+                self.stats.memory_bytes -= len(data)
+                self.stats.memory_entries = len(self._entries)
+
+        if self.cache_dir is None:
+            return
+        try:
+            self._disk_path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Не удалось удалить запись кэша {key}: {e}")
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key[2:]}.bin"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Не удалось прочитать кэш {path}: {e}")
+            self._discard(key)
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if self.cache_dir is None:
+            return
+
+        path = self._disk_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Не удалось записать кэш {path}: {e}")
+            return
+
+        with self._lock:
+            self.stats.disk_writes += 1
@@ -1,15 +1,15 @@
 import click
+import glob
 import logging
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from .batch import summarize_files_to_dir, summary_output_paths, summary_stats_data
 from .core import TextSummarizer
-from .entities import SummaryMethod
+from .entities import SummaryMethod, SummaryResult
 from .utils.file_io import read_text_file, write_text_file, save_json
-from .utils.vizualization import (
-    plot_sentence_scores,
-    plot_summary_comparison,
-    plot_readability_metrics,
-)
+from .utils.keywords import load_keywords
+from .utils.text_processing import SEGMENTERS, TOKENIZERS
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -17,148 +17,266 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _shared_option(*param_decls: str, **attrs: Any) -> Callable[..., Callable]:
+    """Опция, общая для нескольких команд.
+
+    Выбор, значение по умолчанию и подсказка задаются один раз, поэтому у
+    команд они не расходятся; при применении attrs можно уточнить
+    (например, help).
+    """
+
+    def option(**overrides: Any) -> Callable:
+        return click.option(*param_decls, **{**attrs, **overrides})
+
+    return option
+
+
+method_option = _shared_option(
+    "--method",
+    "-m",
+    type=click.Choice(["frequency", "feature"]),
+    default="feature",
+    help="Метод саммаризации (frequency или feature)",
+)
+keywords_option = _shared_option(
+    "--keywords",
+    "-k",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Файл ключевых слов для feature-метода (одно слово на строку)",
+)
+segmenter_option = _shared_option(
+    "--segmenter",
+    type=click.Choice(SEGMENTERS),
+    default="legacy",
+    show_default=True,
+    help="Разбиение на предложения: legacy или fast (учитывает сокращения и "
+    "десятичные дроби)",
+)
+tokenizer_option = _shared_option(
+    "--tokenizer",
+    type=click.Choice(TOKENIZERS),
+    default="legacy",
+    show_default=True,
+    help="Токенизация: legacy или unicode (слова \\w+, тире и многоточия "
+    "разделяют слова)",
+)
+idf_option = _shared_option(
+    "--idf",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Статистика корпуса из build-idf для frequency-метода",
+)
+pattern_option = _shared_option(
+    "--pattern",
+    default="*.txt",
+    show_default=True,
+    help="Шаблон файлов внутри директорий (например, **/*.txt)",
+)
+jobs_option = _shared_option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=None,
+    help="Число процессов (по умолчанию: все ядра)",
+)
+
+
+def analysis_options(func: Callable) -> Callable:
+    """--segmenter и --tokenizer: как команда разбирает текст."""
+    return segmenter_option()(tokenizer_option()(func))
+
+
+def _summary_method(method: str) -> SummaryMethod:
+    return (
+        SummaryMethod.FREQUENCY_BASED
+        if method == "frequency"
+        else SummaryMethod.FEATURE_BASED
+    )
+
+
 @click.group()
 def cli():
     pass
 
 
+def _parse_ratios(ctx, param, value: str) -> List[float]:
+    try:
+        ratios = [float(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise click.BadParameter("ожидаются числа через запятую, например 0.1,0.2,0.3")
+    if not ratios:
+        raise click.BadParameter("нужен хотя бы один коэффициент сжатия")
+    if not all(0 < ratio <= 1 for ratio in ratios):
+        raise click.BadParameter("коэффициенты должны быть в диапазоне (0, 1]")
+    return ratios
+
+
+def _ratio_suffix(ratio: float) -> str:
+    # 0.1 -> "_10", 0.125 -> "_12.5"
+    return f"_{round(ratio * 100, 6):g}"
+
+
+def _visualize_result(result: SummaryResult, vis_dir: Path) -> None:
+    from .utils.vizualization import (
+        plot_sentence_scores,
+        plot_summary_comparison,
+        plot_readability_metrics,
+    )
+
+    vis_dir.mkdir(exist_ok=True)
+
+    sentences = [sent.text for sent in result.important_sentences]
+    scores = [sent.importance_score for sent in result.important_sentences]
+
+    if sentences and scores:
+        plot_sentence_scores(
+            sentences, scores, save_path=str(vis_dir / "sentence_scores.png")
+        )
+
+        original_stats = {
+            "total_sentences": result.statistics.original_readability.total_sentences,
+            "total_words": result.statistics.original_readability.total_words,
+            "unique_words": result.statistics.original_readability.unique_words,
+        }
+        summary_stats = {
+            "total_sentences": result.statistics.summary_readability.total_sentences,
+            "total_words": result.statistics.summary_readability.total_words,
+            "unique_words": result.statistics.summary_readability.unique_words,
+        }
+        plot_summary_comparison(
+            original_stats,
+            summary_stats,
+            save_path=str(vis_dir / "summary_comparison.png"),
+        )
+
+        readability_metrics = {
+            "Индекс Флеша": result.statistics.original_readability.flesch_score,
+            "Длина предложения": result.statistics.original_readability.avg_sentence_length,
+            "Длина слова": result.statistics.original_readability.avg_word_length,
+            "Лексическое разнообразие": result.statistics.original_readability.lexical_diversity,
+        }
+        plot_readability_metrics(
+            readability_metrics,
+            save_path=str(vis_dir / "readability_metrics.png"),
+        )
+
+    logger.info(f"Визуализации сохранены в: {vis_dir}")
+
+
+def _echo_result(result: SummaryResult) -> None:
+    click.echo(f"\n{'='*50}")
+    click.echo("Саммаризация завершена успешно!")
+    click.echo(
+        f"Оригинальный текст: {result.statistics.original_sentences_count} предложений, "
+        f"{result.statistics.original_words_count} слов"
+    )
+    click.echo(
+        f"Саммари: {result.statistics.summary_sentences_count} предложений, "
+        f"{result.statistics.summary_words_count} слов"
+    )
+    click.echo(f"Коэффициент сжатия: {result.statistics.compression_ratio:.1%}")
+    click.echo(
+        f"Индекс Флеша (оригинал): {result.statistics.original_readability.flesch_score:.1f}"
+    )
+    click.echo(
+        f"Индекс Флеша (саммари): {result.statistics.summary_readability.flesch_score:.1f}"
+    )
+    click.echo(f"{'='*50}")
+
+
 @cli.command()
 @click.option("--input", "-i", required=True, help="Входной текстовый файл")
 @click.option(
     "--output", "-o", help="Выходной файл с саммари (по умолчанию: input_summary.txt)"
 )
-@click.option(
-    "--method",
-    "-m",
-    type=click.Choice(["frequency", "feature"]),
-    default="feature",
-    help="Метод саммаризации (frequency или feature)",
-)
+@method_option()
 @click.option(
     "--ratio",
     "-r",
-    type=float,
-    default=0.3,
-    help="Коэффициент сжатия (0.0-1.0, по умолчанию 0.3)",
+    "ratios",
+    default="0.3",
+    callback=_parse_ratios,
+    help="Коэффициент сжатия (0.0-1.0, по умолчанию 0.3); несколько через "
+    "запятую: 0.1,0.2,0.3",
 )
+@keywords_option()
+@analysis_options
+@idf_option()
 @click.option("--stats", "-s", is_flag=True, help="Сохранять статистику в JSON")
 @click.option("--visualize", "-v", is_flag=True, help="Создавать визуализации")
 @click.option("--output-dir", "-d", help="Директория для выходных файлов")
-def summarize(input, output, method, ratio, stats, visualize, output_dir):
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Потоковая обработка без загрузки файла в память (для очень больших файлов)",
+)
+def summarize(
+    input,
+    output,
+    method,
+    ratios,
+    keywords,
+    segmenter,
+    tokenizer,
+    idf,
+    stats,
+    visualize,
+    output_dir,
+    stream,
+):
     try:
-        logger.info(f"Чтение файла: {input}")
-        text = read_text_file(input)
-
-        summary_method = (
-            SummaryMethod.FREQUENCY_BASED
-            if method == "frequency"
-            else SummaryMethod.FEATURE_BASED
+        summarizer = TextSummarizer(
+            method=_summary_method(method),
+            keywords=keywords,
+            segmenter=segmenter,
+            tokenizer=tokenizer,
+            idf=idf,
         )
 
-        summarizer = TextSummarizer(method=summary_method)
-
-        logger.info(f"Саммаризация методом: {method}, коэффициент сжатия: {ratio}")
-        result = summarizer.summarize(text, compression_ratio=ratio)
+        logger.info(
+            f"Саммаризация методом: {method}, "
+            f"коэффициент сжатия: {', '.join(map(str, ratios))}"
+        )
+        if stream:
+            logger.info(f"Потоковое чтение файла: {input}")
+            results = summarizer.summarize_stream_ratios(input, ratios)
+        else:
+            logger.info(f"Чтение файла: {input}")
+            text = read_text_file(input)
+            results = summarizer.summarize_ratios(text, ratios)
 
         if output_dir:
             output_path = Path(output_dir)
         else:
             output_path = Path(input).parent
 
-        if output:
-            summary_file = Path(output)
-        else:
-            input_stem = Path(input).stem
-            summary_file = output_path / f"{input_stem}_summary.txt"
-
-        write_text_file(summary_file, result.summary_text)
-        logger.info(f"Саммари сохранен в: {summary_file}")
-
-        if stats:
-            stats_file = output_path / f"{Path(input).stem}_stats.json"
-            stats_data = {
-                "original_sentences_count": result.statistics.original_sentences_count,
-                "original_words_count": result.statistics.original_words_count,
-                "summary_sentences_count": result.statistics.summary_sentences_count,
-                "summary_words_count": result.statistics.summary_words_count,
-                "compression_ratio": result.statistics.compression_ratio,
-                "reading_time_minutes": result.statistics.reading_time_minutes,
-                "method_used": result.method_used.value,
-                "original_readability": {
-                    "flesch_score": result.statistics.original_readability.flesch_score,
-                    "avg_sentence_length": result.statistics.original_readability.avg_sentence_length,
-                    "avg_word_length": result.statistics.original_readability.avg_word_length,
-                    "lexical_diversity": result.statistics.original_readability.lexical_diversity,
-                },
-                "summary_readability": {
-                    "flesch_score": result.statistics.summary_readability.flesch_score,
-                    "avg_sentence_length": result.statistics.summary_readability.avg_sentence_length,
-                    "avg_word_length": result.statistics.summary_readability.avg_word_length,
-                    "lexical_diversity": result.statistics.summary_readability.lexical_diversity,
-                },
-            }
-            save_json(stats_file, stats_data)
-            logger.info(f"Статистика сохранена в: {stats_file}")
-
-        if visualize:
-            vis_dir = output_path / "visualizations"
-            vis_dir.mkdir(exist_ok=True)
-
-            sentences = [sent.text for sent in result.important_sentences]
-            scores = [sent.importance_score for sent in result.important_sentences]
-
-            if sentences and scores:
-                plot_sentence_scores(
-                    sentences, scores, save_path=str(vis_dir / "sentence_scores.png")
-                )
+        input_stem = Path(input).stem
+        for ratio, result in zip(ratios, results):
+            # С одним коэффициентом имена файлов прежние.
+            suffix = _ratio_suffix(ratio) if len(ratios) > 1 else ""
 
-                original_stats = {
-                    "total_sentences": result.statistics.original_readability.total_sentences,
-                    "total_words": result.statistics.original_readability.total_words,
-                    "unique_words": result.statistics.original_readability.unique_words,
-                }
-                summary_stats = {
-                    "total_sentences": result.statistics.summary_readability.total_sentences,
-                    "total_words": result.statistics.summary_readability.total_words,
-                    "unique_words": result.statistics.summary_readability.unique_words,
-                }
-                plot_summary_comparison(
-                    original_stats,
-                    summary_stats,
-                    save_path=str(vis_dir / "summary_comparison.png"),
+            if output:
+                summary_file = Path(output)
+                summary_file = summary_file.with_name(
+                    f"{summary_file.stem}{suffix}{summary_file.suffix}"
                 )
+            else:
+                summary_file = output_path / f"{input_stem}_summary{suffix}.txt"
 
-                readability_metrics = {
-                    "Индекс Флеша": result.statistics.original_readability.flesch_score,
-                    "Длина предложения": result.statistics.original_readability.avg_sentence_length,
-                    "Длина слова": result.statistics.original_readability.avg_word_length,
-                    "Лексическое разнообразие": result.statistics.original_readability.lexical_diversity,
-                }
-                plot_readability_metrics(
-                    readability_metrics,
-                    save_path=str(vis_dir / "readability_metrics.png"),
-                )
+            write_text_file(summary_file, result.summary_text)
+            logger.info(f"Саммари сохранен в: {summary_file}")
 
-            logger.info(f"Визуализации сохранены в: {vis_dir}")
+            if stats:
+                stats_file = output_path / f"{input_stem}_stats{suffix}.json"
+                stats_data = summary_stats_data(result)
+                save_json(stats_file, stats_data)
+                logger.info(f"Статистика сохранена в: {stats_file}")
 
-        click.echo(f"\n{'='*50}")
-        click.echo("Саммаризация завершена успешно!")
-        click.echo(
-            f"Оригинальный текст: {result.statistics.original_sentences_count} предложений, "
-            f"{result.statistics.original_words_count} слов"
-        )
-        click.echo(
-            f"Саммари: {result.statistics.summary_sentences_count} предложений, "
-            f"{result.statistics.summary_words_count} слов"
-        )
-        click.echo(f"Коэффициент сжатия: {result.statistics.compression_ratio:.1%}")
-        click.echo(
-            f"Индекс Флеша (оригинал): {result.statistics.original_readability.flesch_score:.1f}"
-        )
-        click.echo(
-            f"Индекс Флеша (саммари): {result.statistics.summary_readability.flesch_score:.1f}"
-        )
-        click.echo(f"{'='*50}")
+            if visualize:
+                _visualize_result(result, output_path / f"visualizations{suffix}")
+
+            if len(ratios) > 1:
+                click.echo(f"\nКоэффициент {ratio}:")
+            _echo_result(result)
 
     except Exception as e:
         logger.error(f"Ошибка при выполнении саммаризации: {e}")
@@ -168,7 +286,8 @@ def summarize(input, output, method, ratio, stats, visualize, output_dir):
 @cli.command()
 @click.option("--text", "-t", help="Текст для анализа")
 @click.option("--file", "-f", help="Файл с текстом для анализа")
-def analyze(text, file):
+@analysis_options
+def analyze(text, file, segmenter, tokenizer):
     try:
         if text:
             input_text = text
@@ -177,13 +296,14 @@ def analyze(text, file):
         else:
             raise click.BadParameter("Необходимо указать --text или --file")
 
-        from .utils.text_processing import split_into_sentences
+        from .utils.text_processing import analyze_text
 
-        sentences = split_into_sentences(input_text)
+        document = analyze_text(input_text, segmenter, tokenizer)
+        sentences = [sentence.text for sentence in document.sentences]
 
-        from .utils.text_processing import calculate_readability_metrics
+        from .utils.text_processing import calculate_document_readability
 
-        metrics = calculate_readability_metrics(input_text)
+        metrics = calculate_document_readability(document.sentences)
 
         click.echo(f"\n{'='*50}")
         click.echo("Анализ текста:")
@@ -212,6 +332,303 @@ def analyze(text, file):
         raise click.ClickException(f"Ошибка: {e}")
 
 
+def _expand_inputs(
+    inputs: Sequence[str], pattern: str, missing: Optional[List[Path]] = None
+) -> Iterator[Path]:
+    """Файлы из директорий, шаблонов и явных путей без повторов.
+
+    Явно указанные пути, которых нет или которые не являются файлами,
+    логируются и добавляются в missing.
+    """
+    seen = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = sorted(path.glob(pattern))
+        elif glob.has_magic(item):
+            candidates = sorted(Path(p) for p in glob.glob(item, recursive=True))
+        elif not path.is_file():
+            logger.warning(f"Файл не найден: {item}")
+            if missing is not None:
+                missing.append(path)
+            continue
+        else:
+            candidates = [path]
+
+        for candidate in candidates:
+            if candidate.is_file() and candidate not in seen:
+                seen.add(candidate)
+                yield candidate
+
+
+def _is_up_to_date(path: Path, output_dir: Optional[Path], stats: bool) -> bool:
+    outputs = summary_output_paths(path, output_dir)
+    required = outputs if stats else outputs[:1]
+    try:
+        input_mtime = path.stat().st_mtime
+    except OSError:
+        # Файл пропал после раскрытия шаблонов: ошибку сообщит обработка.
+        return False
+    return all(out.exists() and out.stat().st_mtime >= input_mtime for out in required)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1, required=True)
+@pattern_option()
+@click.option("--output-dir", "-d", help="Директория для выходных файлов")
+@method_option()
+@click.option(
+    "--ratio",
+    "-r",
+    type=float,
+    default=0.3,
+    help="Коэффициент сжатия (0.0-1.0, по умолчанию 0.3)",
+)
+@click.option("--stats", "-s", is_flag=True, help="Сохранять статистику в JSON")
+@jobs_option()
+@keywords_option()
+@analysis_options
+@idf_option()
+@click.option("--force", is_flag=True, help="Пересчитывать даже актуальные файлы")
+@click.option("--verbose", is_flag=True, help="Логировать каждый файл")
+def batch(
+    inputs,
+    pattern,
+    output_dir,
+    method,
+    ratio,
+    stats,
+    jobs,
+    keywords,
+    segmenter,
+    tokenizer,
+    idf,
+    force,
+    verbose,
+):
+    """Саммаризирует директории, шаблоны или списки файлов в пуле процессов."""
+    if not 0 < ratio <= 1:
+        raise click.BadParameter("--ratio должен быть в диапазоне (0, 1]")
+
+    if not verbose:
+        logging.getLogger(__package__).setLevel(logging.WARNING)
+
+    output_path = Path(output_dir) if output_dir else None
+    skipped = 0
+    pending = []
+    missing: List[Path] = []
+    # Имя результата строится по имени входа, поэтому одноименные файлы из
+    # разных директорий записались бы поверх друг друга: обрабатывается
+    # первый, остальные считаются ошибками.
+    claimed: Dict[Path, Path] = {}
+    collisions = 0
+    for path in _expand_inputs(inputs, pattern, missing):
+        summary_file = summary_output_paths(path, output_path)[0].resolve()
+        owner = claimed.setdefault(summary_file, path)
+        if owner != path:
+            collisions += 1
+            logger.error(
+                f"Ошибка при обработке {path}: {summary_file} уже занят "
+                f"результатом {owner}"
+            )
+        elif not force and _is_up_to_date(path, output_path, stats):
+            skipped += 1
+        else:
+            pending.append(path)
+
+    started = time.perf_counter()
+    latencies = []
+    total_bytes = 0
+    failed = len(missing) + collisions
+
+    for path, size, seconds, error in summarize_files_to_dir(
+        pending,
+        _summary_method(method),
+        output_dir=output_path,
+        save_stats=stats,
+        compression_ratio=ratio,
+        workers=jobs,
+        keywords=load_keywords(keywords) if keywords else None,
+        segmenter=segmenter,
+        tokenizer=tokenizer,
+        # Путь, а не загруженный файл: каждый процесс отобразит его сам.
+        idf=idf,
+    ):
+        if error is not None:
+            failed += 1
+            logger.error(f"Ошибка при обработке {path}: {error}")
+            continue
+        latencies.append(seconds)
+        total_bytes += size
+
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    processed = len(latencies)
+
+    click.echo(f"\n{'='*50}")
+    click.echo(
+        f"Обработано: {processed}, пропущено (актуальны): {skipped}, ошибок: {failed}"
+    )
+    click.echo(f"Время: {elapsed:.2f} с")
+    if elapsed > 0:
+        click.echo(
+            f"Пропускная способность: {processed / elapsed:.1f} док/с, "
+            f"{total_bytes / elapsed / 1024 / 1024:.2f} МБ/с"
+        )
+    click.echo(
+        f"Задержка на документ: p50 {_percentile(latencies, 0.5) * 1000:.1f} мс, "
+        f"p95 {_percentile(latencies, 0.95) * 1000:.1f} мс"
+    )
+    click.echo(f"{'='*50}")
+
+    if failed:
+        raise click.ClickException(f"Не удалось обработать файлов: {failed}")
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Адрес")
+@click.option("--port", "-p", type=int, default=8080, show_default=True, help="Порт")
+@method_option()
+@click.option(
+    "--workers",
+    "-j",
+    type=int,
+    default=None,
+    help="Число процессов (по умолчанию: все ядра)",
+)
+@click.option(
+    "--queue-size",
+    type=int,
+    default=64,
+    show_default=True,
+    help="Максимум ожидающих запросов; сверх него сервер отвечает 503",
+)
+@click.option(
+    "--timeout",
+    type=float,
+    default=30.0,
+    show_default=True,
+    help="Таймаут обработки запроса, с",
+)
+@click.option(
+    "--keepalive",
+    type=float,
+    default=5.0,
+    show_default=True,
+    help="Сколько секунд держать простаивающее соединение",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Максимум текстов в пачке /summarize (1 - без пакетирования)",
+)
+@click.option(
+    "--batch-delay",
+    type=float,
+    default=5.0,
+    show_default=True,
+    help="Сколько миллисекунд ждать наполнения пачки",
+)
+@keywords_option()
+@analysis_options
+@idf_option()
+@click.option(
+    "--learn-idf",
+    type=click.Path(dir_okay=False),
+    help="Пополнять статистику корпуса текстами запросов и сохранять ее в файл",
+)
+@click.option(
+    "--idf-interval",
+    type=float,
+    default=60.0,
+    show_default=True,
+    help="Как часто сохранять снимок --learn-idf, в секундах",
+)
+def serve(
+    host,
+    port,
+    method,
+    workers,
+    queue_size,
+    timeout,
+    keepalive,
+    batch_size,
+    batch_delay,
+    keywords,
+    segmenter,
+    tokenizer,
+    idf,
+    learn_idf,
+    idf_interval,
+):
+    """HTTP-сервис: POST /summarize, POST /analyze, GET /health."""
+    from .server import run_server
+
+    run_server(
+        host=host,
+        port=port,
+        method=_summary_method(method),
+        workers=workers,
+        queue_size=queue_size,
+        request_timeout=timeout,
+        keepalive_timeout=keepalive,
+        max_batch_size=batch_size,
+        max_batch_delay=batch_delay / 1000,
+        keywords=keywords,
+        segmenter=segmenter,
+        tokenizer=tokenizer,
+        idf=idf,
+        learn_idf=learn_idf,
+        idf_snapshot_interval=idf_interval,
+    )
+
+
+@cli.command("build-idf")
+@click.argument("inputs", nargs=-1, required=True)
+@pattern_option()
+@click.option("--output", "-o", required=True, help="Файл статистики корпуса")
+@jobs_option()
+@tokenizer_option(help="Токенизатор, которым потом будут разбираться тексты")
+def build_idf(inputs, pattern, output, jobs, tokenizer):
+    """Строит документную частоту терминов корпуса для frequency-метода."""
+    from .idf import CorpusStatistics
+
+    missing: List[Path] = []
+    failed: List[Tuple[Path, str]] = []
+    try:
+        started = time.perf_counter()
+        statistics = CorpusStatistics.build_from_files(
+            _expand_inputs(inputs, pattern, missing),
+            workers=jobs,
+            tokenizer=tokenizer,
+            failed=failed,
+        )
+        if not statistics.num_documents:
+            raise click.ClickException("Не найдено ни одного файла корпуса")
+        statistics.save(output)
+    except OSError as e:
+        logger.error(f"Ошибка при построении статистики корпуса: {e}")
+        raise click.ClickException(f"Ошибка: {e}")
+
+    click.echo(f"\n{'='*50}")
+    click.echo(f"Документов: {statistics.num_documents}")
+    if missing or failed:
+        click.echo(f"Пропущено файлов с ошибками: {len(missing) + len(failed)}")
+    click.echo(f"Терминов: {len(statistics)}")
+    click.echo(f"Размер файла: {Path(output).stat().st_size / 1024:.1f} КБ")
+    click.echo(f"Время: {time.perf_counter() - started:.2f} с")
+    click.echo(f"{'='*50}")
+
+
 @cli.command()
 def version():
     """Показывает версию пакета."""
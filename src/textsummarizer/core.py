@@ -1,43 +1,130 @@
-from typing import List
-from .entities import SummaryMethod, SummaryResult
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from . import batch
+from .cache import SummaryCache, make_cache_key
+from .entities import AnalyzedDocument, Sentence, SummaryMethod, SummaryResult
+from .idf import IdfSource, load_idf
 from .methods import FrequencyBasedSummarizer, FeatureBasedSummarizer
+from .profiling import NULL_TIMER, StageTimer
 from .statistics import StatisticsCalculator
-from .utils.text_processing import split_into_sentences
-from .utils.file_io import save_json
+from .utils.text_processing import (
+    analyze_sentences,
+    analyze_text,
+    split_into_sentences,
+    iter_analyzed_sentences,
+    check_segmenter,
+    check_tokenizer,
+    ReadabilityAccumulator,
+)
+from .utils.keywords import KeywordsSource, load_keywords
+from .utils.file_io import (
+    open_document,
+    read_text_file,
+    read_text_chunks,
+    save_json,
+)
 from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class TextSummarizer:
-    def __init__(self, method: SummaryMethod = SummaryMethod.FEATURE_BASED):
+    def __init__(
+        self,
+        method: SummaryMethod = SummaryMethod.FEATURE_BASED,
+        frequency_backend: str = "python",
+        cache: Optional[SummaryCache] = None,
+        timer: Optional[StageTimer] = None,
+        keywords: Optional[KeywordsSource] = None,
+        segmenter: str = "legacy",
+        idf: Optional[IdfSource] = None,
+        tokenizer: str = "legacy",
+    ):
+        check_segmenter(segmenter)
+        check_tokenizer(tokenizer)
+
         self.method = method
+        self.frequency_backend = frequency_backend
+        self.cache = cache
+        self.segmenter = segmenter
+        self.tokenizer = tokenizer
+        # Загружаем один раз, чтобы в рабочие процессы уходил готовый набор.
+        self.keywords = load_keywords(keywords) if keywords is not None else None
+        # Файл статистики корпуса отображается один раз на процесс.
+        self.idf = load_idf(idf)
+        if self.idf is not None and self.idf.current().tokenizer != tokenizer:
+            logger.warning(
+                f"Статистика корпуса построена токенизатором "
+                f"{self.idf.current().tokenizer}, а тексты разбираются {tokenizer}"
+            )
 
         if method == SummaryMethod.FREQUENCY_BASED:
-            self.summarizer = FrequencyBasedSummarizer()
+            self.summarizer = FrequencyBasedSummarizer(
+                backend=frequency_backend, idf=self.idf
+            )
         else:  # FEATURE_BASED
-            self.summarizer = FeatureBasedSummarizer()
+            self.summarizer = FeatureBasedSummarizer(keywords=self.keywords)
 
         self.stats_calculator = StatisticsCalculator()
+        self.timer = timer if timer is not None else NULL_TIMER
+        if timer is not None:
+            self.summarizer.timer = timer
 
     def summarize(self, text: str, compression_ratio: float = 0.3) -> SummaryResult:
-        if not 0 < compression_ratio <= 1:
-            raise ValueError("compression_ratio должен быть в диапазоне (0, 1]")
+        self._check_compression_ratio(compression_ratio)
+
+        if not self.timer.enabled:
+            return self._summarize_cached(text, compression_ratio)
 
-        sentences = split_into_sentences(text)
+        self.timer.start_document()
+        result = self._summarize_cached(text, compression_ratio)
+        result.timings = dict(self.timer.last)
+        return result
 
-        if not sentences:
-            return SummaryResult(
-                original_text=text,
-                summary_text="",
-                important_sentences=[],
-                statistics=self.stats_calculator.calculate_stats(text, ""),
-                method_used=self.method,
+    def _summarize_cached(self, text: str, compression_ratio: float) -> SummaryResult:
+        if self.cache is None:
+            return self._summarize(text, compression_ratio)
+
+        with self.timer.stage("cache"):
+            key = make_cache_key(
+                text, self.method, compression_ratio, self._cache_config()
+            )
+            result = self.cache.get(key, text)
+        if result is None:
+            result = self._summarize(text, compression_ratio)
+            with self.timer.stage("cache"):
+                self.cache.put(key, result)
+        return result
+
+    def _summarize(self, text: str, compression_ratio: float) -> SummaryResult:
+        with self.timer.stage("split"):
+            sentences = split_into_sentences(text, self.segmenter)
+        with self.timer.stage("analyze"):
+            document = analyze_sentences(
+                sentences, text=text or "", tokenizer=self.tokenizer
             )
 
-        important_sentences = self.summarizer.summarize(sentences, compression_ratio)
+        if not document.sentences:
+            return self._build_result(text, document, [])
 
+        important_sentences = self.summarizer.summarize_document(
+            document, compression_ratio
+        )
+
+        return self._build_result(text, document, important_sentences)
+
+    def _build_result(
+        self,
+        text: str,
+        document: AnalyzedDocument,
+        important_sentences: List[Sentence],
+    ) -> SummaryResult:
         summary_text = " ".join(sent.text for sent in important_sentences)
 
-        statistics = self.stats_calculator.calculate_stats(text, summary_text)
+        with self.timer.stage("statistics"):
+            statistics = self.stats_calculator.calculate_summary_stats(
+                document, important_sentences
+            )
 
         return SummaryResult(
             original_text=text,
@@ -47,7 +134,287 @@ class TextSummarizer:
             method_used=self.method,
         )
 
+    def summarize_batch(
+        self,
+        texts: Sequence[str],
+        compression_ratios: Union[float, Sequence[float]] = 0.3,
+    ) -> List[SummaryResult]:
+        """Саммаризирует пачку текстов с одной векторной оценкой предложений.
+
+        Выгодно для множества коротких текстов, где накладные расходы на вызов
+        сравнимы с самой оценкой. compression_ratios - один коэффициент для
+        всех текстов или по коэффициенту на текст. Результаты совпадают с
+        отдельными вызовами summarize.
+        """
+        if isinstance(compression_ratios, (int, float)):
+            ratios = [float(compression_ratios)] * len(texts)
+        else:
+            ratios = list(compression_ratios)
+            if len(ratios) != len(texts):
+                raise ValueError(
+                    "Число коэффициентов сжатия не совпадает с числом текстов"
+                )
+        for ratio in ratios:
+            self._check_compression_ratio(ratio)
+
+        results: List[Optional[SummaryResult]] = [None] * len(texts)
+        keys: List[Optional[str]] = [None] * len(texts)
+        if self.cache is not None:
+            config = self._cache_config()
+            for i, (text, ratio) in enumerate(zip(texts, ratios)):
+                keys[i] = make_cache_key(text, self.method, ratio, config)
+                results[i] = self.cache.get(keys[i], text)
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        documents = [
+            analyze_text(texts[i], self.segmenter, self.tokenizer) for i in missing
+        ]
+        selected = self.summarizer.summarize_documents(
+            documents, [ratios[i] for i in missing]
+        )
+        for i, document, important_sentences in zip(missing, documents, selected):
+            results[i] = self._build_result(texts[i], document, important_sentences)
+            if self.cache is not None:
+                self.cache.put(keys[i], results[i])
+
+        return results
+
+    def summarize_ratios(
+        self, text: str, ratios: Sequence[float] = (0.1, 0.2, 0.3, 0.5)
+    ) -> List[SummaryResult]:
+        """Саммари для нескольких коэффициентов сжатия за одну оценку.
+
+        Текст разбирается и оценивается один раз; предложения добавляются в
+        порядке убывания оценки, и статистика каждого следующего саммари
+        дополняет предыдущую. Результаты идут в порядке ratios и совпадают
+        с отдельными вызовами summarize.
+        """
+        if not ratios:
+            raise ValueError("Нужен хотя бы один коэффициент сжатия")
+        for ratio in ratios:
+            self._check_compression_ratio(ratio)
+
+        results: Dict[float, SummaryResult] = {}
+        keys: Dict[float, str] = {}
+        if self.cache is not None:
+            config = self._cache_config()
+            for ratio in ratios:
+                keys[ratio] = make_cache_key(text, self.method, ratio, config)
+                result = self.cache.get(keys[ratio], text)
+                if result is not None:
+                    results[ratio] = result
+
+        missing = sorted(set(ratios) - results.keys())
+        if missing:
+            computed = self._summarize_ratios(text, missing)
+            for ratio, result in zip(missing, computed):
+                results[ratio] = result
+                if self.cache is not None:
+                    self.cache.put(keys[ratio], result)
+
+        return [results[ratio] for ratio in ratios]
+
+    def _summarize_ratios(
+        self, text: str, ratios: Sequence[float]
+    ) -> List[SummaryResult]:
+        # ratios отсортированы по возрастанию.
+        document = analyze_text(text, self.segmenter, self.tokenizer)
+
+        if not document.sentences:
+            return [self._summarize(text, ratio) for ratio in ratios]
+
+        ranking, scored = self.summarizer.rank_document(document, ratios[-1])
+        total = len(document.sentences)
+        sizes = [self.summarizer.num_to_select(total, ratio) for ratio in ratios]
+        all_stats = self.stats_calculator.iter_ranked_stats(document, ranking, sizes)
+
+        results = []
+        for size, statistics in zip(sizes, all_stats):
+            important_sentences = [
+                scored.sentence(idx) for idx in sorted(ranking[:size])
+            ]
+            results.append(
+                SummaryResult(
+                    original_text=text,
+                    summary_text=" ".join(sent.text for sent in important_sentences),
+                    important_sentences=important_sentences,
+                    statistics=statistics,
+                    method_used=self.method,
+                )
+            )
+        return results
+
+    def summarize_stream(
+        self,
+        filepath: Union[str, Path],
+        compression_ratio: float = 0.3,
+        chunk_size: int = 1 << 20,
+        encoding: str = "utf-8",
+        use_mmap: bool = False,
+    ) -> SummaryResult:
+        """Саммаризирует файл в два прохода, не загружая его целиком.
+
+        Память: O(k + словарь). Оригинальный текст в результате не хранится,
+        поэтому original_text пустой. С use_mmap=True файл отображается в
+        память на время вызова: тексты отобранных предложений декодируются
+        до закрытия отображения, а span остаются байтовыми смещениями в
+        файле. Этот режим разбивает текст только способом legacy и требует
+        совместимой с ASCII кодировки.
+        """
+        return self.summarize_stream_ratios(
+            filepath,
+            [compression_ratio],
+            chunk_size=chunk_size,
+            encoding=encoding,
+            use_mmap=use_mmap,
+        )[0]
+
+    def summarize_stream_ratios(
+        self,
+        filepath: Union[str, Path],
+        ratios: Sequence[float] = (0.1, 0.2, 0.3, 0.5),
+        chunk_size: int = 1 << 20,
+        encoding: str = "utf-8",
+        use_mmap: bool = False,
+    ) -> List[SummaryResult]:
+        """summarize_stream для нескольких коэффициентов за одно чтение файла.
+
+        Предложения ранжируются один раз для наибольшего коэффициента, а
+        саммари остальных - начала этого ранжирования, как в
+        summarize_ratios. Результаты идут в порядке ratios.
+        """
+        if not ratios:
+            raise ValueError("Нужен хотя бы один коэффициент сжатия")
+        for ratio in ratios:
+            self._check_compression_ratio(ratio)
+        if use_mmap and self.segmenter != "legacy":
+            raise ValueError("use_mmap поддерживает только segmenter='legacy'")
+
+        original = ReadabilityAccumulator()
+        if use_mmap:
+            with open_document(filepath, encoding=encoding) as source:
+                total, ranked = self.summarizer.rank_stream(
+                    lambda: source.analyzed_sentences(self.tokenizer),
+                    max(ratios),
+                    observer=original.add,
+                    source=source,
+                )
+                for sentence in ranked:
+                    sentence.text = sentence.text
+                    sentence.source = None
+        else:
+            total, ranked = self.summarizer.rank_stream(
+                lambda: iter_analyzed_sentences(
+                    read_text_chunks(
+                        filepath, chunk_size=chunk_size, encoding=encoding
+                    ),
+                    self.segmenter,
+                    self.tokenizer,
+                ),
+                max(ratios),
+                observer=original.add,
+            )
+
+        results = []
+        for ratio in ratios:
+            size = self.summarizer.num_to_select(total, ratio) if total else 0
+            important_sentences = sorted(ranked[:size], key=lambda s: s.position)
+            results.append(
+                SummaryResult(
+                    original_text="",
+                    summary_text=" ".join(sent.text for sent in important_sentences),
+                    important_sentences=important_sentences,
+                    statistics=self.stats_calculator.calculate_accumulated_stats(
+                        original, important_sentences
+                    ),
+                    method_used=self.method,
+                )
+            )
+        return results
+
+    def summarize_many(
+        self,
+        texts: Iterable[str],
+        compression_ratio: float = 0.3,
+        workers: Optional[int] = None,
+        chunk_size: int = 32,
+        ordered: bool = True,
+    ) -> Iterator[SummaryResult]:
+        """Саммаризирует поток текстов в пуле процессов.
+
+        workers=1 выполняет все в текущем процессе. При ordered=False
+        результаты отдаются по мере готовности, а не в порядке входа.
+        """
+        self._check_compression_ratio(compression_ratio)
+
+        if workers == 1:
+            return (self.summarize(text, compression_ratio) for text in texts)
+
+        return batch.summarize_many(
+            texts,
+            self.method,
+            frequency_backend=self.frequency_backend,
+            compression_ratio=compression_ratio,
+            workers=workers,
+            chunk_size=chunk_size,
+            ordered=ordered,
+            keywords=self.keywords,
+            segmenter=self.segmenter,
+            idf=self.idf,
+            tokenizer=self.tokenizer,
+        )
+
+    def summarize_files(
+        self,
+        paths: Iterable[Union[str, Path]],
+        compression_ratio: float = 0.3,
+        workers: Optional[int] = None,
+        chunk_size: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[Path, SummaryResult]]:
+        """Как summarize_many, но файлы читаются внутри рабочих процессов."""
+        self._check_compression_ratio(compression_ratio)
+
+        if workers == 1:
+            return (
+                (Path(path), self.summarize(read_text_file(path), compression_ratio))
+                for path in paths
+            )
+
+        return batch.summarize_files(
+            paths,
+            self.method,
+            frequency_backend=self.frequency_backend,
+            compression_ratio=compression_ratio,
+            workers=workers,
+            chunk_size=chunk_size,
+            ordered=ordered,
+            keywords=self.keywords,
+            segmenter=self.segmenter,
+            idf=self.idf,
+            tokenizer=self.tokenizer,
+        )
+
+    def _cache_config(self) -> Dict[str, Any]:
+        config = self.summarizer.cache_config()
+        # Ключи кэша для разбиения по умолчанию остаются прежними.
+        if self.segmenter != "legacy":
+            config = {**config, "segmenter": self.segmenter}
+        if self.tokenizer != "legacy":
+            config = {**config, "tokenizer": self.tokenizer}
+        return config
+
+    def _check_compression_ratio(self, compression_ratio: float) -> None:
+        if not 0 < compression_ratio <= 1:
+            raise ValueError("compression_ratio должен быть в диапазоне (0, 1]")
+
     def save_result(self, result: SummaryResult, output_dir: str) -> None:
+        with self.timer.stage("save"):
+            self._save_result(result, output_dir)
+        if self.timer.enabled:
+            result.timings["save"] = self.timer.last["save"]
+
+    def _save_result(self, result: SummaryResult, output_dir: str) -> None:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
@@ -84,8 +451,6 @@ class TextSummarizer:
         }
 
         stats_file = output_path / "statistics.json"
-        from .utils.file_io import save_json
-
         save_json(stats_file, stats_dict)
 
         sentences_info = []
@@ -1,7 +1,12 @@
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from dataclasses import InitVar, dataclass, field, fields
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 from enum import Enum
 
+if TYPE_CHECKING:
+    import numpy as np
+    from .utils.text_processing import ReadabilityAccumulator
+    from .utils.vocabulary import EncodedDocument
+
 
 class SummaryMethod(Enum):
     FREQUENCY_BASED = "frequency"
@@ -9,16 +14,188 @@ class SummaryMethod(Enum):
 
 
 @dataclass
-class Sentence:
+class AnalyzedSentence:
+    text: str
+    position: int
+    tokens: List[str]
+    syllable_count: int = 0
+    char_count: int = 0
+    span: Optional[Tuple[int, int]] = None
+
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
+
+
+@dataclass
+class AnalyzedDocument:
     text: str
+    sentences: List[AnalyzedSentence]
+    readability: Optional["ReadabilityAccumulator"] = field(
+        default=None, repr=False, compare=False
+    )
+    encoded: Optional["EncodedDocument"] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def sentence_texts(self) -> List[str]:
+        return [sent.text for sent in self.sentences]
+
+    @property
+    def words(self) -> List[str]:
+        return [token for sent in self.sentences for token in sent.tokens]
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+
+@dataclass(eq=True)
+class Sentence:
+    """Отобранное предложение.
+
+    Dataclass со слотами: без __dict__ на экземпляр (см. _slotted). Предложение,
+    созданное через ScoredSentences.sentence, хранит ссылку на строку матрицы
+    признаков и строит словарь features только при первом обращении.
+    """
+
+    text: Optional[str]
     position: int
     features: Optional[Dict[str, float]] = None
     importance_score: float = 0.0
     is_important: bool = False
+    analysis: Optional[AnalyzedSentence] = field(
+        default=None, repr=False, compare=False
+    )
+    span: Optional[Tuple[int, int]] = field(default=None, repr=False, compare=False)
+    source: Optional[Any] = field(default=None, repr=False, compare=False)
+    scored: InitVar[Optional["ScoredSentences"]] = None
+    row: InitVar[int] = 0
+
+    def __post_init__(self, scored: Optional["ScoredSentences"], row: int) -> None:
+        self._scored = scored if self._features is None else None
+        self._row = row
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # В другой процесс уходит готовый словарь признаков, а не ссылка на
+        # оценки всего документа.
+        self._features = self.features
+        self._scored = None
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+
+def _get_sentence_text(self: Sentence) -> Optional[str]:
+    # Предложение со span и source (например, MappedDocument) не хранит строку:
+    # текст декодируется из источника при каждом обращении.
+    if self._text is None and self.source is not None and self.span is not None:
+        return self.source.decode(*self.span)
+    return self._text
+
+
+def _set_sentence_text(self: Sentence, value: Optional[str]) -> None:
+    self._text = value
+
+
+def _get_sentence_features(self: Sentence) -> Dict[str, float]:
+    if self._features is None:
+        if self._scored is not None:
+            self._features = self._scored.feature_dict(self._row)
+            self._scored = None
+        else:
+            self._features = {}
+    return self._features
+
+
+def _set_sentence_features(self: Sentence, value: Optional[Dict[str, float]]) -> None:
+    self._features = value
+    self._scored = None
+
+
+def _slotted(cls: type, slots: Tuple[str, ...], **properties: property) -> type:
+    # dataclass(slots=True) есть только с Python 3.10, поэтому класс
+    # пересоздается со __slots__ так же, как это делает он. Значения по
+    # умолчанию уже вшиты в __init__, и атрибуты класса с именами полей
+    # убираются, иначе они конфликтуют со слотами; InitVar остаются - их
+    # значения по умолчанию читает dataclasses.replace. Свойства задаются
+    # после @dataclass, иначе они стали бы значениями по умолчанию.
+    field_names = {f.name for f in fields(cls)}
+    namespace = {
+        name: value
+        for name, value in cls.__dict__.items()
+        if name not in field_names and name not in ("__dict__", "__weakref__")
+    }
+    namespace.update(properties, __slots__=slots)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+Sentence = _slotted(  # type: ignore[misc]
+    Sentence,
+    (
+        "_text",
+        "position",
+        "_features",
+        "importance_score",
+        "is_important",
+        "analysis",
+        "span",
+        "source",
+        "_scored",
+        "_row",
+    ),
+    text=property(_get_sentence_text, _set_sentence_text),
+    features=property(_get_sentence_features, _set_sentence_features),
+)
+
+
+class ScoredSentences:
+    """Оценки всех предложений документа по столбцам.
+
+    Вместо словаря признаков на каждое предложение - параллельные массивы
+    позиций и оценок и матрица признаков N x len(feature_names); имена
+    признаков общие для всех строк. Sentence создаются только для
+    отобранных предложений.
+    """
+
+    __slots__ = ("document", "positions", "scores", "features", "feature_names")
+
+    def __init__(
+        self,
+        document: AnalyzedDocument,
+        scores: Union[Sequence[float], "np.ndarray"],
+        features: Optional["np.ndarray"] = None,
+        feature_names: Sequence[str] = (),
+    ):
+        import numpy as np
+
+        self.document = document
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.positions = np.arange(len(self.scores))
+        self.features = (
+            features if features is not None else np.empty((len(self.scores), 0))
+        )
+        self.feature_names = tuple(feature_names)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def feature_dict(self, row: int) -> Dict[str, float]:
+        return dict(zip(self.feature_names, self.features[row].tolist()))
 
-    def __post_init__(self):
-        if self.features is None:
-            self.features = {}
+    def sentence(self, row: int) -> Sentence:
+        analyzed = self.document.sentences[row]
+        return Sentence(
+            text=analyzed.text,
+            position=int(self.positions[row]),
+            importance_score=float(self.scores[row]),
+            is_important=True,
+            analysis=analyzed,
+            scored=self,
+            row=row,
+        )
 
 
 @dataclass
@@ -51,3 +228,5 @@ class SummaryResult:
     important_sentences: List[Sentence]
     statistics: TextStats
     method_used: SummaryMethod
+    # Время этапов в секундах; заполняется, только если включен StageTimer.
+    timings: Dict[str, float] = field(default_factory=dict, compare=False)
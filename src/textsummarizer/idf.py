@@ -0,0 +1,545 @@
+import hashlib
+import heapq
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import Counter
+from operator import itemgetter
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from .utils.file_io import read_text_file
+from .utils.text_processing import TOKENIZERS, check_tokenizer, tokenize_text
+
+logger = logging.getLogger(__name__)
+
+# Формат файла (little-endian):
+#   заголовок: сигнатура, версия, токенизатор (номер в TOKENIZERS), число
+#              документов, число терминов, размер словаря в байтах;
+#   uint32[число терминов + 1] - смещения терминов в словаре;
+#   uint32[число терминов]     - документная частота термина;
+#   словарь                    - термины в UTF-8 по возрастанию через "\n".
+# Таблицы читаются прямо из отображенного в память файла (на big-endian
+# платформах - копируются с перестановкой байт).
+_MAGIC = b"TSIDF\0\0\0"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQ")
+
+# Источник IDF для оценки: current() отдает согласованный неизменяемый снимок.
+IdfProvider = Union["CorpusStatistics", "OnlineCorpusStatistics", "CorpusSnapshotFile"]
+IdfSource = Union[IdfProvider, str, Path]
+
+
+def document_terms(text: str, tokenizer: str = "legacy") -> Iterable[str]:
+    """Разные термины документа, в той же нормализации, что и токены предложений."""
+    return set(tokenize_text(text, tokenizer))
+
+
+class CorpusStatistics:
+    """Документная частота терминов по корпусу для IDF.
+
+    Строится один раз (CorpusStatistics.build или команда build-idf) и
+    сохраняется в компактный двоичный файл. При загрузке таблицы не
+    копируются: словарь терминов - массив смещений в отображенном файле,
+    частоты - массив uint32 там же. Словарь term -> idf для оценки строится
+    один раз при первом обращении.
+
+    IDF считается так же, как ISF внутри документа:
+    log(num_documents / (1 + df)). tokenizer - каким токенизатором получены
+    термины; с ним же должны разбираться оцениваемые тексты.
+    """
+
+    def __init__(
+        self,
+        document_freq: Mapping[str, int],
+        num_documents: int,
+        tokenizer: str = "legacy",
+    ):
+        check_tokenizer(tokenizer)
+        terms = sorted(term for term in document_freq if term)
+        for term in terms:
+            if "\n" in term:
+                raise ValueError(f"Термин не может содержать перевод строки: {term!r}")
+
+        blob = "\n".join(terms).encode("utf-8")
+        offsets = array("I", [0])
+        position = 0
+        for term in terms:
+            position += len(term.encode("utf-8")) + 1
+            offsets.append(position)
+
+        self.num_documents = num_documents
+        self.tokenizer = tokenizer
+        self.path: Optional[Path] = None
+        self._offsets: Sequence[int] = offsets
+        self._freqs: Sequence[int] = array("I", (document_freq[t] for t in terms))
+        self._blob: Union[bytes, memoryview] = blob
+        self._mmap: Optional[mmap.mmap] = None
+        self._idf: Optional[Dict[str, float]] = None
+        self._fingerprint: Optional[str] = None
+
+    @classmethod
+    def build(
+        cls, documents: Iterable[str], tokenizer: str = "legacy"
+    ) -> "CorpusStatistics":
+        document_freq: Counter = Counter()
+        num_documents = 0
+        for text in documents:
+            document_freq.update(document_terms(text, tokenizer))
+            num_documents += 1
+        return cls(document_freq, num_documents, tokenizer)
+
+    @classmethod
+    def build_from_files(
+        cls,
+        paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = 1,
+        chunk_size: int = 64,
+        tokenizer: str = "legacy",
+        failed: Optional[List[Tuple[Path, str]]] = None,
+    ) -> "CorpusStatistics":
+        """Считает частоты по файлам; при workers != 1 - в пуле процессов.
+
+        Файл, который не удалось прочитать, пропускается: ошибка логируется
+        и добавляется в failed парой (путь, сообщение).
+        """
+        from .batch import run_in_pool
+
+        document_freq: Counter = Counter()
+        num_documents = 0
+        for counts, count, errors in run_in_pool(
+            (Path(path) for path in paths),
+            _count_document_terms,
+            (tokenizer,),
+            None,
+            (),
+            workers=workers,
+            chunk_size=chunk_size,
+            ordered=False,
+        ):
+            document_freq.update(counts)
+            num_documents += count
+            for path, error in errors:
+                logger.warning(f"Файл корпуса пропущен: {path}: {error}")
+                if failed is not None:
+                    failed.append((path, error))
+        return cls(document_freq, num_documents, tokenizer)
+
+    @classmethod
+    def load(cls, filepath: Union[str, Path]) -> "CorpusStatistics":
+        path = Path(filepath)
+        if not path.exists():
+            error_msg = f"Файл статистики корпуса не найден: {filepath}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, tokenizer_id, num_documents, num_terms, blob_size = (
+                _HEADER.unpack_from(buffer)
+            )
+        except struct.error:
+            magic, version, tokenizer_id = b"", 0, 0
+        if (
+            magic != _MAGIC
+            or version != FORMAT_VERSION
+            or tokenizer_id >= len(TOKENIZERS)
+        ):
+            buffer.close()
+            raise ValueError(f"Неверный формат файла статистики корпуса: {filepath}")
+
+        offsets_start = _HEADER.size
+        freqs_start = offsets_start + 4 * (num_terms + 1)
+        blob_start = freqs_start + 4 * num_terms
+        if blob_start + blob_size != len(buffer):
+            buffer.close()
+            raise ValueError(f"Файл статистики корпуса поврежден: {filepath}")
+
+        view = memoryview(buffer)
+        statistics = cls.__new__(cls)
+        statistics.num_documents = num_documents
+        statistics.tokenizer = TOKENIZERS[tokenizer_id]
+        statistics.path = path
+        statistics._offsets = _uint32_table(view[offsets_start:freqs_start])
+        statistics._freqs = _uint32_table(view[freqs_start:blob_start])
+        statistics._blob = view[blob_start:]
+        statistics._mmap = buffer
+        statistics._idf = None
+        statistics._fingerprint = None
+
+        logger.info(
+            f"Загружена статистика корпуса: {num_terms} терминов, "
+            f"{num_documents} документов из {filepath}"
+        )
+        return statistics
+
+    def save(self, filepath: Union[str, Path]) -> None:
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        num_terms = len(self)
+        blob = bytes(self._blob)
+        # Пишем во временный файл и подменяем: читатель файла (в том числе
+        # CorpusSnapshotFile в другом процессе) видит либо старую, либо новую
+        # статистику целиком.
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(
+                    _HEADER.pack(
+                        _MAGIC,
+                        FORMAT_VERSION,
+                        TOKENIZERS.index(self.tokenizer),
+                        self.num_documents,
+                        num_terms,
+                        len(blob),
+                    )
+                )
+                f.write(_little_endian(self._offsets))
+                f.write(_little_endian(self._freqs))
+                f.write(blob)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        logger.info(f"Статистика корпуса сохранена в: {filepath}")
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._offsets = self._freqs = array("I")
+            self._blob = b""
+            self._idf = None
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self) -> int:
+        return len(self._freqs)
+
+    def __contains__(self, term: object) -> bool:
+        return isinstance(term, str) and self._find(term) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.term(i) for i in range(len(self)))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Загруженная из файла статистика передается в рабочие процессы путем,
+        # а каждый процесс отображает файл сам, один раз.
+        if self.path is not None:
+            return (load_corpus_statistics, (str(self.path),))
+        return (
+            CorpusStatistics,
+            (dict(zip(self, self._freqs)), self.num_documents, self.tokenizer),
+        )
+
+    def current(self) -> "CorpusStatistics":
+        return self
+
+    def term(self, index: int) -> str:
+        start = self._offsets[index]
+        return bytes(self._blob[start : self._offsets[index + 1] - 1]).decode("utf-8")
+
+    def document_frequency(self, term: str) -> int:
+        index = self._find(term)
+        return 0 if index is None else self._freqs[index]
+
+    @property
+    def unknown_idf(self) -> float:
+        """IDF термина, которого нет в корпусе (df = 0)."""
+        return math.log(self.num_documents) if self.num_documents else 0.0
+
+    def idf(self, term: str) -> float:
+        return self.idf_table.get(term, self.unknown_idf)
+
+    def idf_many(self, terms: Iterable[str]) -> List[float]:
+        table = self.idf_table
+        default = self.unknown_idf
+        return [table.get(term, default) for term in terms]
+
+    @property
+    def idf_table(self) -> Dict[str, float]:
+        if self._idf is None:
+            num_documents = self.num_documents
+            terms = bytes(self._blob).decode("utf-8").split("\n") if len(self) else []
+            self._idf = {
+                term: math.log(num_documents / (1 + df))
+                for term, df in zip(terms, self._freqs)
+            }
+        return self._idf
+
+    @property
+    def fingerprint(self) -> str:
+        """Хэш содержимого для ключа кэша."""
+        if self._fingerprint is None:
+            digest = hashlib.sha256(str(self.num_documents).encode("ascii"))
+            # Для legacy отпечаток прежний: ключи кэша не меняются.
+            if self.tokenizer != "legacy":
+                digest.update(self.tokenizer.encode("ascii"))
+            digest.update(_little_endian(self._freqs))
+            digest.update(self._blob)
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def _find(self, term: str) -> Optional[int]:
+        # Двоичный поиск по отсортированному словарю без построения dict.
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            current = self.term(middle)
+            if current < term:
+                low = middle + 1
+            elif current > term:
+                high = middle
+            else:
+                return middle
+        return None
+
+
+def _uint32_table(view: memoryview) -> Sequence[int]:
+    if sys.byteorder == "little":
+        return view.cast("I")
+    table = array("I", bytes(view))
+    table.byteswap()
+    return table
+
+
+def _little_endian(table: Sequence[int]) -> bytes:
+    if sys.byteorder == "little":
+        return bytes(memoryview(table).cast("B"))  # type: ignore[arg-type]
+    swapped = array("I", table)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _count_document_terms(
+    paths: List[Path], tokenizer: str = "legacy"
+) -> List[Tuple[Counter, int, List[Tuple[Path, str]]]]:
+    document_freq: Counter = Counter()
+    errors = []
+    for path in paths:
+        # Ошибка одного файла (кодировка, права) не прерывает сборку корпуса.
+        try:
+            text = read_text_file(path)
+        except Exception as e:
+            errors.append((path, str(e)))
+            continue
+        document_freq.update(document_terms(text, tokenizer))
+    return [(document_freq, len(paths) - len(errors), errors)]
+
+
+class OnlineCorpusStatistics:
+    """Документная частота, которая пополняется во время работы.
+
+    Счетчики меняются под блокировкой, один раз на документ. Оценка читает
+    не их, а неизменяемый снимок CorpusStatistics из current(): новый снимок
+    строится вне блокировки каждые refresh_every документов и подменяется
+    одним присваиванием, поэтому чтение не блокируется и всегда видит
+    согласованную таблицу. С snapshot_path снимок не чаще раза в
+    snapshot_interval секунд сохраняется на диск (из потока, добавившего
+    документ).
+
+    Словарь ограничен max_terms: при переполнении остаются
+    prune_ratio * max_terms самых частых терминов. Выброшенный термин,
+    встретившись снова, считается заново, поэтому частоты редких терминов
+    занижены; их IDF и так близок к unknown_idf.
+    """
+
+    def __init__(
+        self,
+        base: Optional[CorpusStatistics] = None,
+        max_terms: int = 1_000_000,
+        prune_ratio: float = 0.8,
+        refresh_every: int = 1000,
+        snapshot_path: Optional[Union[str, Path]] = None,
+        snapshot_interval: float = 60.0,
+        tokenizer: Optional[str] = None,
+    ):
+        if max_terms < 1:
+            raise ValueError("max_terms должен быть положительным")
+        if not 0 < prune_ratio < 1:
+            raise ValueError("prune_ratio должен быть в диапазоне (0, 1)")
+        if refresh_every < 1:
+            raise ValueError("refresh_every должен быть положительным")
+        if tokenizer is None:
+            tokenizer = base.tokenizer if base is not None else "legacy"
+        check_tokenizer(tokenizer)
+        if base is not None and base.tokenizer != tokenizer:
+            raise ValueError(
+                f"Статистика корпуса построена токенизатором {base.tokenizer}, "
+                f"а не {tokenizer}"
+            )
+
+        self.max_terms = max_terms
+        self.prune_ratio = prune_ratio
+        self.refresh_every = refresh_every
+        self.tokenizer = tokenizer
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.snapshot_interval = snapshot_interval
+        self.pruned_terms = 0
+
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = (
+            dict(zip(base, base._freqs)) if base is not None else {}
+        )
+        self._num_documents = base.num_documents if base is not None else 0
+        self._pending = 0
+        self._next_save = time.monotonic() + snapshot_interval
+        if len(self._counts) > max_terms:
+            self._prune()
+        self._snapshot = CorpusStatistics(self._counts, self._num_documents, tokenizer)
+
+    @property
+    def num_documents(self) -> int:
+        return self._num_documents
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # В рабочие процессы уходит текущий снимок: счетчики с блокировкой
+        # между процессами не разделяются.
+        return self._snapshot.__reduce__()
+
+    def current(self) -> CorpusStatistics:
+        return self._snapshot
+
+    @property
+    def fingerprint(self) -> str:
+        return self._snapshot.fingerprint
+
+    def add_document(self, text: str) -> None:
+        self.add_terms(document_terms(text, self.tokenizer))
+
+    def add_terms(self, terms: Iterable[str]) -> None:
+        """Учитывает один документ; terms - его термины, повторы не важны."""
+        terms = set(terms)
+        with self._lock:
+            counts = self._counts
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            self._num_documents += 1
+            self._pending += 1
+            if len(counts) > self.max_terms:
+                self._prune()
+
+            refresh = self._pending >= self.refresh_every
+            save = self.snapshot_path is not None and (
+                time.monotonic() >= self._next_save
+            )
+            if save:
+                self._next_save = time.monotonic() + self.snapshot_interval
+
+        if save:
+            self.save(self.snapshot_path)  # type: ignore[arg-type]
+        elif refresh:
+            self.refresh()
+
+    def refresh(self) -> CorpusStatistics:
+        """Строит и публикует снимок текущих счетчиков."""
+        with self._lock:
+            counts = dict(self._counts)
+            num_documents = self._num_documents
+            self._pending = 0
+        # Сортировка словаря - вне блокировки, добавление документов не ждет.
+        snapshot = CorpusStatistics(counts, num_documents, self.tokenizer)
+        # Снимки из разных потоков могут достроиться не по порядку; более
+        # старый не должен заменить более новый.
+        if num_documents >= self._snapshot.num_documents:
+            self._snapshot = snapshot
+        return snapshot
+
+    def save(self, filepath: Union[str, Path]) -> None:
+        self.refresh().save(filepath)
+
+    def _prune(self) -> None:
+        keep = int(self.max_terms * self.prune_ratio)
+        before = len(self._counts)
+        self._counts = dict(
+            heapq.nlargest(keep, self._counts.items(), key=itemgetter(1))
+        )
+        self.pruned_terms += before - len(self._counts)
+        logger.info(
+            f"Словарь статистики корпуса сокращен: {before} -> {len(self._counts)}"
+        )
+
+
+class CorpusSnapshotFile:
+    """Файл статистики, который может подменяться во время работы.
+
+    current() не чаще раза в check_interval секунд проверяет время изменения
+    файла и при изменении загружает его заново; в остальное время отдает уже
+    загруженный снимок без системных вызовов. Так рабочие процессы сервера
+    подхватывают снимки OnlineCorpusStatistics, сохраненные родителем.
+    """
+
+    def __init__(self, filepath: Union[str, Path], check_interval: float = 5.0):
+        self.path = Path(filepath)
+        self.check_interval = check_interval
+        self._statistics = load_corpus_statistics(self.path)
+        self._next_check = time.monotonic() + check_interval
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (CorpusSnapshotFile, (str(self.path), self.check_interval))
+
+    def current(self) -> CorpusStatistics:
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            try:
+                self._statistics = load_corpus_statistics(self.path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Не удалось обновить статистику корпуса: {e}")
+        return self._statistics
+
+    @property
+    def fingerprint(self) -> str:
+        return self.current().fingerprint
+
+
+# Статистика, уже загруженная в этом процессе: путь -> (mtime, размер, объект).
+_loaded: Dict[str, Tuple[int, int, CorpusStatistics]] = {}
+
+
+def load_corpus_statistics(filepath: Union[str, Path]) -> CorpusStatistics:
+    """Загружает файл один раз на процесс; повторные вызовы отдают тот же объект."""
+    path = Path(filepath).resolve()
+    stat = path.stat() if path.exists() else None
+    key = str(path)
+
+    cached = _loaded.get(key)
+    if (
+        cached is not None
+        and stat is not None
+        and cached[:2] == (stat.st_mtime_ns, stat.st_size)
+    ):
+        return cached[2]
+
+    statistics = CorpusStatistics.load(path)
+    _loaded[key] = (stat.st_mtime_ns, stat.st_size, statistics)  # type: ignore
+    return statistics
+
+
+def load_idf(idf: Optional[IdfSource]) -> Optional[IdfProvider]:
+    if idf is None or isinstance(
+        idf, (CorpusStatistics, OnlineCorpusStatistics, CorpusSnapshotFile)
+    ):
+        return idf
+    return load_corpus_statistics(idf)
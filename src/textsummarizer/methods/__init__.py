@@ -1,5 +1,10 @@
-from .base import BaseSummarizer
+from .base import BaseSummarizer, select_top_k
 from .frequency_based import FrequencyBasedSummarizer
 from .feature_based import FeatureBasedSummarizer
 
-__all__ = ["BaseSummarizer", "FrequencyBasedSummarizer", "FeatureBasedSummarizer"]
+__all__ = [
+    "BaseSummarizer",
+    "FrequencyBasedSummarizer",
+    "FeatureBasedSummarizer",
+    "select_top_k",
+]
@@ -1,19 +1,251 @@
+import heapq
 from abc import ABC, abstractmethod
-from typing import List
-from ..entities import Sentence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from ..entities import Sentence, AnalyzedDocument, AnalyzedSentence, ScoredSentences
+from ..profiling import NULL_TIMER
+from ..utils.normalization import DEFAULT_NORMALIZER
+from ..utils.text_processing import analyze_sentences
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def select_top_k(scores: Union[Sequence[float], "np.ndarray"], k: int) -> List[int]:
+    """Позиции k предложений с наибольшими оценками, по возрастанию позиции.
+
+    Работает за O(N) через np.partition. При равных оценках выигрывает более
+    раннее предложение, как при устойчивой сортировке по убыванию.
+    """
+    import numpy as np
+
+    scores = np.asarray(scores, dtype=np.float64)
+    total = len(scores)
+    if k <= 0:
+        return []
+    if k >= total:
+        return list(range(total))
+
+    threshold = np.partition(scores, total - k)[total - k]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[: k - len(above)]
+
+    return sorted(above.tolist() + ties.tolist())
+
+
+class BoundedTopK:
+    """Куча из k лучших предложений для потоковой обработки, O(k) памяти.
+
+    Порядок тот же, что у select_top_k: при равных оценках остается более
+    раннее предложение.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, int, Sentence]] = []
+
+    def accepts(self, score: float, position: int) -> bool:
+        if len(self._heap) < self.k:
+            return self.k > 0
+        worst_score, worst_position, _ = self._heap[0]
+        return (score, -position) > (worst_score, worst_position)
+
+    def push(self, score: float, sentence: Sentence) -> None:
+        if not self.accepts(score, sentence.position):
+            return
+        item = (score, -sentence.position, sentence)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        else:
+            heapq.heapreplace(self._heap, item)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def sentences(self) -> List[Sentence]:
+        return sorted((item[2] for item in self._heap), key=lambda s: s.position)
+
+    def ranked(self) -> List[Sentence]:
+        """Предложения по убыванию оценки, при равных - по позиции."""
+        return [
+            item[2] for item in sorted(self._heap, key=lambda i: i[:2], reverse=True)
+        ]
 
 
 class BaseSummarizer(ABC):
-    @abstractmethod
+    # TextSummarizer подменяет на StageTimer, если включено профилирование.
+    timer = NULL_TIMER
+
     def summarize(
         self, sentences: List[str], compression_ratio: float
     ) -> List[Sentence]:
+        if not sentences:
+            return []
+
+        return self.summarize_document(analyze_sentences(sentences), compression_ratio)
+
+    def summarize_document(
+        self, document: AnalyzedDocument, compression_ratio: float
+    ) -> List[Sentence]:
+        if not document.sentences:
+            return []
+
+        with self.timer.stage("score"):
+            scored = self._score_document(document)
+        with self.timer.stage("select"):
+            return self._select_sentences(scored, compression_ratio)
+
+    def summarize_documents(
+        self,
+        documents: Sequence[AnalyzedDocument],
+        compression_ratios: Sequence[float],
+    ) -> List[List[Sentence]]:
+        """Саммаризирует пачку документов с общей оценкой предложений."""
+        nonempty = [document for document in documents if document.sentences]
+        scored = iter(self.score_documents(nonempty))
+
+        results = []
+        for document, compression_ratio in zip(documents, compression_ratios):
+            if not document.sentences:
+                results.append([])
+                continue
+            results.append(self._select_sentences(next(scored), compression_ratio))
+        return results
+
+    def score_documents(
+        self, documents: Sequence[AnalyzedDocument]
+    ) -> List[ScoredSentences]:
+        """Оценки для каждого документа; наследники могут оценивать пачку разом."""
+        return [self._score_document(document) for document in documents]
+
+    def rank_document(
+        self, document: AnalyzedDocument, max_ratio: float = 1.0
+    ) -> Tuple[List[int], ScoredSentences]:
+        """Оценивает документ один раз и возвращает позиции по убыванию оценки.
+
+        Ранжируются только первые k = max(1, N * max_ratio) предложений; префикс
+        длины k' <= k совпадает с выбором summarize_document для меньшего k'.
+        """
+        if not document.sentences:
+            return [], ScoredSentences(document, [])
+
+        scored = self._score_document(document)
+        scores = scored.scores
+        top = select_top_k(
+            scores, self.num_to_select(len(document.sentences), max_ratio)
+        )
+        ranking = sorted(top, key=lambda idx: (-float(scores[idx]), idx))
+        return ranking, scored
+
+    @abstractmethod
+    def _score_document(self, document: AnalyzedDocument) -> ScoredSentences:
         pass
 
-    def _prepare_text(self, text: str) -> List[str]:
-        import re
+    def cache_config(self) -> Dict[str, Any]:
+        """Настройки, от которых зависит результат; входят в ключ кэша."""
+        return {}
+
+    def num_to_select(self, total: int, compression_ratio: float) -> int:
+        return max(1, int(total * compression_ratio))
+
+    def _select_sentences(
+        self, scored: ScoredSentences, compression_ratio: float
+    ) -> List[Sentence]:
+        """Создает Sentence только для отобранных предложений."""
+        num_to_select = self.num_to_select(len(scored), compression_ratio)
 
+        return [
+            scored.sentence(idx) for idx in select_top_k(scored.scores, num_to_select)
+        ]
+
+    def summarize_stream(
+        self,
+        open_sentences: Callable[[], Iterable[AnalyzedSentence]],
+        compression_ratio: float,
+        observer: Optional[Callable[[AnalyzedSentence], None]] = None,
+        source: Optional[Any] = None,
+    ) -> List[Sentence]:
+        """Два прохода по потоку предложений без загрузки документа в память.
+
+        open_sentences должен при каждом вызове возвращать новый итератор.
+        Первый проход собирает статистику документа (observer видит каждое
+        предложение), второй оценивает предложения и держит только k лучших.
+        Если задан source (MappedDocument), отобранные предложения хранят
+        только смещения и декодируют текст при обращении, поэтому source
+        должен оставаться открытым, пока они используются.
+        """
+        _, ranked = self.rank_stream(
+            open_sentences, compression_ratio, observer=observer, source=source
+        )
+        return sorted(ranked, key=lambda s: s.position)
+
+    def rank_stream(
+        self,
+        open_sentences: Callable[[], Iterable[AnalyzedSentence]],
+        compression_ratio: float,
+        observer: Optional[Callable[[AnalyzedSentence], None]] = None,
+        source: Optional[Any] = None,
+    ) -> Tuple[int, List[Sentence]]:
+        """Число предложений и отобранные предложения по убыванию оценки.
+
+        Первые num_to_select(total, r) из них - саммари summarize_stream для
+        любого r <= compression_ratio, поэтому несколько коэффициентов
+        получаются из одного прохода.
+        """
+        total, state = self._stream_first_pass(open_sentences(), observer)
+        if not total:
+            return 0, []
+
+        top = BoundedTopK(self.num_to_select(total, compression_ratio))
+        for sentence in open_sentences():
+            score, features = self._stream_score(sentence, total, state)
+            if not top.accepts(score, sentence.position):
+                continue
+            top.push(
+                score,
+                Sentence(
+                    text=None if source is not None else sentence.text,
+                    position=sentence.position,
+                    importance_score=score,
+                    is_important=True,
+                    features=features,
+                    analysis=sentence,
+                    span=sentence.span,
+                    source=source,
+                ),
+            )
+
+        return total, top.ranked()
+
+    def _stream_first_pass(
+        self,
+        sentences: Iterable[AnalyzedSentence],
+        observer: Optional[Callable[[AnalyzedSentence], None]] = None,
+    ) -> Tuple[int, Any]:
+        total = 0
+        for sentence in sentences:
+            total += 1
+            if observer is not None:
+                observer(sentence)
+        return total, None
+
+    def _stream_score(
+        self, sentence: AnalyzedSentence, total: int, state: Any
+    ) -> Tuple[float, Dict[str, float]]:
+        raise NotImplementedError(
+            f"{type(self).__name__} не поддерживает потоковую обработку"
+        )
+
+    def _prepare_text(self, text: str) -> List[str]:
         # Удаляем пунктуацию, приводим к нижнему регистру
-        text = re.sub(r"[^\w\s]", " ", text)
-        words = text.lower().split()
-        return words
+        return DEFAULT_NORMALIZER.words(text)
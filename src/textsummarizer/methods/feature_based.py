@@ -1,43 +1,65 @@
-from typing import List, Dict
-import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 from .base import BaseSummarizer
-from ..entities import Sentence
-from ..utils.text_processing import (
-    preprocess_text,
-    tokenize_words,
-    calculate_readability_metrics,
+from ..entities import AnalyzedSentence, AnalyzedDocument, ScoredSentences
+from ..utils.keywords import KeywordsSource, load_keywords
+from ..utils.normalization import DEFAULT_NORMALIZER
+from ..utils.text_processing import analyze_sentence, flesch_reading_ease
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FEATURE_NAMES = (
+    "position_score",
+    "length_score",
+    "has_numbers",
+    "proper_noun_ratio",
+    "lexical_diversity",
+    "keyword_score",
+    "readability_score",
 )
 
 
 class FeatureBasedSummarizer(BaseSummarizer):
-    def __init__(self):
+    def __init__(
+        self,
+        batch: bool = True,
+        keywords: Optional[KeywordsSource] = None,
+    ):
+        self.batch = batch
+
         self._position_weights = {"first": 1.0, "last": 0.8, "middle": 0.3}
 
-        self._keywords = {
-            "важно",
-            "следовательно",
-            "итог",
-            "вывод",
-            "заключение",
-            "основной",
-            "главный",
-            "результат",
-            "цель",
-            "задача",
-            "проблема",
-            "решение",
-            "метод",
-            "способ",
-            "алгоритм",
-            "анализ",
-            "исследование",
-            "эксперимент",
-            "доказательство",
+        self._feature_weights = {
+            "position_score": 0.25,
+            "length_score": 0.15,
+            "has_numbers": 0.1,
+            "proper_noun_ratio": 0.1,
+            "lexical_diversity": 0.15,
+            "keyword_score": 0.15,
+            "readability_score": 0.1,
+        }
+
+        self._keywords = load_keywords(keywords)
+
+    def cache_config(self) -> Dict[str, Any]:
+        return {
+            "position_weights": self._position_weights,
+            "feature_weights": self._feature_weights,
+            "keywords": self._keywords.fingerprint,
         }
 
     def _extract_features(
-        self, sentence: str, idx: int, total_sentences: int
+        self,
+        sentence: Union[str, AnalyzedSentence],
+        idx: int,
+        total_sentences: int,
     ) -> Dict[str, float]:
+        if isinstance(sentence, str):
+            analyzed = analyze_sentence(sentence, idx)
+        else:
+            analyzed = sentence
+            sentence = analyzed.text
+
         features = {}
 
         features["position_score"] = self._calculate_position_score(
@@ -47,27 +69,34 @@ class FeatureBasedSummarizer(BaseSummarizer):
         words = sentence.split()
         features["length_score"] = self._calculate_length_score(len(words))
 
-        features["has_numbers"] = 1.0 if re.search(r"\d", sentence) else 0.0
+        features["has_numbers"] = (
+            1.0 if DEFAULT_NORMALIZER.has_digits(sentence) else 0.0
+        )
 
         uppercase_words = [w for w in words if w and w[0].isupper()]
         features["proper_noun_ratio"] = (
             len(uppercase_words) / len(words) if words else 0.0
         )
 
-        processed_sentence = preprocess_text(
-            sentence, lowercase=True, remove_punctuation=True, remove_numbers=False
-        )
-        processed_words = tokenize_words(processed_sentence)
+        processed_words = analyzed.tokens
         features["lexical_diversity"] = (
             len(set(processed_words)) / len(processed_words) if processed_words else 0.0
         )
 
         sentence_lower = sentence.lower()
-        found_keywords = sum(1 for kw in self._keywords if kw in sentence_lower)
+        found_keywords = self._keywords.count(sentence_lower)
         features["keyword_score"] = min(found_keywords / 3, 1.0)  # Нормализуем
 
-        readability_metrics = calculate_readability_metrics(sentence)
-        flesch_score = readability_metrics.get("flesch_score", 0)
+        # Индекс Флеша одного предложения из уже посчитанных слогов, без
+        # повторного разбора текста.
+        flesch_score = (
+            round(
+                flesch_reading_ease(1, len(processed_words), analyzed.syllable_count),
+                2,
+            )
+            if processed_words
+            else 0
+        )
         features["readability_score"] = max(0, min(flesch_score / 100, 1.0))
 
         return features
@@ -93,58 +122,146 @@ class FeatureBasedSummarizer(BaseSummarizer):
             return 0.1
 
     def _calculate_importance_score(self, features: Dict[str, float]) -> float:
-        weights = {
-            "position_score": 0.25,
-            "length_score": 0.15,
-            "has_numbers": 0.1,
-            "proper_noun_ratio": 0.1,
-            "lexical_diversity": 0.15,
-            "keyword_score": 0.15,
-            "readability_score": 0.1,
-        }
-
         total_score = 0.0
-        for feature_name, weight in weights.items():
+        for feature_name, weight in self._feature_weights.items():
             feature_value = features.get(feature_name, 0.0)
             total_score += feature_value * weight
 
         return total_score
 
-    def summarize(
-        self, sentences: List[str], compression_ratio: float
-    ) -> List[Sentence]:
-        if not sentences:
-            return []
-
-        scored_sentences = []
-        for idx, sentence in enumerate(sentences):
-            features = self._extract_features(sentence, idx, len(sentences))
-            importance_score = self._calculate_importance_score(features)
-
-            scored_sentences.append(
-                {
-                    "text": sentence,
-                    "idx": idx,
-                    "features": features,
-                    "score": importance_score,
-                }
+    def _weighted_scores(self, matrix: "np.ndarray") -> "np.ndarray":
+        # Столбцы складываются по одному в порядке _calculate_importance_score.
+        # В отличие от matrix @ weights, где BLAS меняет порядок суммирования в
+        # зависимости от числа строк, оценка не зависит от состава пачки.
+        import numpy as np
+
+        scores = np.zeros(len(matrix))
+        for name, weight in self._feature_weights.items():
+            scores += matrix[:, FEATURE_NAMES.index(name)] * weight
+        return scores
+
+    def _extract_feature_matrix(self, document: AnalyzedDocument) -> "np.ndarray":
+        """Признаки всех предложений в виде матрицы N x len(FEATURE_NAMES)."""
+        import numpy as np
+
+        sentences = document.sentences
+        total = len(sentences)
+        matrix = np.zeros((total, len(FEATURE_NAMES)))
+        if not total:
+            return matrix
+
+        idx = np.arange(total)
+        distance_to_edge = np.minimum(idx, total - 1 - idx)
+        position = self._position_weights["middle"] * (
+            1.0 - distance_to_edge / (total / 2)
+        )
+        position[-1] = self._position_weights["last"]
+        position[0] = self._position_weights["first"]
+
+        raw_lengths = np.empty(total)
+        uppercase_counts = np.empty(total)
+        has_numbers = np.empty(total)
+        token_counts = np.empty(total)
+        unique_counts = np.empty(total)
+        syllable_counts = np.empty(total)
+        keyword_counts = np.empty(total)
+
+        keywords = self._keywords
+        has_digits = DEFAULT_NORMALIZER.has_digits
+        for i, sentence in enumerate(sentences):
+            text = sentence.text
+            words = text.split()
+            raw_lengths[i] = len(words)
+            uppercase_counts[i] = sum(1 for w in words if w[0].isupper())
+            has_numbers[i] = has_digits(text)
+            tokens = sentence.tokens
+            token_counts[i] = len(tokens)
+            unique_counts[i] = len(set(tokens))
+            syllable_counts[i] = sentence.syllable_count
+            keyword_counts[i] = keywords.count(text.lower())
+
+        length_score = np.select(
+            [
+                (raw_lengths >= 15) & (raw_lengths <= 25),
+                ((raw_lengths >= 10) & (raw_lengths < 15))
+                | ((raw_lengths > 25) & (raw_lengths <= 30)),
+                ((raw_lengths >= 5) & (raw_lengths < 10))
+                | ((raw_lengths > 30) & (raw_lengths <= 40)),
+            ],
+            [1.0, 0.7, 0.4],
+            default=0.1,
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            proper_noun_ratio = np.where(
+                raw_lengths > 0, uppercase_counts / raw_lengths, 0.0
+            )
+            lexical_diversity = np.where(
+                token_counts > 0, unique_counts / token_counts, 0.0
             )
+            flesch = np.where(
+                token_counts > 0,
+                206.835 - 1.3 * token_counts - 60.1 * (syllable_counts / token_counts),
+                0.0,
+            )
+        # round() из стандартной библиотеки, как в _extract_features:
+        # np.round на границах .xx5 округляет иначе.
+        flesch = np.array([round(value, 2) for value in flesch.tolist()])
+
+        matrix[:, 0] = position
+        matrix[:, 1] = length_score
+        matrix[:, 2] = has_numbers
+        matrix[:, 3] = proper_noun_ratio
+        matrix[:, 4] = lexical_diversity
+        matrix[:, 5] = np.minimum(keyword_counts / 3, 1.0)
+        matrix[:, 6] = np.clip(flesch / 100, 0, 1.0)
+
+        return matrix
 
-        num_to_select = max(1, int(len(sentences) * compression_ratio))
+    def _stream_score(
+        self, sentence: AnalyzedSentence, total: int, state: Any
+    ) -> Tuple[float, Dict[str, float]]:
+        features = self._extract_features(sentence, sentence.position, total)
+        return self._calculate_importance_score(features), features
 
-        scored_sentences.sort(key=lambda x: x["score"], reverse=True)
+    def score_documents(
+        self, documents: Sequence[AnalyzedDocument]
+    ) -> List[ScoredSentences]:
+        if not self.batch or len(documents) < 2:
+            return super().score_documents(documents)
 
-        selected = []
-        for item in scored_sentences[:num_to_select]:
-            sentence_obj = Sentence(
-                text=item["text"],
-                position=item["idx"],
-                importance_score=item["score"],
-                is_important=True,
-                features=item["features"],
+        import numpy as np
+
+        # Одна взвешенная сумма для всей пачки вместо отдельной на документ.
+        matrices = [self._extract_feature_matrix(document) for document in documents]
+        scores = self._weighted_scores(np.vstack(matrices))
+        offsets = np.cumsum([len(matrix) for matrix in matrices])[:-1]
+
+        return [
+            ScoredSentences(document, doc_scores, matrix, FEATURE_NAMES)
+            for document, matrix, doc_scores in zip(
+                documents, matrices, np.split(scores, offsets)
+            )
+        ]
+
+    def _score_document(self, document: AnalyzedDocument) -> ScoredSentences:
+        sentences = document.sentences
+
+        if self.batch:
+            matrix = self._extract_feature_matrix(document)
+            return ScoredSentences(
+                document, self._weighted_scores(matrix), matrix, FEATURE_NAMES
             )
-            selected.append(sentence_obj)
 
-        selected.sort(key=lambda x: x.position)
+        import numpy as np
+
+        features = [
+            self._extract_features(sentence, idx, len(sentences))
+            for idx, sentence in enumerate(sentences)
+        ]
+        scores = [self._calculate_importance_score(f) for f in features]
+        matrix = np.array(
+            [[f[name] for name in FEATURE_NAMES] for f in features], dtype=np.float64
+        ).reshape(len(features), len(FEATURE_NAMES))
 
-        return selected
+        return ScoredSentences(document, scores, matrix, FEATURE_NAMES)
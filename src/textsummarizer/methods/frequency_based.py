@@ -1,16 +1,79 @@
-from typing import List, Dict, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 import math
 from collections import Counter
+from itertools import filterfalse
 from .base import BaseSummarizer
-from ..entities import Sentence
-from ..utils.text_processing import preprocess_text, tokenize_words
+from ..entities import AnalyzedDocument, AnalyzedSentence, ScoredSentences
+from ..idf import (
+    CorpusStatistics,
+    IdfProvider,
+    IdfSource,
+    OnlineCorpusStatistics,
+    load_idf,
+)
+from ..utils.text_processing import analyze_sentences
+from ..utils.vocabulary import EncodedDocument, encode_document
+
+if TYPE_CHECKING:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+TF_ISF_BACKENDS = ("python", "sparse")
+
+# Сколько самых длинных строк sparse-вариант досчитывает по одной, а не
+# общим шагом по позиции термина (см. _sum_rows).
+_TAIL_ROWS = 8
 
 
 class FrequencyBasedSummarizer(BaseSummarizer):
-    def __init__(self, use_stopwords: bool = True):
+    """TF-ISF: частота слова в предложении, умноженная на его редкость.
+
+    По умолчанию редкость (ISF) считается по предложениям самого документа.
+    С idf - статистикой корпуса (CorpusStatistics или путь к файлу
+    build-idf) - берется готовый IDF корпуса, и документная частота по
+    предложениям не считается. Каждый документ оценивается по одному снимку
+    idf.current(); OnlineCorpusStatistics вдобавок учитывает оцененные
+    документы.
+    """
+
+    def __init__(
+        self,
+        use_stopwords: bool = True,
+        backend: str = "python",
+        idf: Optional[IdfSource] = None,
+    ):
+        if backend not in TF_ISF_BACKENDS:
+            raise ValueError(
+                f"Неизвестный backend TF-ISF: {backend} "
+                f"(доступны: {', '.join(TF_ISF_BACKENDS)})"
+            )
+
         self.use_stopwords = use_stopwords
+        self.backend = backend
+        self.idf: Optional[IdfProvider] = load_idf(idf)
         self._stopwords = self._load_stopwords() if use_stopwords else set()
 
+    def cache_config(self) -> Dict[str, Any]:
+        config: Dict[str, Any] = {
+            "use_stopwords": self.use_stopwords,
+            "stopwords": sorted(self._stopwords),
+        }
+        if self.idf is not None:
+            config["idf"] = self.idf.current().fingerprint
+        return config
+
     def _load_stopwords(self) -> Set[str]:
         russian_stopwords = {
             "и",
@@ -167,69 +230,282 @@ class FrequencyBasedSummarizer(BaseSummarizer):
         }
         return russian_stopwords
 
-    def _calculate_tf_isf_scores(self, sentences: List[str]) -> List[float]:
-        sentence_words = []
-        word_document_freq = Counter()
+    def _calculate_tf_isf_scores(
+        self, sentences: Union[List[str], AnalyzedDocument]
+    ) -> List[float]:
+        if not isinstance(sentences, AnalyzedDocument):
+            sentences = analyze_sentences(sentences)
+
+        if self.backend == "sparse":
+            return self._calculate_tf_isf_scores_sparse(sentences)
+
+        # Счет идет по номерам терминов документа: стоп-слова - множество
+        # номеров, ISF или IDF - список по номеру вместо словаря по строке.
+        encoded = encode_document(sentences)
+        sentence_ids = self._filter_ids(encoded)
+
+        if self.idf is not None:
+            weights = self.idf.current().idf_many(encoded.vocabulary.terms)
+        else:
+            word_document_freq: Counter = Counter()
+            for ids in sentence_ids:
+                word_document_freq.update(set(ids))
+
+            num_sentences = len(sentences)
+            weights = [0.0] * len(encoded.vocabulary)
+            for term_id, df in word_document_freq.items():
+                weights[term_id] = math.log(num_sentences / (1 + df))
+
+        return [self._score_ids(ids, weights) for ids in sentence_ids]
+
+    def _filter_ids(self, encoded: EncodedDocument) -> List[List[int]]:
+        # Один tolist на документ и срезы списка дешевле, чем обход срезов
+        # array, где каждый элемент заново превращается в int.
+        ids = encoded.ids.tolist()
+        bounds = encoded.offsets.tolist()
+        stop_ids = (
+            encoded.vocabulary.ids_of(self._stopwords) if self.use_stopwords else ()
+        )
+        if not stop_ids:
+            return [ids[start:end] for start, end in zip(bounds, bounds[1:])]
+
+        is_stopword = stop_ids.__contains__
+        return [
+            list(filterfalse(is_stopword, ids[start:end]))
+            for start, end in zip(bounds, bounds[1:])
+        ]
+
+    @staticmethod
+    def _score_ids(ids: Sequence[int], weights: Sequence[float]) -> float:
+        """Как _score_words: tf термина, умноженный на его вес по номеру."""
+        if not ids:
+            return 0.0
+
+        total_words = len(ids)
+        sentence_score = 0.0
+        for term_id, count in Counter(ids).items():
+            sentence_score += count / total_words * weights[term_id]
+
+        return sentence_score
+
+    def _filter_words(self, words: List[str]) -> List[str]:
+        if self.use_stopwords:
+            return [w for w in words if w not in self._stopwords]
+        return words
+
+    def _score_words(
+        self, words: List[str], word_document_freq: Counter, num_sentences: int
+    ) -> float:
+        if not words:
+            return 0.0
+
+        word_counts = Counter(words)
+        total_words = len(words)
 
+        sentence_score = 0.0
+        for word, count in word_counts.items():
+            tf = count / total_words
+            isf = math.log(num_sentences / (1 + word_document_freq[word]))
+            sentence_score += tf * isf
+
+        return sentence_score
+
+    def _score_words_idf(self, words: List[str], statistics: CorpusStatistics) -> float:
+        """Как _score_words, но с IDF корпуса вместо ISF документа."""
+        if not words:
+            return 0.0
+
+        idf = statistics.idf_table
+        unknown_idf = statistics.unknown_idf
+        total_words = len(words)
+
+        sentence_score = 0.0
+        for word, count in Counter(words).items():
+            sentence_score += count / total_words * idf.get(word, unknown_idf)
+
+        return sentence_score
+
+    def _stream_first_pass(
+        self,
+        sentences: Iterable[AnalyzedSentence],
+        observer: Optional[Callable[[AnalyzedSentence], None]] = None,
+    ) -> Tuple[int, Any]:
+        """Первый проход: число предложений и документная частота слов.
+
+        С idf вместо частот возвращается снимок статистики, по которому
+        оценивается весь поток.
+        """
+        if self.idf is not None:
+            statistics = self.idf.current()
+            if not isinstance(self.idf, OnlineCorpusStatistics):
+                total, _ = super()._stream_first_pass(sentences, observer)
+                return total, statistics
+
+            terms: Set[str] = set()
+            total = 0
+            for sentence in sentences:
+                total += 1
+                terms.update(sentence.tokens)
+                if observer is not None:
+                    observer(sentence)
+            if total:
+                self.idf.add_terms(terms)
+            return total, statistics
+
+        num_sentences = 0
+        word_document_freq: Counter = Counter()
         for sentence in sentences:
-            processed_text = preprocess_text(
-                sentence, lowercase=True, remove_punctuation=True, remove_numbers=False
-            )
+            num_sentences += 1
+            word_document_freq.update(set(self._filter_words(sentence.tokens)))
+            if observer is not None:
+                observer(sentence)
+        return num_sentences, word_document_freq
 
-            words = tokenize_words(processed_text)
-            if self.use_stopwords:
-                words = [w for w in words if w not in self._stopwords]
+    def _stream_score(
+        self,
+        sentence: AnalyzedSentence,
+        total: int,
+        state: Any,
+    ) -> Tuple[float, Dict[str, float]]:
+        words = self._filter_words(sentence.tokens)
+        if self.idf is not None:
+            score = self._score_words_idf(words, state)
+        else:
+            score = self._score_words(words, state, total)
+        return score, {"tf_isf_score": score}
 
-            sentence_words.append(words)
-            unique_words = set(words)
-            for word in unique_words:
-                word_document_freq[word] += 1
+    def _build_term_matrix(
+        self, document: AnalyzedDocument
+    ) -> Tuple["csr_matrix", List[str]]:
+        """CSR-матрица предложение x термин с числом вхождений и ее термины.
 
-        num_sentences = len(sentences)
-        scores = []
+        Столбец - номер термина в словаре документа; у стоп-слов столбцы пустые.
 
-        for words in sentence_words:
-            if not words:
-                scores.append(0.0)
-                continue
+        Внутри строки термины идут в порядке первого появления в предложении,
+        как ключи Counter в построчном варианте.
+        """
+        import numpy as np
+        from scipy.sparse import csr_matrix
 
-            word_counts = Counter(words)
-            total_words = len(words)
+        # Номера токенов документа берутся без копии; стоп-слова отсекаются
+        # маской по словарю, а не проверкой каждого токена на Python.
+        encoded = encode_document(document)
+        token_ids = np.frombuffer(encoded.ids, dtype=np.intc).astype(np.int64)
+        lengths = np.diff(np.frombuffer(encoded.offsets, dtype=np.int64))
 
-            sentence_score = 0.0
-            for word, count in word_counts.items():
-                tf = count / total_words
-                isf = math.log(num_sentences / (1 + word_document_freq[word]))
-                sentence_score += tf * isf
+        num_sentences = len(document.sentences)
+        num_terms = len(encoded.vocabulary)
+        width = max(num_terms, 1)
+        rows = np.repeat(np.arange(num_sentences, dtype=np.int64), lengths)
 
-            scores.append(sentence_score)
+        stop_ids = (
+            encoded.vocabulary.ids_of(self._stopwords) if self.use_stopwords else ()
+        )
+        if stop_ids:
+            is_stopword = np.zeros(width, dtype=bool)
+            is_stopword[list(stop_ids)] = True
+            keep = ~is_stopword[token_ids]
+            token_ids = token_ids[keep]
+            rows = rows[keep]
+        keys = rows * width + token_ids
 
-        return scores
+        unique_keys, first_seen, counts = np.unique(
+            keys, return_index=True, return_counts=True
+        )
+        order = np.argsort(first_seen, kind="stable")
+        unique_keys = unique_keys[order]
+        counts = counts[order]
 
-    def summarize(
-        self, sentences: List[str], compression_ratio: float
-    ) -> List[Sentence]:
-        if not sentences:
-            return []
+        entry_rows = unique_keys // width
+        indptr = np.zeros(num_sentences + 1, dtype=np.int64)
+        np.cumsum(np.bincount(entry_rows, minlength=num_sentences), out=indptr[1:])
 
-        scores = self._calculate_tf_isf_scores(sentences)
-        num_to_select = max(1, int(len(sentences) * compression_ratio))
-        scored_sentences = list(zip(sentences, scores, range(len(sentences))))
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
+        matrix = csr_matrix(
+            (counts.astype(np.float64), unique_keys % width, indptr),
+            shape=(num_sentences, num_terms),
+        )
+        return matrix, encoded.vocabulary.terms
 
-        selected = []
-        for i, (text, score, original_idx) in enumerate(
-            scored_sentences[:num_to_select]
+    def _calculate_tf_isf_scores_sparse(
+        self, document: AnalyzedDocument
+    ) -> List[float]:
+        import numpy as np
+
+        num_sentences = len(document.sentences)
+        term_matrix, terms = self._build_term_matrix(document)
+
+        if self.idf is not None:
+            isf = np.array(self.idf.current().idf_many(terms), dtype=np.float64)
+        else:
+            document_freq = np.bincount(
+                term_matrix.indices, minlength=term_matrix.shape[1]
+            )
+            isf = np.array(
+                [math.log(num_sentences / (1 + df)) for df in document_freq.tolist()]
+            )
+
+        row_lengths = np.diff(term_matrix.indptr)
+        row_totals = np.asarray(term_matrix.sum(axis=1)).ravel()
+        entry_totals = np.repeat(row_totals, row_lengths)
+        contributions = term_matrix.data / entry_totals * isf[term_matrix.indices]
+
+        return self._sum_rows(
+            contributions, term_matrix.indptr, row_lengths, num_sentences
+        ).tolist()
+
+    @staticmethod
+    def _sum_rows(
+        contributions: "np.ndarray",
+        indptr: "np.ndarray",
+        row_lengths: "np.ndarray",
+        num_sentences: int,
+    ) -> "np.ndarray":
+        # Суммируем вклады терминов последовательно, в том же порядке, что и
+        # построчный вариант: np.sum использует попарное сложение и может
+        # расходиться с ним в последних битах. Строки упорядочены по убыванию
+        # длины, и на шаге offset складываются только строки длиннее offset -
+        # их префикс order[:active], так что всего выполняется O(nnz) сложений.
+        # Последние _TAIL_ROWS самых длинных строк досчитываются np.cumsum,
+        # который тоже складывает по порядку, без шага на каждый термин.
+        import numpy as np
+
+        scores = np.zeros(num_sentences)
+        order = np.argsort(-row_lengths, kind="stable")
+        sorted_lengths = row_lengths[order]
+        starts = indptr[:-1][order]
+        # active_counts[k] - сколько строк длиннее k.
+        active_counts = np.searchsorted(
+            -sorted_lengths,
+            -np.arange(int(sorted_lengths[0]) if num_sentences else 0),
+            side="left",
+        )
+
+        offset = 0
+        for offset, active in enumerate(active_counts.tolist()):
+            if active <= _TAIL_ROWS:
+                break
+            rows = order[:active]
+            scores[rows] += contributions[starts[:active] + offset]
+        else:
+            return scores
+
+        for row, start, length in zip(
+            order[:active].tolist(),
+            starts[:active].tolist(),
+            sorted_lengths[:active].tolist(),
         ):
-            sentence_obj = Sentence(
-                text=text,
-                position=original_idx,
-                importance_score=score,
-                is_important=True,
-                features={"tf_isf_score": score},
+            tail = np.concatenate(
+                ([scores[row]], contributions[start + offset : start + length])
             )
-            selected.append(sentence_obj)
+            scores[row] = np.cumsum(tail)[-1]
+        return scores
 
-        selected.sort(key=lambda x: x.position)
+    def _score_document(self, document: AnalyzedDocument) -> ScoredSentences:
+        import numpy as np
 
-        return selected
+        scores = np.asarray(self._calculate_tf_isf_scores(document), dtype=np.float64)
+        if isinstance(self.idf, OnlineCorpusStatistics) and document.sentences:
+            # Документ учитывается после оценки: сам он в свой IDF не входит.
+            self.idf.add_terms(encode_document(document).vocabulary)
+        # Единственный признак - сама оценка; столбец - представление без копии.
+        return ScoredSentences(document, scores, scores[:, None], ("tf_isf_score",))
@@ -0,0 +1,116 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, ContextManager, Dict, Iterator, Mapping, Optional
+
+STAGES = ("split", "analyze", "score", "select", "statistics", "cache", "save")
+
+StageStartHook = Callable[[str], None]
+StageEndHook = Callable[[str, float], None]
+
+_NULL_CONTEXT = nullcontext()
+
+
+class NullStageTimer:
+    """Выключенный таймер: stage() возвращает один и тот же пустой контекст."""
+
+    enabled = False
+
+    def stage(self, name: str) -> ContextManager[None]:
+        return _NULL_CONTEXT
+
+
+NULL_TIMER = NullStageTimer()
+
+
+class StageTimer:
+    """Замеряет этапы конвейера и вызывает хуки на их начале и конце.
+
+    last - время этапов последнего документа (его копия попадает в
+    SummaryResult.timings), totals и counts - накопленные значения для
+    экспорта в формате Prometheus. Один таймер не рассчитан на
+    одновременное использование из нескольких потоков.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        on_stage_start: Optional[StageStartHook] = None,
+        on_stage_end: Optional[StageEndHook] = None,
+    ):
+        self.on_stage_start = on_stage_start
+        self.on_stage_end = on_stage_end
+        self.last: Dict[str, float] = {}
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self.on_stage_start is not None:
+            self.on_stage_start(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.last[name] = self.last.get(name, 0.0) + elapsed
+            self.totals[name] = self.totals.get(name, 0.0) + elapsed
+            self.counts[name] = self.counts.get(name, 0) + 1
+            if self.on_stage_end is not None:
+                self.on_stage_end(name, elapsed)
+
+    def start_document(self) -> None:
+        self.last = {}
+
+    def reset(self) -> None:
+        self.last = {}
+        self.totals = {}
+        self.counts = {}
+
+    def to_prometheus(
+        self,
+        name: str = "textsummarizer_stage_seconds",
+        labels: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """Накопленное время этапов как метрика типа summary (_sum и _count)."""
+        lines = [
+            f"# HELP {name} Время этапов саммаризации в секундах",
+            f"# TYPE {name} summary",
+        ]
+        for stage in _ordered(self.totals):
+            label_text = _format_labels(labels, stage)
+            lines.append(f"{name}_sum{label_text} {self.totals[stage]!r}")
+            lines.append(f"{name}_count{label_text} {self.counts[stage]}")
+        return "\n".join(lines) + "\n"
+
+
+def timings_to_prometheus(
+    timings: Mapping[str, float],
+    name: str = "textsummarizer_document_stage_seconds",
+    labels: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Время этапов одного документа (SummaryResult.timings) как gauge."""
+    lines = [
+        f"# HELP {name} Время этапов саммаризации документа в секундах",
+        f"# TYPE {name} gauge",
+    ]
+    for stage in _ordered(timings):
+        lines.append(f"{name}{_format_labels(labels, stage)} {timings[stage]!r}")
+    return "\n".join(lines) + "\n"
+
+
+def _ordered(values: Mapping[str, float]) -> list:
+    # Известные этапы - в порядке конвейера, пользовательские - после них.
+    known = [stage for stage in STAGES if stage in values]
+    return known + sorted(set(values) - set(STAGES))
+
+
+def _format_labels(labels: Optional[Mapping[str, str]], stage: str) -> str:
+    items = dict(labels or {})
+    items["stage"] = stage
+    escaped = (f'{key}="{_escape_label(str(value))}"' for key, value in items.items())
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,83 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """Собирает одиночные запросы в пачки и выполняет их одним вызовом.
+
+    Пачка уходит в run_batch, как только наберется max_size элементов или
+    пройдет max_delay секунд с первого элемента; max_delay - верхняя граница
+    добавочной задержки. run_batch возвращает по результату на элемент в том
+    же порядке; элемент-исключение передается только своему запросу.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_size: int = 32,
+        max_delay: float = 0.005,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size должен быть положительным")
+        if max_delay < 0:
+            raise ValueError("max_delay не может быть отрицательным")
+
+        self.run_batch = run_batch
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.batches = 0
+        self.items = 0
+
+        self._pending: List[Tuple[Any, "asyncio.Future[Any]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Any]" = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Запросы, которые уже отменены (например, по таймауту), не считаем.
+        batch = [(item, future) for item, future in self._pending if not future.done()]
+        self._pending = []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def close(self) -> None:
+        self.flush()
+        await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def _run(self, batch: List[Tuple[Any, "asyncio.Future[Any]"]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.run_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,524 @@
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+from . import batch
+from .batch import summary_stats_data
+from .entities import SummaryMethod, SummaryResult
+from .idf import (
+    CorpusSnapshotFile,
+    IdfSource,
+    OnlineCorpusStatistics,
+    load_corpus_statistics,
+    load_idf,
+)
+from .scheduler import MicroBatcher
+from .utils.keywords import KeywordsSource, load_keywords
+from .utils.text_processing import (
+    analyze_text,
+    calculate_document_readability,
+    check_segmenter,
+    check_tokenizer,
+)
+
+logger = logging.getLogger(__name__)
+
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    411: "Length Required",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+Job = Tuple[Callable[..., Any], Tuple[Any, ...], "asyncio.Future[Any]"]
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _dump_json(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+# Функции ниже выполняются в рабочих процессах и отдают готовый JSON, чтобы
+# родитель только пересылал байты.
+
+
+def _warmup() -> int:
+    return os.getpid()
+
+
+def _summarize_request(text: str, compression_ratio: float) -> bytes:
+    return _result_json(batch._worker_summarizer.summarize(text, compression_ratio))
+
+
+def _summarize_batch_request(items: List[Tuple[str, float]]) -> List[Union[bytes, str]]:
+    """Пачка запросов одной векторной оценкой; строка вместо JSON - ошибка."""
+    texts = [text for text, _ in items]
+    ratios = [ratio for _, ratio in items]
+    try:
+        results = batch._worker_summarizer.summarize_batch(texts, ratios)
+    except Exception:
+        # Повторяем по одному, чтобы ошибка одного текста не валила всю пачку.
+        return [_try_summarize(text, ratio) for text, ratio in items]
+    return [_result_json(result) for result in results]
+
+
+def _try_summarize(text: str, compression_ratio: float) -> Union[bytes, str]:
+    try:
+        return _summarize_request(text, compression_ratio)
+    except Exception as e:
+        return str(e)
+
+
+def _result_json(result: SummaryResult) -> bytes:
+    return _dump_json(
+        {
+            "summary_text": result.summary_text,
+            "sentences": [
+                {
+                    "text": sent.text,
+                    "position": sent.position,
+                    "importance_score": sent.importance_score,
+                }
+                for sent in result.important_sentences
+            ],
+            "statistics": summary_stats_data(result),
+        }
+    )
+
+
+def _analyze_request(text: str) -> bytes:
+    summarizer = batch._worker_summarizer
+    document = analyze_text(text, summarizer.segmenter, summarizer.tokenizer)
+    return _dump_json(
+        {
+            "sentences_count": len(document.sentences),
+            "metrics": calculate_document_readability(document.sentences),
+        }
+    )
+
+
+class SummaryServer:
+    """HTTP/1.1 сервис саммаризации на asyncio без внешних зависимостей.
+
+    Запросы попадают в ограниченную очередь (при переполнении - 503), откуда
+    их забирают по одному на рабочий процесс; в каждом процессе пула заранее
+    создан свой TextSummarizer. Соединения держатся открытыми (keep-alive),
+    пока клиент не закроет их или не простоит keepalive_timeout секунд.
+
+    При max_batch_size > 1 запросы /summarize собираются MicroBatcher в
+    пачки (до max_batch_size текстов или max_batch_delay секунд ожидания) и
+    занимают в очереди и пуле одно место на пачку.
+
+    С learn_idf сервер пополняет статистику корпуса текстами /summarize:
+    термины считаются в отдельном потоке родителя (OnlineCorpusStatistics),
+    снимок раз в idf_snapshot_interval секунд сохраняется в learn_idf, а
+    рабочие процессы подхватывают его через CorpusSnapshotFile. Если
+    обучение не успевает за запросами, лишние тексты пропускаются.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        method: SummaryMethod = SummaryMethod.FEATURE_BASED,
+        frequency_backend: str = "python",
+        workers: Optional[int] = None,
+        queue_size: int = 64,
+        request_timeout: float = 30.0,
+        keepalive_timeout: float = 5.0,
+        max_body_bytes: int = 10 * 1024 * 1024,
+        max_batch_size: int = 1,
+        max_batch_delay: float = 0.005,
+        keywords: Optional[KeywordsSource] = None,
+        segmenter: str = "legacy",
+        tokenizer: str = "legacy",
+        idf: Optional[IdfSource] = None,
+        learn_idf: Optional[Union[str, Path]] = None,
+        idf_snapshot_interval: float = 60.0,
+        idf_max_terms: int = 1_000_000,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size должен быть положительным")
+        check_segmenter(segmenter)
+        check_tokenizer(tokenizer)
+
+        self.host = host
+        self.port = port
+        self.method = method
+        self.frequency_backend = frequency_backend
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.request_timeout = request_timeout
+        self.keepalive_timeout = keepalive_timeout
+        self.max_body_bytes = max_body_bytes
+        self.keywords = load_keywords(keywords) if keywords is not None else None
+        self.segmenter = segmenter
+        self.tokenizer = tokenizer
+        self.idf = load_idf(idf)
+        self.learn_idf = Path(learn_idf) if learn_idf is not None else None
+        self.idf_snapshot_interval = idf_snapshot_interval
+
+        self._online_idf: Optional[OnlineCorpusStatistics] = None
+        self._learner: Optional[ThreadPoolExecutor] = None
+        self._learning = 0
+        if self.learn_idf is not None:
+            # Продолжаем с сохраненного снимка, иначе - с заданной статистики.
+            if self.learn_idf.exists():
+                base = load_corpus_statistics(self.learn_idf)
+            else:
+                base = self.idf.current() if self.idf is not None else None
+            self._online_idf = OnlineCorpusStatistics(
+                base,
+                max_terms=idf_max_terms,
+                tokenizer=tokenizer,
+                snapshot_path=self.learn_idf,
+                snapshot_interval=idf_snapshot_interval,
+            )
+
+        self._queue: Optional["asyncio.Queue[Job]"] = None
+        self._executor: Optional[Executor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._dispatchers: List["asyncio.Task[None]"] = []
+        self._connections: Set[asyncio.StreamWriter] = set()
+        self._batcher = (
+            MicroBatcher(
+                self._run_summarize_batch,
+                max_size=max_batch_size,
+                max_delay=max_batch_delay,
+            )
+            if max_batch_size > 1
+            else None
+        )
+        self._routes: Dict[str, Callable[[Dict[str, Any]], Awaitable[bytes]]] = {
+            "/summarize": self._summarize,
+            "/analyze": self._analyze,
+        }
+
+    @property
+    def queue(self) -> "asyncio.Queue[Job]":
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        return self._queue
+
+    async def start(self) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        idf = self.idf
+        if self._online_idf is not None:
+            self._online_idf.save(self.learn_idf)  # type: ignore[arg-type]
+            idf = CorpusSnapshotFile(
+                self.learn_idf,  # type: ignore[arg-type]
+                check_interval=min(self.idf_snapshot_interval, 5.0),
+            )
+            self._learner = ThreadPoolExecutor(max_workers=1)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=batch._init_worker,
+            initargs=(
+                self.method,
+                self.frequency_backend,
+                self.keywords,
+                self.segmenter,
+                idf,
+                self.tokenizer,
+            ),
+        )
+        # Поднимаем все процессы до первого запроса.
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _warmup)
+                for _ in range(self.workers)
+            )
+        )
+
+        self._dispatchers = [
+            asyncio.ensure_future(self._dispatch()) for _ in range(self.workers)
+        ]
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(
+            f"Сервер запущен на http://{self.host}:{self.port} "
+            f"(процессов: {self.workers}, очередь: {self.queue_size})"
+        )
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self._batcher is not None:
+            await self._batcher.close()
+
+        for writer in list(self._connections):
+            writer.close()
+
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._learner is not None:
+            self._learner.shutdown(wait=True)
+            self._learner = None
+            self._online_idf.save(self.learn_idf)  # type: ignore[union-attr,arg-type]
+
+    async def submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Ставит задачу в очередь и ждет ее не дольше request_timeout."""
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((func, args, future))
+        except asyncio.QueueFull:
+            raise HTTPError(503, "Очередь запросов переполнена")
+
+        try:
+            return await asyncio.wait_for(future, self.request_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPError(504, "Превышено время обработки запроса")
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            func, args, future = await self.queue.get()
+            # Запрос, чей клиент уже получил 504, в пул не отправляем.
+            if future.done():
+                continue
+            try:
+                result = await loop.run_in_executor(self._executor, func, *args)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), self.keepalive_timeout
+                    )
+                except (
+                    asyncio.TimeoutError,
+                    asyncio.IncompleteReadError,
+                    asyncio.LimitOverrunError,
+                    ConnectionError,
+                ):
+                    break
+
+                keep_alive = False
+                try:
+                    method, path, headers, keep_alive = self._parse_head(head)
+                    body = await self._read_body(reader, headers)
+                    status, response = 200, await self._route(method, path, body)
+                except HTTPError as e:
+                    status, response = e.status, _dump_json({"error": e.message})
+                    # После ошибок разбора тело могло остаться непрочитанным.
+                    keep_alive = keep_alive and e.status not in (400, 408, 411, 413)
+                except Exception as e:
+                    logger.error(f"Ошибка при обработке запроса: {e}")
+                    status, response = 500, _dump_json({"error": str(e)})
+
+                await self._write_response(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    def _parse_head(self, head: bytes) -> Tuple[str, str, Dict[str, str], bool]:
+        try:
+            lines = head.decode("latin-1").split("\r\n")
+            method, path, version = lines[0].split(" ")
+            headers = {}
+            for line in lines[1:]:
+                if line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            raise HTTPError(400, "Некорректный HTTP-запрос")
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+        return method.upper(), path, headers, keep_alive
+
+    async def _read_body(
+        self, reader: asyncio.StreamReader, headers: Dict[str, str]
+    ) -> bytes:
+        if "transfer-encoding" in headers:
+            raise HTTPError(501, "Transfer-Encoding не поддерживается")
+
+        length = headers.get("content-length")
+        if length is None:
+            return b""
+        try:
+            size = int(length)
+        except ValueError:
+            raise HTTPError(400, "Некорректный Content-Length")
+        if size > self.max_body_bytes:
+            raise HTTPError(413, f"Тело запроса больше {self.max_body_bytes} байт")
+
+        try:
+            return await asyncio.wait_for(
+                reader.readexactly(size), self.request_timeout
+            )
+        except asyncio.TimeoutError:
+            raise HTTPError(408, "Тело запроса не получено вовремя")
+
+    async def _route(self, method: str, path: str, body: bytes) -> bytes:
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            health = {
+                "status": "ok",
+                "workers": self.workers,
+                "queued": self.queue.qsize(),
+            }
+            if self._batcher is not None:
+                health["batches"] = self._batcher.batches
+                health["batched_requests"] = self._batcher.items
+            if self._online_idf is not None:
+                health["idf_documents"] = self._online_idf.num_documents
+                health["idf_terms"] = len(self._online_idf)
+            return _dump_json(health)
+
+        route = self._routes.get(path)
+        if route is None:
+            raise HTTPError(404, f"Неизвестный путь: {path}")
+        if method != "POST":
+            raise HTTPError(405, "Поддерживается только POST")
+
+        try:
+            payload = json.loads(body.decode("utf-8")) if body else None
+        except (UnicodeDecodeError, ValueError):
+            raise HTTPError(400, "Тело запроса должно быть JSON")
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "Тело запроса должно быть JSON-объектом")
+
+        return await route(payload)
+
+    def _text_arg(self, payload: Dict[str, Any]) -> str:
+        text = payload.get("text")
+        if not isinstance(text, str):
+            raise HTTPError(400, "Поле text должно быть строкой")
+        return text
+
+    async def _summarize(self, payload: Dict[str, Any]) -> bytes:
+        text = self._text_arg(payload)
+        ratio = payload.get("ratio", 0.3)
+        if (
+            not isinstance(ratio, (int, float))
+            or isinstance(ratio, bool)
+            or not 0 < ratio <= 1
+        ):
+            raise HTTPError(400, "ratio должен быть в диапазоне (0, 1]")
+
+        self._learn(text)
+        if self._batcher is not None:
+            return await self._batcher.submit((text, float(ratio)))
+        return await self.submit(_summarize_request, text, float(ratio))
+
+    def _learn(self, text: str) -> None:
+        if self._learner is None or self._learning >= self.queue_size:
+            return
+        self._learning += 1
+        future = asyncio.get_running_loop().run_in_executor(
+            self._learner,
+            self._online_idf.add_document,  # type: ignore[union-attr]
+            text,
+        )
+        future.add_done_callback(self._learned)
+
+    def _learned(self, future: "asyncio.Future[None]") -> None:
+        self._learning -= 1
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(
+                f"Ошибка при обновлении статистики корпуса: {future.exception()}"
+            )
+
+    async def _run_summarize_batch(
+        self, items: List[Tuple[str, float]]
+    ) -> List[Union[bytes, Exception]]:
+        results = await self.submit(_summarize_batch_request, items)
+        return [
+            HTTPError(500, result) if isinstance(result, str) else result
+            for result in results
+        ]
+
+    async def _analyze(self, payload: Dict[str, Any]) -> bytes:
+        return await self.submit(_analyze_request, self._text_arg(payload))
+
+    async def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: bytes,
+        keep_alive: bool,
+    ) -> None:
+        headers = [
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if keep_alive:
+            headers.append(f"Keep-Alive: timeout={int(self.keepalive_timeout)}")
+        if status == 503:
+            headers.append("Retry-After: 1")
+
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+def run_server(**kwargs: Any) -> None:
+    """Запускает SummaryServer и работает до Ctrl+C."""
+
+    async def main() -> None:
+        server = SummaryServer(**kwargs)
+        await server.start()
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Сервер остановлен")
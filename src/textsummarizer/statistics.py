@@ -1,29 +1,95 @@
-from .entities import TextStats, ReadabilityMetrics
+from typing import Dict, Iterable, Iterator, Sequence
+from .entities import (
+    TextStats,
+    ReadabilityMetrics,
+    AnalyzedDocument,
+    AnalyzedSentence,
+    Sentence,
+)
 from .utils.text_processing import (
-    split_into_sentences,
-    preprocess_text,
-    tokenize_words,
-    calculate_readability_metrics,
+    analyze_text,
+    analyze_sentence,
+    ReadabilityAccumulator,
 )
 
 
 class StatisticsCalculator:
     def calculate_stats(self, original: str, summary: str) -> TextStats:
-        original_sentences = split_into_sentences(original)
-        summary_sentences = split_into_sentences(summary)
+        return self.calculate_document_stats(
+            analyze_text(original), analyze_text(summary)
+        )
+
+    def calculate_document_stats(
+        self, original: AnalyzedDocument, summary: AnalyzedDocument
+    ) -> TextStats:
+        return self._build_stats(
+            self._original_accumulator(original), self._accumulate(summary.sentences)
+        )
 
-        original_processed = preprocess_text(
-            original, lowercase=True, remove_punctuation=True, remove_numbers=False
+    def calculate_summary_stats(
+        self, original: AnalyzedDocument, selected: Sequence[Sentence]
+    ) -> TextStats:
+        """Статистика саммари по уже разобранным выбранным предложениям."""
+        return self.calculate_accumulated_stats(
+            self._original_accumulator(original), selected
         )
-        summary_processed = preprocess_text(
-            summary, lowercase=True, remove_punctuation=True, remove_numbers=False
+
+    def calculate_accumulated_stats(
+        self, original: ReadabilityAccumulator, selected: Sequence[Sentence]
+    ) -> TextStats:
+        """Вариант для потоковой обработки, когда от оригинала есть только счетчики."""
+        summary_sentences = (
+            (
+                sent.analysis
+                if sent.analysis is not None
+                else analyze_sentence(sent.text, sent.position)
+            )
+            for sent in selected
         )
+        return self._build_stats(original, self._accumulate(summary_sentences))
+
+    def iter_ranked_stats(
+        self,
+        original: AnalyzedDocument,
+        ranking: Sequence[int],
+        sizes: Iterable[int],
+    ) -> Iterator[TextStats]:
+        """Статистика саммари из первых k предложений ranking для каждого k.
+
+        sizes должны идти по возрастанию: предложения добавляются к одному
+        накопителю, и каждое разбирается ровно один раз.
+        """
+        original_acc = self._original_accumulator(original)
+        summary_acc = ReadabilityAccumulator()
+        added = 0
+        for size in sizes:
+            if size < added:
+                raise ValueError("sizes должны идти по возрастанию")
+            summary_acc.update(original.sentences[idx] for idx in ranking[added:size])
+            added = size
+            yield self._build_stats(original_acc, summary_acc)
+
+    def _accumulate(
+        self, sentences: Iterable[AnalyzedSentence]
+    ) -> ReadabilityAccumulator:
+        accumulator = ReadabilityAccumulator()
+        accumulator.update(sentences)
+        return accumulator
 
-        original_words = tokenize_words(original_processed)
-        summary_words = tokenize_words(summary_processed)
+    def _original_accumulator(
+        self, original: AnalyzedDocument
+    ) -> ReadabilityAccumulator:
+        # Кэшируется в документе: при переборе коэффициентов сжатия
+        # оригинал агрегируется только один раз.
+        if original.readability is None:
+            original.readability = self._accumulate(original.sentences)
+        return original.readability
 
-        original_word_count = len(original_words)
-        summary_word_count = len(summary_words)
+    def _build_stats(
+        self, original_acc: ReadabilityAccumulator, summary: ReadabilityAccumulator
+    ) -> TextStats:
+        original_word_count = original_acc.total_words
+        summary_word_count = summary.total_words
 
         compression_ratio = (
             1 - (summary_word_count / original_word_count)
@@ -33,36 +99,24 @@ class StatisticsCalculator:
 
         reading_time_minutes = original_word_count / 200
 
-        original_readability_dict = calculate_readability_metrics(original)
-        summary_readability_dict = calculate_readability_metrics(summary)
-
-        original_readability = ReadabilityMetrics(
-            flesch_score=original_readability_dict.get("flesch_score", 0),
-            avg_sentence_length=original_readability_dict.get("avg_sentence_length", 0),
-            avg_word_length=original_readability_dict.get("avg_word_length", 0),
-            lexical_diversity=original_readability_dict.get("lexical_diversity", 0),
-            total_sentences=original_readability_dict.get("total_sentences", 0),
-            total_words=original_readability_dict.get("total_words", 0),
-            unique_words=original_readability_dict.get("unique_words", 0),
-        )
-
-        summary_readability = ReadabilityMetrics(
-            flesch_score=summary_readability_dict.get("flesch_score", 0),
-            avg_sentence_length=summary_readability_dict.get("avg_sentence_length", 0),
-            avg_word_length=summary_readability_dict.get("avg_word_length", 0),
-            lexical_diversity=summary_readability_dict.get("lexical_diversity", 0),
-            total_sentences=summary_readability_dict.get("total_sentences", 0),
-            total_words=summary_readability_dict.get("total_words", 0),
-            unique_words=summary_readability_dict.get("unique_words", 0),
-        )
-
         return TextStats(
-            original_sentences_count=len(original_sentences),
+            original_sentences_count=original_acc.total_sentences,
             original_words_count=original_word_count,
-            summary_sentences_count=len(summary_sentences),
+            summary_sentences_count=summary.total_sentences,
             summary_words_count=summary_word_count,
             compression_ratio=compression_ratio,
             reading_time_minutes=reading_time_minutes,
-            original_readability=original_readability,
-            summary_readability=summary_readability,
+            original_readability=self._build_readability(original_acc.metrics()),
+            summary_readability=self._build_readability(summary.metrics()),
+        )
+
+    def _build_readability(self, metrics: Dict[str, float]) -> ReadabilityMetrics:
+        return ReadabilityMetrics(
+            flesch_score=metrics.get("flesch_score", 0),
+            avg_sentence_length=metrics.get("avg_sentence_length", 0),
+            avg_word_length=metrics.get("avg_word_length", 0),
+            lexical_diversity=metrics.get("lexical_diversity", 0),
+            total_sentences=metrics.get("total_sentences", 0),
+            total_words=metrics.get("total_words", 0),
+            unique_words=metrics.get("unique_words", 0),
         )
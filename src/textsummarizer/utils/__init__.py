@@ -1,30 +1,87 @@
-from .file_io import read_text_file, write_text_file, save_json, load_json, save_csv
+from .file_io import (
+    read_text_file,
+    read_text_chunks,
+    read_text_mmap,
+    open_document,
+    MappedDocument,
+    write_text_file,
+    save_json,
+    load_json,
+    save_csv,
+)
+from .keywords import KeywordSet, load_keywords
+from .normalization import TextNormalizer
+from .segmenter import SentenceSegmenter
+from .vocabulary import Vocabulary, EncodedDocument, encode_document
 from .text_processing import (
     split_into_sentences,
+    iter_sentences,
+    iter_analyzed_sentences,
     preprocess_text,
     tokenize_words,
+    tokenize_text,
     calculate_word_frequencies,
     calculate_readability_metrics,
+    calculate_document_readability,
+    calculate_tokens_readability,
+    ReadabilityAccumulator,
+    count_syllables,
+    analyze_sentence,
+    analyze_sentences,
+    analyze_text,
     extract_named_entities,
 )
-from .vizualization import (
-    plot_sentence_scores,
-    plot_summary_comparison,
-    plot_word_frequencies,
-    plot_readability_metrics,
+
+# matplotlib загружается только при первом обращении к функциям построения
+# графиков, чтобы импорт пакета и CLI без --visualize оставались быстрыми.
+_PLOT_FUNCTIONS = (
+    "plot_sentence_scores",
+    "plot_summary_comparison",
+    "plot_word_frequencies",
+    "plot_readability_metrics",
 )
 
+
+def __getattr__(name):
+    if name in _PLOT_FUNCTIONS:
+        from . import vizualization
+
+        return getattr(vizualization, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "read_text_file",
+    "read_text_chunks",
+    "read_text_mmap",
+    "open_document",
+    "MappedDocument",
     "write_text_file",
     "save_json",
     "load_json",
     "save_csv",
+    "KeywordSet",
+    "load_keywords",
+    "TextNormalizer",
+    "SentenceSegmenter",
+    "Vocabulary",
+    "EncodedDocument",
+    "encode_document",
     "split_into_sentences",
+    "iter_sentences",
+    "iter_analyzed_sentences",
     "preprocess_text",
     "tokenize_words",
+    "tokenize_text",
     "calculate_word_frequencies",
     "calculate_readability_metrics",
+    "calculate_document_readability",
+    "calculate_tokens_readability",
+    "ReadabilityAccumulator",
+    "count_syllables",
+    "analyze_sentence",
+    "analyze_sentences",
+    "analyze_text",
     "extract_named_entities",
     "plot_sentence_scores",
     "plot_summary_comparison",
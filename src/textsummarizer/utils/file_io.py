@@ -1,8 +1,14 @@
+import codecs
 import json
 import csv
+import mmap
+import re
+from array import array
 from pathlib import Path
-from typing import Dict, List, Any, Union
+from typing import Dict, Iterator, List, Any, Tuple, Union
 import logging
+from ..entities import AnalyzedSentence, Sentence
+from .text_processing import analyze_sentence
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,141 @@ def read_text_file(filepath: Union[str, Path], encoding: str = "utf-8") -> str:
         raise
 
 
+def read_text_chunks(
+    filepath: Union[str, Path], chunk_size: int = 1 << 20, encoding: str = "utf-8"
+) -> Iterator[str]:
+    path = Path(filepath)
+
+    if not path.exists():
+        error_msg = f"Файл не найден: {filepath}"
+        logger.error(error_msg)
+        raise FileNotFoundError(error_msg)
+
+    with open(path, "r", encoding=encoding) as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def read_text_mmap(filepath: Union[str, Path]) -> Union[mmap.mmap, bytes]:
+    """Отображает файл в память только для чтения (пустой файл -> b"")."""
+    path = Path(filepath)
+
+    if not path.exists():
+        error_msg = f"Файл не найден: {filepath}"
+        logger.error(error_msg)
+        raise FileNotFoundError(error_msg)
+
+    if path.stat().st_size == 0:
+        return b""
+
+    with open(path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# Тело предложения без окружающих пробелов: от первого до последнего значимого
+# байта между концами предложений. Терминаторы ASCII, поэтому поиск по байтам
+# UTF-8 не может попасть внутрь многобайтового символа.
+_SENTENCE_SPAN_RE = re.compile(rb"[^.!?\s](?:[^.!?]*[^.!?\s])?")
+
+# Символы, которые ищет _SENTENCE_SPAN_RE.
+_SPAN_DELIMITERS = ".!? \t\n\r\f\v"
+
+
+def check_mmap_encoding(encoding: str) -> None:
+    """Проверяет, что кодировка записывает разделители теми же байтами, что ASCII.
+
+    Границы в MappedDocument ищутся по байтам, поэтому UTF-16 и UTF-32
+    разбивались бы неверно. Метка BOM (utf-8-sig) не мешает: она стоит
+    только в начале файла.
+    """
+    try:
+        encoder = codecs.getincrementalencoder(encoding)()
+    except LookupError:
+        raise ValueError(f"Неизвестная кодировка: {encoding}") from None
+    encoder.encode("a")
+    if encoder.encode(_SPAN_DELIMITERS) != _SPAN_DELIMITERS.encode("ascii"):
+        raise ValueError(
+            f"Кодировка {encoding} несовместима с ASCII и не поддерживается mmap"
+        )
+
+
+class MappedDocument:
+    """Документ в mmap с границами предложений в виде байтовых смещений.
+
+    Строки создаются только при обращении к тексту конкретного предложения.
+    Отображением владеет тот, кто создал документ: предложения из sentence()
+    читают текст из него и после close() недоступны.
+    """
+
+    def __init__(self, buffer: Union[mmap.mmap, bytes], encoding: str = "utf-8"):
+        check_mmap_encoding(encoding)
+        self.buffer = buffer
+        self.encoding = encoding
+        self.starts = array("q")
+        self.ends = array("q")
+
+        for match in _SENTENCE_SPAN_RE.finditer(buffer):
+            self.starts.append(match.start())
+            self.ends.append(match.end())
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __enter__(self) -> "MappedDocument":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def span(self, position: int) -> Tuple[int, int]:
+        return self.starts[position], self.ends[position]
+
+    def decode(self, start: int, end: int) -> str:
+        return self.buffer[start:end].decode(self.encoding).replace("\n", " ")
+
+    def text(self, position: int) -> str:
+        return self.decode(*self.span(position))
+
+    def iter_texts(self) -> Iterator[str]:
+        for position in range(len(self)):
+            yield self.text(position)
+
+    def analyzed_sentences(
+        self, tokenizer: str = "legacy"
+    ) -> Iterator[AnalyzedSentence]:
+        for position in range(len(self)):
+            analyzed = analyze_sentence(self.text(position), position, tokenizer)
+            analyzed.span = self.span(position)
+            yield analyzed
+
+    def sentence(self, position: int) -> Sentence:
+        return Sentence(
+            text=None, position=position, span=self.span(position), source=self
+        )
+
+    def summary_slices(self, sentences: List[Sentence]) -> List[memoryview]:
+        """Байтовые срезы выбранных предложений без копирования."""
+        view = memoryview(self.buffer)
+        return [view[start:end] for start, end in (s.span for s in sentences)]
+
+
+def open_document(
+    filepath: Union[str, Path], encoding: str = "utf-8"
+) -> MappedDocument:
+    """Отображает файл в память; закрывать его (close или with) - вызывающему."""
+    check_mmap_encoding(encoding)
+    document = MappedDocument(read_text_mmap(filepath), encoding=encoding)
+    logger.info(f"Файл отображен в память: {filepath} ({len(document)} предложений)")
+    return document
+
+
 def write_text_file(
     filepath: Union[str, Path], content: str, encoding: str = "utf-8"
 ) -> None:
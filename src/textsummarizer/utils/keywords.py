@@ -0,0 +1,171 @@
+import hashlib
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEYWORDS = (
+    "важно",
+    "следовательно",
+    "итог",
+    "вывод",
+    "заключение",
+    "основной",
+    "главный",
+    "результат",
+    "цель",
+    "задача",
+    "проблема",
+    "решение",
+    "метод",
+    "способ",
+    "алгоритм",
+    "анализ",
+    "исследование",
+    "эксперимент",
+    "доказательство",
+)
+
+
+class KeywordSet:
+    """Набор ключевых слов, скомпилированный для поиска за один проход.
+
+    count(text) возвращает число разных ключевых слов, входящих в text как
+    подстроки (то же, что sum(kw in text for kw in keywords)). Наборы больше
+    SCAN_THRESHOLD компилируются в автомат Ахо-Корасик, и время поиска не
+    зависит от числа слов; для маленьких наборов отдельные проверки `in`
+    выполняются в C и обходятся дешевле обхода автомата на Python.
+    """
+
+    # Точка безубыточности на предложениях из ~20 слов: проверка `in` стоит
+    # ~0.1 мкс на слово, проход автомата ~15 мкс на предложение.
+    SCAN_THRESHOLD = 128
+
+    def __init__(self, keywords: Iterable[str], scan_threshold: Optional[int] = None):
+        self.keywords: FrozenSet[str] = frozenset(
+            kw.strip().lower() for kw in keywords if kw and kw.strip()
+        )
+        self.scan_threshold = (
+            self.SCAN_THRESHOLD if scan_threshold is None else scan_threshold
+        )
+
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._output: List[int] = []
+        self._alphabet: FrozenSet[str] = frozenset()
+        self._fingerprint: Optional[str] = None
+        if len(self.keywords) > self.scan_threshold:
+            self._build_automaton()
+
+    @classmethod
+    def from_file(
+        cls, filepath: Union[str, Path], encoding: str = "utf-8"
+    ) -> "KeywordSet":
+        """Одно ключевое слово или фраза на строку; строки с # пропускаются."""
+        path = Path(filepath)
+        if not path.exists():
+            error_msg = f"Файл ключевых слов не найден: {filepath}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        with open(path, "r", encoding=encoding) as f:
+            keywords = cls(
+                line for line in f if line.strip() and not line.lstrip().startswith("#")
+            )
+
+        logger.info(f"Загружено ключевых слов: {len(keywords)} из {filepath}")
+        return keywords
+
+    @property
+    def compiled(self) -> bool:
+        return bool(self._goto)
+
+    @property
+    def fingerprint(self) -> str:
+        """Хэш набора для ключа кэша; не зависит от порядка слов."""
+        if self._fingerprint is None:
+            digest = hashlib.sha256("\n".join(sorted(self.keywords)).encode("utf-8"))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keywords)
+
+    def __contains__(self, keyword: object) -> bool:
+        return keyword in self.keywords
+
+    def count(self, text_lower: str) -> int:
+        """Число разных ключевых слов в тексте, уже приведенном к нижнему регистру."""
+        if not self._goto:
+            return sum(1 for kw in self.keywords if kw in text_lower)
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+
+        found = 0
+        state = 0
+        for ch in text_lower:
+            if ch not in alphabet:
+                state = 0
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found |= output[state]
+        return bin(found).count("1")
+
+    def _build_automaton(self) -> None:
+        # Выход состояния - битовая маска найденных слов, уже объединенная с
+        # выходами по суффиксным ссылкам.
+        goto: List[Dict[str, int]] = [{}]
+        output = [0]
+        for bit, keyword in enumerate(sorted(self.keywords)):
+            state = 0
+            for ch in keyword:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    output.append(0)
+                state = next_state
+            output[state] |= 1 << bit
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                fail[next_state] = goto[link].get(ch, 0)
+                output[next_state] |= output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+        self._alphabet = frozenset(ch for keyword in self.keywords for ch in keyword)
+
+
+# Готовый набор, список слов или путь к файлу со словами.
+KeywordsSource = Union[KeywordSet, Iterable[str], str, Path]
+
+
+def load_keywords(keywords: Optional[KeywordsSource] = None) -> KeywordSet:
+    if keywords is None:
+        return KeywordSet(DEFAULT_KEYWORDS)
+    if isinstance(keywords, KeywordSet):
+        return keywords
+    if isinstance(keywords, (str, Path)):
+        return KeywordSet.from_file(keywords)
+    return KeywordSet(keywords)
@@ -0,0 +1,147 @@
+import re
+import string
+from typing import List, Sequence
+
+PUNCTUATION = string.punctuation + '«»—"'
+
+# Разделитель для пакетной нормализации: в тексте предложений его не бывает,
+# а если встретится - пакет нормализуется по одному.
+_BATCH_SEPARATOR = "\0"
+
+# Слово для токенизатора unicode: буквы и цифры любого алфавита и "_" (\w),
+# а также комбинируемые диакритики - знаки ударения и точка, которую lower()
+# добавляет к "İ". Все остальное, включая тире и многоточие, - разделитель.
+WORD_PATTERN = r"[\w\u0300-\u036f]+"
+
+
+class TextNormalizer:
+    """Нормализация текста с заранее собранными таблицами и выражениями.
+
+    Один объект (DEFAULT_NORMALIZER) используется всеми модулями пакета,
+    поэтому таблица удаления пунктуации и регулярные выражения строятся
+    один раз при импорте, а не при каждом вызове. normalize_many
+    нормализует пачку предложений несколькими вызовами в C на всю пачку.
+    """
+
+    def __init__(self, punctuation: str = PUNCTUATION):
+        self.punctuation = punctuation
+        self._remove_punctuation = str.maketrans("", "", punctuation)
+        self._punctuation_runs = re.compile(f"[{re.escape(punctuation)}]+")
+        self._numbers = re.compile(r"\d+")
+        self._digit = re.compile(r"\d")
+        self._non_word = re.compile(r"[^\w\s]")
+        self.sentence_endings = re.compile(r"[.!?]+")
+        self._word = re.compile(WORD_PATTERN)
+
+    def normalize(
+        self,
+        text: str,
+        lowercase: bool = True,
+        remove_punctuation: bool = True,
+        remove_numbers: bool = False,
+    ) -> str:
+        if not text:
+            return ""
+        text = self._transform(text, lowercase, remove_punctuation, remove_numbers)
+        # str.split() и \s в re считают пробелами одни и те же символы.
+        return " ".join(text.split())
+
+    def normalize_many(
+        self,
+        sentences: Sequence[str],
+        lowercase: bool = True,
+        remove_punctuation: bool = True,
+        remove_numbers: bool = False,
+    ) -> List[str]:
+        """То же, что [normalize(s) for s in sentences], пачкой."""
+        return [
+            " ".join(s.split())
+            for s in self._transform_many(
+                sentences, lowercase, remove_punctuation, remove_numbers
+            )
+        ]
+
+    def _transform_many(
+        self,
+        sentences: Sequence[str],
+        lowercase: bool,
+        remove_punctuation: bool,
+        remove_numbers: bool,
+    ) -> List[str]:
+        joined = _BATCH_SEPARATOR.join(sentences)
+        if _BATCH_SEPARATOR in self.punctuation or (
+            joined.count(_BATCH_SEPARATOR) != max(len(sentences) - 1, 0)
+        ):
+            return [
+                self._transform(s, lowercase, remove_punctuation, remove_numbers)
+                for s in sentences
+            ]
+        if not sentences:
+            return []
+
+        # Регистр и пунктуация не зависят от границ предложений (\0 не буква
+        # и не меняется при lower), поэтому обрабатываются одной строкой.
+        processed = self._transform(
+            joined, lowercase, remove_punctuation, remove_numbers
+        )
+        return processed.split(_BATCH_SEPARATOR)
+
+    def _transform(
+        self,
+        text: str,
+        lowercase: bool,
+        remove_punctuation: bool,
+        remove_numbers: bool,
+    ) -> str:
+        if lowercase:
+            text = text.lower()
+        if remove_punctuation:
+            text = self._strip_punctuation(text)
+        if remove_numbers:
+            text = self._numbers.sub("", text)
+        return text
+
+    def _strip_punctuation(self, text: str) -> str:
+        # translate быстр только на ASCII-строках: для остальных он ищет в
+        # таблице каждый символ, и на кириллице регулярное выражение
+        # в несколько раз быстрее.
+        if text.isascii():
+            return text.translate(self._remove_punctuation)
+        return self._punctuation_runs.sub("", text)
+
+    def tokens(self, text: str) -> List[str]:
+        """Токены предложения: нормализованный текст, разбитый по пробелам."""
+        if not text:
+            return []
+        return self._strip_punctuation(text.lower()).split()
+
+    def tokens_many(self, sentences: Sequence[str]) -> List[List[str]]:
+        return [s.split() for s in self._transform_many(sentences, True, True, False)]
+
+    def word_tokens(self, text: str) -> List[str]:
+        """Слова в нижнем регистре одним проходом регулярного выражения.
+
+        Замена цепочки tokenize_words(preprocess_text(text)), которая
+        удаляет только пунктуацию из punctuation и склеивает слова через
+        удаленные знаки ("кое-как" -> "коекак").
+        """
+        return self._word.findall(text.lower())
+
+    def word_tokens_many(self, sentences: Sequence[str]) -> List[List[str]]:
+        findall = self._word.findall
+        return [findall(sentence.lower()) for sentence in sentences]
+
+    def words(self, text: str) -> List[str]:
+        """Слова без учета набора punctuation: любой не-буквенный знак - пробел."""
+        return self._non_word.sub(" ", text).lower().split()
+
+    def split_sentences(self, text: str) -> List[str]:
+        """Разбиение legacy: по каждой группе [.!?]."""
+        text = text.replace("\n", " ").strip()
+        return [s.strip() for s in self.sentence_endings.split(text) if s.strip()]
+
+    def has_digits(self, text: str) -> bool:
+        return self._digit.search(text) is not None
+
+
+DEFAULT_NORMALIZER = TextNormalizer()
@@ -0,0 +1,228 @@
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+# Сокращения, после которых предложение не заканчивается: точка перед ними
+# не считается границей. Сокращения, которыми предложение может закончиться
+# ("т.д.", "т.п.", "etc."), сюда не входят: граница после них ставится, если
+# следующее слово начинается не со строчной буквы. Записываются в нижнем
+# регистре без последней точки.
+RUSSIAN_ABBREVIATIONS = (
+    "г",
+    "гг",
+    "ул",
+    "пр",
+    "пл",
+    "д",
+    "кв",
+    "корп",
+    "стр",
+    "рис",
+    "табл",
+    "гл",
+    "п",
+    "пп",
+    "т",
+    "тт",
+    "проф",
+    "доц",
+    "акад",
+    "напр",
+    "ср",
+    "прим",
+    "т.е",
+    "т.к",
+    "т.н",
+    "т.о",
+    "и.о",
+)
+
+ENGLISH_ABBREVIATIONS = (
+    "mr",
+    "mrs",
+    "ms",
+    "dr",
+    "prof",
+    "sr",
+    "jr",
+    "fig",
+    "vol",
+    "pp",
+    "approx",
+    "dept",
+    "e.g",
+    "i.e",
+    "cf",
+)
+
+DEFAULT_ABBREVIATIONS = RUSSIAN_ABBREVIATIONS + ENGLISH_ABBREVIATIONS
+
+# Сокращения, совпадающие с обычными словами ("им", "ок", "no") или
+# единицами, которыми часто заканчивается предложение ("5 см."). Точка после
+# них - граница, если дальше не строчная буква и не цифра ("с. 5", "No. 7").
+RUSSIAN_AMBIGUOUS_ABBREVIATIONS = (
+    "с",
+    "см",
+    "им",
+    "ок",
+    "руб",
+    "коп",
+    "тыс",
+    "млн",
+    "млрд",
+)
+
+ENGLISH_AMBIGUOUS_ABBREVIATIONS = ("no", "st", "vs")
+
+DEFAULT_AMBIGUOUS_ABBREVIATIONS = (
+    RUSSIAN_AMBIGUOUS_ABBREVIATIONS + ENGLISH_AMBIGUOUS_ABBREVIATIONS
+)
+
+Span = Tuple[int, int]
+
+# Сколько символов после границы читают проверки выражения (фамилия после
+# инициала): в потоковом режиме граница ближе к концу буфера ждет следующего
+# фрагмента.
+_LOOKAHEAD = 3
+
+
+def _after_abbreviation(abbreviations: Iterable[str]) -> List[str]:
+    # Ретроспективная проверка должна иметь фиксированную ширину, поэтому
+    # сокращения одной длины объединяются в одну проверку "стоим сразу после
+    # сокращения с точкой".
+    by_length: Dict[int, List[str]] = {}
+    for abbr in {a.strip().lower().rstrip(".") for a in abbreviations}:
+        if abbr:
+            by_length.setdefault(len(abbr), []).append(re.escape(abbr))
+    return [
+        rf"(?<=(?<![\w.])(?i:{'|'.join(sorted(by_length[length]))})\.)"
+        for length in sorted(by_length)
+    ]
+
+
+def _compile_boundary(
+    abbreviations: Iterable[str], ambiguous_abbreviations: Iterable[str] = ()
+) -> Pattern[str]:
+    # Вся логика границ собрана в одно регулярное выражение, чтобы проход по
+    # тексту и проверки сокращений выполнялись в C; на Python остается только
+    # нарезка найденных предложений. Выражение начинается с класса [.!?],
+    # поэтому движок быстро пропускает текст между знаками конца, а все
+    # проверки идут уже после первого знака.
+    opening = r"[\s\"'«»“”„()\[\]]*"
+    not_abbreviation = "".join(
+        f"(?!{after})" for after in _after_abbreviation(abbreviations)
+    )
+    not_ambiguous = "".join(
+        rf"(?!{after}{opening}\d)"
+        for after in _after_abbreviation(ambiguous_abbreviations)
+    )
+    # Инициал - заглавная буква с точкой перед следующим инициалом или
+    # фамилией ("А. С. Пушкин"); "Я. Ты. Мы." - три предложения.
+    not_initial = r"(?!(?<=\b[A-ZА-ЯЁ]\.)\s+(?:[A-ZА-ЯЁ]\.|[A-ZА-ЯЁ][a-zа-яё]{2,}))"
+    return re.compile(
+        r"[.!?](?<![.!?][.!?])"
+        r"(?:"
+        # ! и ? всегда заканчивают предложение, как в legacy.
+        r"(?<=[!?])[.!?]*"
+        r"|[.!?]*[!?][.!?]*"
+        r"|"
+        # Точка - только не после сокращения или инициала, не внутри числа
+        # или слова ("3.14", "т.е") и не перед строчной буквой. В конце
+        # текста точка после сокращения тоже граница: знак конца в текст
+        # предложения не входит.
+        rf"(?:(?=\.*\s*\Z)|{not_abbreviation}{not_ambiguous}{not_initial})"
+        rf"\.*(?=\W|\Z)(?!{opening}[a-zа-яё])"
+        r")"
+        r"(?![.!?])"
+        # Пробелы и закрывающие кавычки после конца относятся к разделителю.
+        r"[\s»”)\]]*"
+    )
+
+
+class SentenceSegmenter:
+    """Разбиение на предложения за один проход со смещениями в исходном тексте.
+
+    В отличие от split_into_sentences с segmenter="legacy", не делит текст
+    на десятичных дробях и сокращениях из abbreviations; сокращения из
+    ambiguous_abbreviations не дают границы только перед строчной буквой или
+    цифрой. Как и legacy, знаки конца предложения в текст предложения не
+    входят, в том числе точка сокращения в конце текста.
+    """
+
+    def __init__(
+        self,
+        abbreviations: Optional[Iterable[str]] = None,
+        ambiguous_abbreviations: Optional[Iterable[str]] = None,
+    ):
+        self.abbreviations = tuple(
+            DEFAULT_ABBREVIATIONS if abbreviations is None else abbreviations
+        )
+        self.ambiguous_abbreviations = tuple(
+            DEFAULT_AMBIGUOUS_ABBREVIATIONS
+            if ambiguous_abbreviations is None
+            else ambiguous_abbreviations
+        )
+        self._boundary = _compile_boundary(
+            self.abbreviations, self.ambiguous_abbreviations
+        )
+        self._leading_space = re.compile(r"[\s»”)\]]*")
+
+    def spans(self, text: str) -> List[Span]:
+        """Смещения (начало, конец) предложений в text."""
+        spans, _ = self._scan(text, final=True)
+        return spans
+
+    def split(self, text: str) -> List[str]:
+        if not text:
+            return []
+        return [self._sentence(text, start, end) for start, end in self.spans(text)]
+
+    def iter_sentences(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Потоковый вариант split; в памяти держится только хвост буфера."""
+        tail = ""
+        for chunk in chunks:
+            buffer = tail + chunk
+            spans, resume = self._scan(buffer, final=False)
+            for start, end in spans:
+                yield self._sentence(buffer, start, end)
+            tail = buffer[resume:]
+
+        for start, end in self.spans(tail):
+            yield self._sentence(tail, start, end)
+
+    def _scan(self, text: str, final: bool) -> Tuple[List[Span], int]:
+        # Возвращает найденные предложения и позицию, с которой начинается
+        # неразобранный хвост. При final=False граница у самого конца текста
+        # не принимается: решение зависит от следующего фрагмента.
+        spans: List[Span] = []
+        start = self._leading_space.match(text).end()
+        length = len(text)
+
+        for match in self._boundary.finditer(text, start):
+            if not final and length - match.end() < _LOOKAHEAD:
+                return spans, start
+            end = match.start()
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            if end > start:
+                spans.append((start, end))
+            start = match.end()
+
+        if not final:
+            return spans, start
+
+        end = length
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if end > start:
+            spans.append((start, end))
+        return spans, length
+
+    @staticmethod
+    def _sentence(text: str, start: int, end: int) -> str:
+        sentence = text[start:end]
+        if "\n" in sentence:
+            sentence = sentence.replace("\n", " ")
+        return sentence
+
+
+DEFAULT_SEGMENTER = SentenceSegmenter()
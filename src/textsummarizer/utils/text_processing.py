@@ -1,52 +1,103 @@
 import re
-import string
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Sequence, Optional, Iterable, Iterator, Set
 import math
 from collections import Counter
+from functools import lru_cache
 import logging
+from ..entities import AnalyzedSentence, AnalyzedDocument
+from .normalization import DEFAULT_NORMALIZER
+from .segmenter import DEFAULT_SEGMENTER
 
 logger = logging.getLogger(__name__)
 
+# legacy - исходное разбиение по [.!?]+, fast - SentenceSegmenter, который
+# не делит текст на сокращениях и десятичных дробях.
+SEGMENTERS = ("legacy", "fast")
 
-def split_into_sentences(text: str) -> List[str]:
+# legacy - tokenize_words(preprocess_text(...)), unicode - слова \w+ в нижнем
+# регистре за один проход; тире, многоточия и апострофы разделяют слова.
+TOKENIZERS = ("legacy", "unicode")
+
+
+def check_segmenter(segmenter: str) -> None:
+    if segmenter not in SEGMENTERS:
+        raise ValueError(
+            f"Неизвестный способ разбиения на предложения: {segmenter} "
+            f"(доступны: {', '.join(SEGMENTERS)})"
+        )
+
+
+def check_tokenizer(tokenizer: str) -> None:
+    if tokenizer not in TOKENIZERS:
+        raise ValueError(
+            f"Неизвестный токенизатор: {tokenizer} "
+            f"(доступны: {', '.join(TOKENIZERS)})"
+        )
+
+
+def split_into_sentences(text: str, segmenter: str = "legacy") -> List[str]:
     if not text or not isinstance(text, str):
         return []
 
-    text = text.replace("\n", " ").strip()
-
-    sentence_endings = re.compile(r"[.!?]+")
-    sentences = sentence_endings.split(text)
+    if segmenter != "legacy":
+        check_segmenter(segmenter)
+        sentences = DEFAULT_SEGMENTER.split(text)
+        logger.debug(f"Текст разделен на {len(sentences)} предложений")
+        return sentences
 
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentences = DEFAULT_NORMALIZER.split_sentences(text)
 
     logger.debug(f"Текст разделен на {len(sentences)} предложений")
     return sentences
 
 
+def iter_sentences(chunks: Iterable[str], segmenter: str = "legacy") -> Iterator[str]:
+    """Потоковый аналог split_into_sentences по последовательности фрагментов.
+
+    В памяти держится только хвост после последнего конца предложения.
+    """
+    if segmenter != "legacy":
+        check_segmenter(segmenter)
+        yield from DEFAULT_SEGMENTER.iter_sentences(chunks)
+        return
+
+    sentence_endings = DEFAULT_NORMALIZER.sentence_endings
+    tail = ""
+
+    for chunk in chunks:
+        buffer = tail + chunk.replace("\n", " ")
+        last_end = 0
+        for match in sentence_endings.finditer(buffer):
+            sentence = buffer[last_end : match.start()].strip()
+            if sentence:
+                yield sentence
+            last_end = match.end()
+        tail = buffer[last_end:]
+
+    sentence = tail.strip()
+    if sentence:
+        yield sentence
+
+
+def iter_analyzed_sentences(
+    chunks: Iterable[str], segmenter: str = "legacy", tokenizer: str = "legacy"
+) -> Iterator[AnalyzedSentence]:
+    for position, sentence in enumerate(iter_sentences(chunks, segmenter)):
+        yield analyze_sentence(sentence, position, tokenizer)
+
+
 def preprocess_text(
     text: str,
     lowercase: bool = True,
     remove_punctuation: bool = True,
     remove_numbers: bool = False,
 ) -> str:
-    if not text:
-        return ""
-
-    processed = text
-    if lowercase:
-        processed = processed.lower()
-
-    if remove_punctuation:
-        processed = processed.translate(
-            str.maketrans("", "", string.punctuation + '«»—"')
-        )
-
-    if remove_numbers:
-        processed = re.sub(r"\d+", "", processed)
-
-    processed = re.sub(r"\s+", " ", processed).strip()
-
-    return processed
+    return DEFAULT_NORMALIZER.normalize(
+        text,
+        lowercase=lowercase,
+        remove_punctuation=remove_punctuation,
+        remove_numbers=remove_numbers,
+    )
 
 
 def tokenize_words(text: str) -> List[str]:
@@ -59,6 +110,23 @@ def tokenize_words(text: str) -> List[str]:
     return words
 
 
+def tokenize_text(text: str, tokenizer: str = "legacy") -> List[str]:
+    """Токены текста; с legacy - то же, что tokenize_words(preprocess_text(text))."""
+    if tokenizer == "legacy":
+        return DEFAULT_NORMALIZER.tokens(text)
+    check_tokenizer(tokenizer)
+    return DEFAULT_NORMALIZER.word_tokens(text)
+
+
+def tokenize_many(
+    sentences: Sequence[str], tokenizer: str = "legacy"
+) -> List[List[str]]:
+    if tokenizer == "legacy":
+        return DEFAULT_NORMALIZER.tokens_many(sentences)
+    check_tokenizer(tokenizer)
+    return DEFAULT_NORMALIZER.word_tokens_many(sentences)
+
+
 def calculate_word_frequencies(words: List[str]) -> Dict[str, float]:
     if not words:
         return {}
@@ -71,47 +139,164 @@ def calculate_word_frequencies(words: List[str]) -> Dict[str, float]:
     return frequencies
 
 
-def calculate_readability_metrics(text: str) -> Dict[str, float]:
-    sentences = split_into_sentences(text)
-    words = tokenize_words(preprocess_text(text, remove_punctuation=True))
+# Словарь токенов живого текста растет медленно, поэтому даже на больших
+# корпусах почти все токены попадают в кэш.
+SYLLABLE_CACHE_SIZE = 1 << 16
 
-    if not sentences or not words:
-        return {}
+_NOT_VOWELS = re.compile(r"[^аеёиоуыэюяaeiouy]")
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def count_syllables(word: str) -> int:
+    """Число слогов (гласных) в слове; результаты кэшируются в процессе."""
+    return len(_NOT_VOWELS.sub("", word.lower()))
 
-    total_sentences = len(sentences)
-    total_words = len(words)
 
-    def count_syllables(word: str) -> int:
-        vowels = "аеёиоуыэюяaeiouy"
-        return sum(1 for char in word.lower() if char in vowels)
+def count_syllables_many(tokens: Iterable[str]) -> int:
+    return sum(map(count_syllables, tokens))
 
-    total_syllables = sum(count_syllables(word) for word in words)
 
-    flesch_score = (
+def flesch_reading_ease(
+    total_sentences: int, total_words: int, total_syllables: int
+) -> float:
+    return (
         206.835
         - 1.3 * (total_words / total_sentences)
         - 60.1 * (total_syllables / total_words)
     )
 
-    avg_sentence_length = total_words / total_sentences
 
-    avg_word_length = sum(len(word) for word in words) / total_words
+def analyze_sentence(
+    sentence: str, position: int = 0, tokenizer: str = "legacy"
+) -> AnalyzedSentence:
+    return _analyzed_sentence(sentence, position, tokenize_text(sentence, tokenizer))
+
+
+def _analyzed_sentence(
+    sentence: str, position: int, tokens: List[str]
+) -> AnalyzedSentence:
+    return AnalyzedSentence(
+        text=sentence,
+        position=position,
+        tokens=tokens,
+        syllable_count=count_syllables_many(tokens),
+        char_count=sum(len(token) for token in tokens),
+    )
+
+
+def analyze_sentences(
+    sentences: Sequence[str], text: Optional[str] = None, tokenizer: str = "legacy"
+) -> AnalyzedDocument:
+    analyzed = [
+        _analyzed_sentence(sent, idx, tokens)
+        for idx, (sent, tokens) in enumerate(
+            zip(sentences, tokenize_many(sentences, tokenizer))
+        )
+    ]
+    if text is None:
+        text = " ".join(sentences)
+    return AnalyzedDocument(text=text, sentences=analyzed)
+
+
+def analyze_text(
+    text: str, segmenter: str = "legacy", tokenizer: str = "legacy"
+) -> AnalyzedDocument:
+    """Разбивает и токенизирует текст один раз для всех этапов конвейера."""
+    return analyze_sentences(
+        split_into_sentences(text, segmenter), text=text or "", tokenizer=tokenizer
+    )
+
+
+class ReadabilityAccumulator:
+    """Накапливает счетчики предложений, чтобы метрики считались слиянием."""
+
+    def __init__(self) -> None:
+        self.total_sentences = 0
+        self.total_words = 0
+        self.total_syllables = 0
+        self.total_chars = 0
+        self.vocabulary: Set[str] = set()
+
+    def add(self, sentence: AnalyzedSentence) -> None:
+        self.total_sentences += 1
+        self.total_words += sentence.word_count
+        self.total_syllables += sentence.syllable_count
+        self.total_chars += sentence.char_count
+        self.vocabulary.update(sentence.tokens)
+
+    def add_tokens(self, tokens: Sequence[str]) -> None:
+        """Добавляет предложение, уже разбитое на токены."""
+        self.total_sentences += 1
+        self.total_words += len(tokens)
+        self.total_syllables += count_syllables_many(tokens)
+        self.total_chars += sum(map(len, tokens))
+        self.vocabulary.update(tokens)
+
+    def update(self, sentences: Iterable[AnalyzedSentence]) -> None:
+        for sentence in sentences:
+            self.add(sentence)
+
+    def copy(self) -> "ReadabilityAccumulator":
+        clone = ReadabilityAccumulator()
+        clone.total_sentences = self.total_sentences
+        clone.total_words = self.total_words
+        clone.total_syllables = self.total_syllables
+        clone.total_chars = self.total_chars
+        clone.vocabulary = set(self.vocabulary)
+        return clone
+
+    def metrics(self) -> Dict[str, float]:
+        total_sentences = self.total_sentences
+        total_words = self.total_words
+
+        if not total_sentences or not total_words:
+            return {}
+
+        flesch_score = flesch_reading_ease(
+            total_sentences, total_words, self.total_syllables
+        )
+
+        avg_sentence_length = total_words / total_sentences
+
+        avg_word_length = self.total_chars / total_words
+
+        unique_words = len(self.vocabulary)
+        lexical_diversity = unique_words / total_words if total_words > 0 else 0
 
-    unique_words = len(set(words))
-    lexical_diversity = unique_words / total_words if total_words > 0 else 0
+        metrics = {
+            "flesch_score": round(flesch_score, 2),
+            "avg_sentence_length": round(avg_sentence_length, 2),
+            "avg_word_length": round(avg_word_length, 2),
+            "lexical_diversity": round(lexical_diversity, 3),
+            "total_sentences": total_sentences,
+            "total_words": total_words,
+            "unique_words": unique_words,
+        }
 
-    metrics = {
-        "flesch_score": round(flesch_score, 2),
-        "avg_sentence_length": round(avg_sentence_length, 2),
-        "avg_word_length": round(avg_word_length, 2),
-        "lexical_diversity": round(lexical_diversity, 3),
-        "total_sentences": total_sentences,
-        "total_words": total_words,
-        "unique_words": unique_words,
-    }
+        logger.debug(f"Рассчитаны метрики читабельности: {metrics}")
+        return metrics
 
-    logger.debug(f"Рассчитаны метрики читабельности: {metrics}")
-    return metrics
+
+def calculate_document_readability(
+    sentences: Iterable[AnalyzedSentence],
+) -> Dict[str, float]:
+    accumulator = ReadabilityAccumulator()
+    accumulator.update(sentences)
+    return accumulator.metrics()
+
+
+def calculate_tokens_readability(
+    sentences: Iterable[Sequence[str]],
+) -> Dict[str, float]:
+    """Метрики читабельности по предложениям, уже разбитым на токены."""
+    accumulator = ReadabilityAccumulator()
+    for tokens in sentences:
+        accumulator.add_tokens(tokens)
+    return accumulator.metrics()
+
+
+def calculate_readability_metrics(text: str) -> Dict[str, float]:
+    return calculate_document_readability(analyze_text(text).sentences)
 
 
 def extract_named_entities(text: str) -> List[str]:
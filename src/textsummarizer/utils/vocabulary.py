@@ -0,0 +1,113 @@
+from array import array
+from collections import defaultdict
+from itertools import accumulate, chain
+from typing import (
+    DefaultDict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+from ..entities import AnalyzedDocument
+
+
+class Vocabulary:
+    """Номера терминов (int) в порядке первого появления.
+
+    encode переводит токены в array('i') одним проходом в C: новый термин
+    получает следующий номер через default_factory словаря.
+    """
+
+    def __init__(self, terms: Iterable[str] = ()):
+        ids: DefaultDict[str, int] = defaultdict()
+        ids.default_factory = ids.__len__
+        self._ids = ids
+        self._terms: List[str] = []
+        self.encode(terms)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, term: object) -> bool:
+        return term in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    @property
+    def terms(self) -> List[str]:
+        """Термины по номерам: terms[id] == term."""
+        if len(self._terms) != len(self._ids):
+            self._terms = list(self._ids)
+        return self._terms
+
+    def id(self, term: str) -> int:
+        """Номер термина или -1; словарь не пополняется."""
+        return self._ids.get(term, -1)
+
+    def intern(self, term: str) -> int:
+        return self._ids[term]
+
+    def encode(self, tokens: Iterable[str]) -> array:
+        return array("i", map(self._ids.__getitem__, tokens))
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        return list(map(self.terms.__getitem__, ids))
+
+    def ids_of(self, terms: Iterable[str]) -> FrozenSet[int]:
+        """Номера тех terms, что есть в словаре (например, стоп-слов документа)."""
+        ids = self._ids
+        return frozenset(ids[term] for term in terms if term in ids)
+
+
+class EncodedDocument:
+    """Токены документа номерами словаря.
+
+    Все предложения лежат в одном array('i') ids, границы предложения i -
+    offsets[i]:offsets[i + 1]. Один массив вместо списков строк: 4 байта на
+    токен, и его можно без копии передать в numpy.
+    """
+
+    __slots__ = ("vocabulary", "ids", "offsets")
+
+    def __init__(
+        self,
+        sentences: Sequence[Sequence[str]],
+        vocabulary: Optional[Vocabulary] = None,
+    ):
+        self.vocabulary: Vocabulary = (
+            vocabulary if vocabulary is not None else Vocabulary()
+        )
+        self.ids = self.vocabulary.encode(chain.from_iterable(sentences))
+        self.offsets = array("q", accumulate(map(len, sentences), initial=0))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[array]:
+        ids = self.ids
+        offsets = self.offsets
+        return (ids[offsets[i] : offsets[i + 1]] for i in range(len(self)))
+
+    def sentence(self, index: int) -> array:
+        return self.ids[self.offsets[index] : self.offsets[index + 1]]
+
+
+def encode_document(document: AnalyzedDocument) -> EncodedDocument:
+    """Номера токенов документа; считаются один раз и хранятся в document.encoded.
+
+    Заодно токены предложений заменяются строками словаря: одинаковые токены
+    документа становятся одним объектом str, и списки токенов хранят ссылки,
+    а не копии строк.
+    """
+    if document.encoded is None:
+        sentences = document.sentences
+        encoded = EncodedDocument([sentence.tokens for sentence in sentences])
+        terms = encoded.vocabulary.decode(encoded.ids)
+        offsets = encoded.offsets.tolist()
+        for sentence, start, end in zip(sentences, offsets, offsets[1:]):
+            sentence.tokens = terms[start:end]
+        document.encoded = encoded
+    return document.encoded
@@ -0,0 +1,108 @@
+from src.textsummarizer.cache import SummaryCache, make_cache_key
+from src.textsummarizer.core import TextSummarizer
+from src.textsummarizer.entities import SummaryMethod
+
+
+class TestSummaryCache:
+    def test_key_depends_on_inputs(self):
+        base = make_cache_key("Текст.", SummaryMethod.FEATURE_BASED, 0.3, {"a": 1})
+
+        assert base == make_cache_key(
+            "Текст.", SummaryMethod.FEATURE_BASED, 0.3, {"a": 1}
+        )
+        assert base != make_cache_key(
+            "Текст!", SummaryMethod.FEATURE_BASED, 0.3, {"a": 1}
+        )
+        assert base != make_cache_key(
+            "Текст.", SummaryMethod.FREQUENCY_BASED, 0.3, {"a": 1}
+        )
+        assert base != make_cache_key(
+            "Текст.", SummaryMethod.FEATURE_BASED, 0.5, {"a": 1}
+        )
+        assert base != make_cache_key(
+            "Текст.", SummaryMethod.FEATURE_BASED, 0.3, {"a": 2}
+        )
+
+    def test_hit_returns_equal_result(self, sample_text_long):
+        cache = SummaryCache()
+        summarizer = TextSummarizer(cache=cache)
+
+        first = summarizer.summarize(sample_text_long, 0.3)
+        second = summarizer.summarize(sample_text_long, 0.3)
+
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+        assert second.original_text == sample_text_long
+        assert second.summary_text == first.summary_text
+        assert second.important_sentences == first.important_sentences
+        assert second.statistics == first.statistics
+
+    def test_lru_eviction_by_bytes(self, sample_text_long):
+        summarizer = TextSummarizer()
+        result = summarizer.summarize(sample_text_long, 0.3)
+        cache = SummaryCache(max_bytes=1)
+        cache.put("big", result)
+
+        assert len(cache) == 0
+
+        from src.textsummarizer.cache import serialize_result
+
+        entry_size = len(serialize_result(result))
+        cache = SummaryCache(max_bytes=entry_size * 2)
+        cache.put("a", result)
+        cache.put("b", result)
+        cache.get("a", sample_text_long)
+        cache.put("c", result)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats.evictions == 1
+        assert cache.stats.memory_bytes <= cache.max_bytes
+
+    def test_disk_tier(self, sample_text_short, temp_dir):
+        cache_dir = temp_dir / "cache"
+        TextSummarizer(cache=SummaryCache(cache_dir=cache_dir)).summarize(
+            sample_text_short, 0.5
+        )
+
+        cold = SummaryCache(cache_dir=cache_dir)
+        result = TextSummarizer(cache=cold).summarize(sample_text_short, 0.5)
+
+        assert cold.stats.disk_hits == 1
+        assert cold.stats.misses == 0
+        assert result.summary_text != ""
+        assert len(cold) == 1
+
+    def test_corrupt_disk_entry_is_recomputed(self, sample_text_short, temp_dir):
+        cache_dir = temp_dir / "cache"
+        expected = TextSummarizer(cache=SummaryCache(cache_dir=cache_dir)).summarize(
+            sample_text_short, 0.5
+        )
+        (entry,) = cache_dir.glob("*/*.bin")
+        entry.write_bytes(entry.read_bytes()[:10] + b"garbage")
+
+        cold = SummaryCache(cache_dir=cache_dir)
+        summarizer = TextSummarizer(cache=cold)
+        result = summarizer.summarize(sample_text_short, 0.5)
+
+        assert result.summary_text == expected.summary_text
+        assert cold.stats.misses == 1
+        assert cold.stats.disk_hits == 0
+        # Пересчитанный результат записан заново и читается.
+        again = TextSummarizer(cache=SummaryCache(cache_dir=cache_dir)).summarize(
+            sample_text_short, 0.5
+        )
+        assert again.summary_text == expected.summary_text
+
+    def test_corrupt_memory_entry_is_dropped(self, sample_text_short):
+        cache = SummaryCache()
+        summarizer = TextSummarizer(cache=cache)
+        expected = summarizer.summarize(sample_text_short, 0.5)
+        (key,) = list(cache._entries)
+        cache._entries[key] = b"not zlib"
+
+        result = summarizer.summarize(sample_text_short, 0.5)
+
+        assert result.summary_text == expected.summary_text
+        assert cache.stats.misses == 2
+        assert cache._entries[key] != b"not zlib"
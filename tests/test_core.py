@@ -74,3 +74,143 @@ class TestTextSummarizer:
 
         summary_content = (output_dir / "summary.txt").read_text(encoding="utf-8")
         assert summary_content == result.summary_text
+
+
+class TestBatchSummarization:
+    def test_summarize_many_ordered(self, sample_text_short, sample_text_long):
+        summarizer = TextSummarizer()
+        texts = [sample_text_short, sample_text_long, "", sample_text_long] * 3
+
+        expected = [summarizer.summarize(t).summary_text for t in texts]
+        results = summarizer.summarize_many(texts, workers=2, chunk_size=2)
+
+        assert [r.summary_text for r in results] == expected
+
+    def test_summarize_many_unordered(self, sample_text_short, sample_text_long):
+        summarizer = TextSummarizer(method=SummaryMethod.FREQUENCY_BASED)
+        texts = [sample_text_short, sample_text_long] * 4
+
+        results = list(
+            summarizer.summarize_many(texts, workers=2, chunk_size=1, ordered=False)
+        )
+
+        assert sorted(r.summary_text for r in results) == sorted(
+            summarizer.summarize(t).summary_text for t in texts
+        )
+
+    def test_summarize_many_in_process(self, sample_text_short):
+        summarizer = TextSummarizer()
+        results = list(summarizer.summarize_many([sample_text_short], workers=1))
+
+        assert len(results) == 1
+        assert (
+            results[0].summary_text
+            == summarizer.summarize(sample_text_short).summary_text
+        )
+
+    def test_summarize_many_invalid_ratio(self):
+        with pytest.raises(ValueError, match="compression_ratio"):
+            TextSummarizer().summarize_many(["Текст."], compression_ratio=2)
+
+    def test_summarize_files(self, temp_dir, sample_text_short, sample_text_long):
+        paths = []
+        for idx, text in enumerate([sample_text_short, sample_text_long]):
+            path = temp_dir / f"doc_{idx}.txt"
+            path.write_text(text, encoding="utf-8")
+            paths.append(path)
+
+        summarizer = TextSummarizer()
+        results = list(summarizer.summarize_files(paths, workers=2))
+
+        assert [path for path, _ in results] == paths
+        assert (
+            results[1][1].summary_text
+            == summarizer.summarize(sample_text_long).summary_text
+        )
+
+    @pytest.mark.parametrize(
+        "method", [SummaryMethod.FEATURE_BASED, SummaryMethod.FREQUENCY_BASED]
+    )
+    def test_summarize_ratios_matches_summarize(self, method, sample_text_long):
+        summarizer = TextSummarizer(method=method)
+        ratios = [0.5, 0.1, 0.3, 0.2]
+
+        results = summarizer.summarize_ratios(sample_text_long, ratios)
+
+        assert len(results) == len(ratios)
+        for ratio, result in zip(ratios, results):
+            expected = summarizer.summarize(sample_text_long, compression_ratio=ratio)
+            assert result.summary_text == expected.summary_text
+            assert [s.position for s in result.important_sentences] == [
+                s.position for s in expected.important_sentences
+            ]
+            assert result.statistics == expected.statistics
+
+    @pytest.mark.parametrize(
+        "method", [SummaryMethod.FEATURE_BASED, SummaryMethod.FREQUENCY_BASED]
+    )
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    def test_summarize_stream_ratios_reads_once(
+        self, method, use_mmap, sample_text_long, temp_dir
+    ):
+        from unittest import mock
+
+        from src.textsummarizer import core
+
+        filepath = temp_dir / "long.txt"
+        filepath.write_text(sample_text_long * 3, encoding="utf-8")
+        summarizer = TextSummarizer(method=method)
+        ratios = [0.5, 0.1, 0.3]
+        expected = [
+            summarizer.summarize_stream(filepath, ratio, use_mmap=use_mmap)
+            for ratio in ratios
+        ]
+
+        with mock.patch.object(
+            core, "read_text_chunks", wraps=core.read_text_chunks
+        ) as chunks, mock.patch.object(
+            core, "open_document", wraps=core.open_document
+        ) as mapped:
+            results = summarizer.summarize_stream_ratios(
+                filepath, ratios, chunk_size=64, use_mmap=use_mmap
+            )
+
+        # Два прохода (статистика и оценка) на все коэффициенты сразу.
+        assert chunks.call_count == (0 if use_mmap else 2)
+        assert mapped.call_count == (1 if use_mmap else 0)
+        for result, single in zip(results, expected):
+            assert result.summary_text == single.summary_text
+            assert result.statistics == single.statistics
+
+    def test_summarize_ratios_empty_text(self):
+        results = TextSummarizer().summarize_ratios("", [0.1, 0.3])
+
+        assert [r.summary_text for r in results] == ["", ""]
+
+    def test_summarize_ratios_invalid_ratio(self):
+        with pytest.raises(ValueError, match="compression_ratio"):
+            TextSummarizer().summarize_ratios("Текст.", [0.2, 0])
+
+    @pytest.mark.parametrize(
+        "method", [SummaryMethod.FEATURE_BASED, SummaryMethod.FREQUENCY_BASED]
+    )
+    def test_summarize_batch_matches_summarize(
+        self, method, sample_text_short, sample_text_long, sample_text_with_numbers
+    ):
+        summarizer = TextSummarizer(method=method)
+        texts = [sample_text_long, "", sample_text_short, sample_text_with_numbers]
+        ratios = [0.3, 0.5, 1.0, 0.5]
+
+        results = summarizer.summarize_batch(texts, ratios)
+
+        for text, ratio, result in zip(texts, ratios, results):
+            expected = summarizer.summarize(text, compression_ratio=ratio)
+            assert result.summary_text == expected.summary_text
+            assert [s.importance_score for s in result.important_sentences] == [
+                s.importance_score for s in expected.important_sentences
+            ]
+            assert result.statistics == expected.statistics
+
+    def test_summarize_batch_ratio_count_mismatch(self):
+        with pytest.raises(ValueError):
+            TextSummarizer().summarize_batch(["Текст.", "Еще."], [0.3])
@@ -132,3 +132,196 @@ class TestFeatureBasedSummarizer:
             assert 0 <= sentence.importance_score <= 1.0
             assert sentence.is_important is True
             assert isinstance(sentence.features, dict)
+
+    def test_feature_matrix_matches_extract_features(self, sample_text_long):
+        from src.textsummarizer.methods.feature_based import FEATURE_NAMES
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        document = analyze_text(sample_text_long)
+        summarizer = FeatureBasedSummarizer()
+        matrix = summarizer._extract_feature_matrix(document)
+
+        assert matrix.shape == (len(document), len(FEATURE_NAMES))
+        for idx, sentence in enumerate(document.sentences):
+            features = summarizer._extract_features(sentence, idx, len(document))
+            assert matrix[idx].tolist() == [features[n] for n in FEATURE_NAMES]
+
+    def test_batch_summarize_matches_per_sentence(self, sample_text_long):
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        document = analyze_text(sample_text_long)
+        batch = FeatureBasedSummarizer(batch=True).summarize_document(document, 0.5)
+        single = FeatureBasedSummarizer(batch=False).summarize_document(document, 0.5)
+
+        assert [s.position for s in batch] == [s.position for s in single]
+        for b, s in zip(batch, single):
+            assert b.importance_score == pytest.approx(s.importance_score)
+            assert b.features == pytest.approx(s.features)
+
+
+class TestAnalyzedDocumentInput:
+    def test_summarize_document_matches_summarize(self, sample_sentences_list):
+        from src.textsummarizer.utils.text_processing import analyze_sentences
+
+        document = analyze_sentences(sample_sentences_list)
+
+        for summarizer in (FrequencyBasedSummarizer(), FeatureBasedSummarizer()):
+            from_strings = summarizer.summarize(sample_sentences_list, 0.4)
+            from_document = summarizer.summarize_document(document, 0.4)
+
+            assert [s.position for s in from_strings] == [
+                s.position for s in from_document
+            ]
+            assert [s.importance_score for s in from_strings] == [
+                s.importance_score for s in from_document
+            ]
+
+
+class TestSparseTfIsfBackend:
+    def test_sparse_scores_match_python(self, sample_text_long):
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        document = analyze_text(sample_text_long)
+        for use_stopwords in (True, False):
+            python_scores = FrequencyBasedSummarizer(
+                use_stopwords=use_stopwords
+            )._calculate_tf_isf_scores(document)
+            sparse_scores = FrequencyBasedSummarizer(
+                use_stopwords=use_stopwords, backend="sparse"
+            )._calculate_tf_isf_scores(document)
+
+            assert sparse_scores == python_scores
+
+    def test_sparse_scores_match_python_with_skewed_lengths(self):
+        # Одно очень длинное предложение среди коротких: суммы длинных строк
+        # досчитываются отдельно и должны совпадать с построчными до бита.
+        words = [f"слово{i}" for i in range(3000)]
+        sentences = [" ".join(words[i : i + 1 + i % 7]) for i in range(200)]
+        sentences += [" ".join(words[:length]) for length in (3000, 900, 40)] * 4
+
+        python_scores = FrequencyBasedSummarizer()._calculate_tf_isf_scores(sentences)
+        sparse_scores = FrequencyBasedSummarizer(
+            backend="sparse"
+        )._calculate_tf_isf_scores(sentences)
+
+        assert sparse_scores == python_scores
+
+    def test_sparse_handles_empty_sentences(self):
+        summarizer = FrequencyBasedSummarizer(backend="sparse")
+        scores = summarizer._calculate_tf_isf_scores(["и в на", "Одно слово"])
+
+        assert scores[0] == 0.0
+        assert len(scores) == 2
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="backend"):
+            FrequencyBasedSummarizer(backend="gpu")
+
+    def test_backend_from_text_summarizer(self, sample_text_long):
+        from src.textsummarizer.core import TextSummarizer
+        from src.textsummarizer.entities import SummaryMethod
+
+        python_result = TextSummarizer(SummaryMethod.FREQUENCY_BASED).summarize(
+            sample_text_long
+        )
+        sparse_summarizer = TextSummarizer(
+            SummaryMethod.FREQUENCY_BASED, frequency_backend="sparse"
+        )
+        sparse_result = sparse_summarizer.summarize(sample_text_long)
+
+        assert sparse_summarizer.summarizer.backend == "sparse"
+        assert sparse_result.summary_text == python_result.summary_text
+
+
+class TestSelectTopK:
+    def test_returns_positions_in_order(self):
+        from src.textsummarizer.methods.base import select_top_k
+
+        assert select_top_k([0.1, 0.9, 0.5, 0.7], 2) == [1, 3]
+
+    def test_ties_prefer_earlier_positions(self):
+        from src.textsummarizer.methods.base import select_top_k
+
+        assert select_top_k([0.5, 0.2, 0.5, 0.5, 0.9], 3) == [0, 2, 4]
+
+    def test_matches_stable_sort(self):
+        import random
+
+        from src.textsummarizer.methods.base import select_top_k
+
+        rng = random.Random(0)
+        scores = [rng.choice([0.1, 0.2, 0.3, 0.4]) for _ in range(200)]
+        for k in (1, 7, 50, 199, 200, 250):
+            ranked = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+            assert select_top_k(scores, k) == sorted(ranked[:k])
+
+
+class TestScoredSentences:
+    def test_selected_sentences_materialize_features_lazily(self, sample_text_long):
+        from src.textsummarizer.methods.feature_based import FEATURE_NAMES
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        document = analyze_text(sample_text_long)
+        scored = FeatureBasedSummarizer()._score_document(document)
+        sentence = scored.sentence(1)
+
+        assert scored.features.shape == (len(document), len(FEATURE_NAMES))
+        assert sentence._features is None
+        assert sentence.features == dict(
+            zip(FEATURE_NAMES, scored.features[1].tolist())
+        )
+        assert sentence.importance_score == scored.scores[1]
+        assert not hasattr(sentence, "__dict__")
+
+    def test_frequency_feature_is_score(self, sample_text_long):
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        selected = FrequencyBasedSummarizer().summarize_document(
+            analyze_text(sample_text_long), 0.5
+        )
+
+        for sentence in selected:
+            assert sentence.features == {"tf_isf_score": sentence.importance_score}
+
+    def test_pickle_drops_document_reference(self, sample_text_long):
+        import pickle
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        document = analyze_text(sample_text_long)
+        sentence = FeatureBasedSummarizer()._score_document(document).sentence(0)
+
+        restored = pickle.loads(pickle.dumps(sentence))
+
+        assert restored == sentence
+        assert restored._scored is None
+        assert restored.features == sentence.features
+
+    def test_sentence_keeps_dataclass_api(self, sample_text_long):
+        import dataclasses
+        import json
+
+        from src.textsummarizer.core import TextSummarizer
+        from src.textsummarizer.entities import Sentence
+
+        result = TextSummarizer().summarize(sample_text_long, 0.5)
+        sentence = result.important_sentences[0]
+
+        assert [f.name for f in dataclasses.fields(Sentence)] == [
+            "text",
+            "position",
+            "features",
+            "importance_score",
+            "is_important",
+            "analysis",
+            "span",
+            "source",
+        ]
+        as_dict = dataclasses.asdict(result)["important_sentences"][0]
+        assert as_dict["features"] == sentence.features
+        json.dumps(dataclasses.asdict(result)["important_sentences"])
+        assert dataclasses.astuple(sentence)[:2] == (sentence.text, sentence.position)
+
+        moved = dataclasses.replace(sentence, position=-1)
+        assert moved.position == -1
+        assert moved.features == sentence.features
+        assert not hasattr(moved, "__dict__")
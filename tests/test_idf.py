@@ -0,0 +1,341 @@
+import asyncio
+import json
+import math
+import os
+import pickle
+import threading
+
+import pytest
+from src.textsummarizer.core import TextSummarizer
+from src.textsummarizer.entities import SummaryMethod
+from src.textsummarizer.idf import (
+    CorpusSnapshotFile,
+    CorpusStatistics,
+    OnlineCorpusStatistics,
+    load_corpus_statistics,
+)
+from src.textsummarizer.methods import FrequencyBasedSummarizer
+from src.textsummarizer.utils.text_processing import analyze_text
+
+CORPUS = [
+    "Кошка сидит на окне. Кошка спит.",
+    "Собака бежит по улице.",
+    "Кошка и собака дружат!",
+    "Погода сегодня хорошая.",
+]
+
+
+@pytest.fixture
+def statistics():
+    return CorpusStatistics.build(CORPUS)
+
+
+class TestCorpusStatistics:
+    def test_build(self, statistics):
+        assert statistics.num_documents == 4
+        assert statistics.document_frequency("кошка") == 2
+        assert statistics.document_frequency("собака") == 2
+        assert statistics.document_frequency("дракон") == 0
+        assert list(statistics) == sorted(statistics)
+        assert statistics.idf("погода") == math.log(4 / 2)
+        assert statistics.idf("дракон") == math.log(4)
+
+    def test_save_and_load(self, statistics, temp_dir):
+        path = temp_dir / "corpus.idf"
+        statistics.save(path)
+
+        loaded = CorpusStatistics.load(path)
+
+        assert list(loaded) == list(statistics)
+        assert loaded.num_documents == statistics.num_documents
+        assert loaded.idf_table == statistics.idf_table
+        assert loaded.fingerprint == statistics.fingerprint
+        assert "кошка" in loaded and "дракон" not in loaded
+        loaded.close()
+
+    def test_load_once_per_process(self, statistics, temp_dir):
+        path = temp_dir / "corpus.idf"
+        statistics.save(path)
+
+        loaded = load_corpus_statistics(path)
+
+        assert load_corpus_statistics(str(path)) is loaded
+        assert pickle.loads(pickle.dumps(loaded)) is loaded
+
+    def test_pickle_in_memory(self, statistics):
+        restored = pickle.loads(pickle.dumps(statistics))
+
+        assert restored.idf_table == statistics.idf_table
+
+    def test_invalid_file(self, temp_dir):
+        path = temp_dir / "broken.idf"
+        path.write_bytes(b"not an idf file")
+
+        with pytest.raises(ValueError, match="Неверный формат"):
+            CorpusStatistics.load(path)
+        with pytest.raises(FileNotFoundError, match="не найден"):
+            CorpusStatistics.load(temp_dir / "missing.idf")
+
+    def test_build_from_files(self, temp_dir):
+        for i, text in enumerate(CORPUS):
+            (temp_dir / f"{i}.txt").write_text(text, encoding="utf-8")
+
+        statistics = CorpusStatistics.build_from_files(sorted(temp_dir.glob("*.txt")))
+
+        assert statistics.idf_table == CorpusStatistics.build(CORPUS).idf_table
+
+
+class TestFrequencyWithCorpusIdf:
+    def test_scores_use_corpus_idf(self, statistics):
+        document = analyze_text("Кошка спит. Погода хорошая")
+        summarizer = FrequencyBasedSummarizer(use_stopwords=False, idf=statistics)
+
+        scores = summarizer._calculate_tf_isf_scores(document)
+
+        assert scores == [
+            0.5 * statistics.idf("кошка") + 0.5 * statistics.idf("спит"),
+            0.5 * statistics.idf("погода") + 0.5 * statistics.idf("хорошая"),
+        ]
+
+    def test_sparse_matches_python(self, statistics, sample_text_long):
+        document = analyze_text(sample_text_long)
+
+        python_scores = FrequencyBasedSummarizer(
+            idf=statistics
+        )._calculate_tf_isf_scores(document)
+        sparse_scores = FrequencyBasedSummarizer(
+            idf=statistics, backend="sparse"
+        )._calculate_tf_isf_scores(document)
+
+        assert sparse_scores == python_scores
+
+    def test_stream_matches_in_memory(self, statistics, sample_text_long, temp_dir):
+        path = temp_dir / "text.txt"
+        path.write_text(sample_text_long, encoding="utf-8")
+        summarizer = TextSummarizer(SummaryMethod.FREQUENCY_BASED, idf=statistics)
+
+        streamed = summarizer.summarize_stream(path, compression_ratio=0.5)
+        in_memory = summarizer.summarize(sample_text_long, compression_ratio=0.5)
+
+        assert [s.position for s in streamed.important_sentences] == [
+            s.position for s in in_memory.important_sentences
+        ]
+
+    def test_cache_config_includes_idf(self, statistics):
+        assert "idf" not in FrequencyBasedSummarizer().cache_config()
+        assert (
+            FrequencyBasedSummarizer(idf=statistics).cache_config()["idf"]
+            == statistics.fingerprint
+        )
+
+    def test_build_idf_cli(self, temp_dir):
+        from click.testing import CliRunner
+
+        from src.textsummarizer.cli import cli
+
+        for i, text in enumerate(CORPUS):
+            (temp_dir / f"{i}.txt").write_text(text, encoding="utf-8")
+        output = temp_dir / "corpus.idf"
+
+        result = CliRunner().invoke(
+            cli, ["build-idf", str(temp_dir), "-o", str(output), "-j", "1"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Документов: 4" in result.output
+        assert CorpusStatistics.load(output).document_frequency("кошка") == 2
+
+    def test_build_idf_cli_skips_unreadable_files(self, temp_dir):
+        from click.testing import CliRunner
+
+        from src.textsummarizer.cli import cli
+
+        corpus = temp_dir / "corpus"
+        corpus.mkdir()
+        for i, text in enumerate(CORPUS):
+            (corpus / f"{i}.txt").write_text(text, encoding="utf-8")
+        (corpus / "cp1251.txt").write_bytes("Кошка".encode("cp1251"))
+        output = temp_dir / "corpus.idf"
+        args = ["build-idf", str(corpus), "-o", str(output), "-j", "1"]
+
+        result = CliRunner().invoke(cli, args)
+
+        assert result.exit_code == 0, result.output
+        assert "Документов: 4" in result.output
+        assert "Пропущено файлов с ошибками: 1" in result.output
+        assert CorpusStatistics.load(output).num_documents == 4
+
+        for path in corpus.glob("[0-9].txt"):
+            path.unlink()
+        result = CliRunner().invoke(cli, args)
+
+        assert result.exit_code == 1
+
+    def test_build_from_files_reports_failures(self, temp_dir):
+        good = temp_dir / "good.txt"
+        good.write_text(CORPUS[0], encoding="utf-8")
+        bad = temp_dir / "bad.txt"
+        bad.write_bytes(b"\xff\xfe\xfa")
+        failed = []
+
+        statistics = CorpusStatistics.build_from_files([bad, good], failed=failed)
+
+        assert statistics.num_documents == 1
+        assert [path for path, _ in failed] == [bad]
+
+
+class TestOnlineCorpusStatistics:
+    def test_matches_batch_build(self):
+        online = OnlineCorpusStatistics(refresh_every=2)
+        for text in CORPUS:
+            online.add_document(text)
+
+        built = CorpusStatistics.build(CORPUS)
+        assert online.current().fingerprint == built.fingerprint
+
+    def test_snapshot_published_on_refresh(self, statistics):
+        online = OnlineCorpusStatistics(statistics, refresh_every=10)
+        snapshot = online.current()
+
+        online.add_document("Кошка ловит мышь.")
+
+        # Уже выданный снимок не меняется, новый появляется после refresh.
+        assert online.current() is snapshot
+        assert snapshot.document_frequency("мышь") == 0
+        online.refresh()
+        assert online.current().document_frequency("мышь") == 1
+        assert online.current().num_documents == 5
+        assert snapshot.num_documents == 4
+
+    def test_concurrent_updates(self):
+        online = OnlineCorpusStatistics(refresh_every=50)
+
+        def feed():
+            for text in CORPUS * 100:
+                online.add_document(text)
+
+        threads = [threading.Thread(target=feed) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = online.refresh()
+        assert snapshot.num_documents == 1600
+        assert snapshot.document_frequency("кошка") == 800
+
+    def test_pruning_keeps_frequent_terms(self):
+        online = OnlineCorpusStatistics(max_terms=10, prune_ratio=0.5)
+        for _ in range(3):
+            online.add_terms(["частый", "нередкий"])
+        for i in range(20):
+            online.add_terms([f"редкий{i}"])
+
+        assert len(online) <= 10
+        assert online.pruned_terms > 0
+        snapshot = online.refresh()
+        assert snapshot.document_frequency("частый") == 3
+        assert snapshot.num_documents == 23
+
+    def test_periodic_snapshot_to_disk(self, temp_dir):
+        path = temp_dir / "online.idf"
+        online = OnlineCorpusStatistics(snapshot_path=path, snapshot_interval=0)
+
+        online.add_document(CORPUS[0])
+
+        assert CorpusStatistics.load(path).document_frequency("кошка") == 1
+        assert not list(temp_dir.glob("*.tmp"))
+
+    def test_pickle_sends_snapshot(self, statistics):
+        online = OnlineCorpusStatistics(statistics)
+        restored = pickle.loads(pickle.dumps(online))
+
+        assert isinstance(restored, CorpusStatistics)
+        assert restored.fingerprint == statistics.fingerprint
+
+    def test_summarizer_learns_from_documents(self, sample_text_long):
+        online = OnlineCorpusStatistics(refresh_every=1)
+        summarizer = TextSummarizer(SummaryMethod.FREQUENCY_BASED, idf=online)
+
+        summarizer.summarize(sample_text_long)
+        summarizer.summarize(sample_text_long)
+
+        assert online.num_documents == 2
+        assert online.current().num_documents == 2
+
+    def test_stream_learns_from_documents(self, sample_text_long, temp_dir):
+        path = temp_dir / "text.txt"
+        path.write_text(sample_text_long, encoding="utf-8")
+        online = OnlineCorpusStatistics(refresh_every=1)
+        summarizer = TextSummarizer(SummaryMethod.FREQUENCY_BASED, idf=online)
+
+        summarizer.summarize_stream(path)
+
+        assert online.num_documents == 1
+
+
+class TestCorpusSnapshotFile:
+    def test_picks_up_new_snapshot(self, statistics, temp_dir):
+        path = temp_dir / "corpus.idf"
+        statistics.save(path)
+        snapshot_file = CorpusSnapshotFile(path, check_interval=0)
+        assert snapshot_file.current().num_documents == 4
+
+        online = OnlineCorpusStatistics(statistics)
+        online.add_document("Кошка ловит мышь.")
+        online.save(path)
+        # Время изменения могло не сдвинуться в пределах разрешения ФС.
+        os.utime(path, ns=(0, 0))
+
+        assert snapshot_file.current().num_documents == 5
+        assert snapshot_file.current().document_frequency("мышь") == 1
+
+    def test_throttled_check(self, statistics, temp_dir):
+        path = temp_dir / "corpus.idf"
+        statistics.save(path)
+        snapshot_file = CorpusSnapshotFile(path, check_interval=3600)
+
+        CorpusStatistics.build(CORPUS[:2]).save(path)
+
+        assert snapshot_file.current().num_documents == 4
+
+    def test_pickle_keeps_path(self, statistics, temp_dir):
+        path = temp_dir / "corpus.idf"
+        statistics.save(path)
+
+        restored = pickle.loads(pickle.dumps(CorpusSnapshotFile(path, 1.0)))
+
+        assert restored.path == path
+        assert restored.check_interval == 1.0
+        assert restored.current().fingerprint == statistics.fingerprint
+
+
+class TestServerLearnIdf:
+    def test_server_learns_idf(self, sample_text_long, temp_dir):
+        from src.textsummarizer.entities import SummaryMethod as Method
+        from src.textsummarizer.server import SummaryServer
+
+        path = temp_dir / "online.idf"
+
+        async def scenario():
+            server = SummaryServer(
+                port=0,
+                workers=1,
+                method=Method.FREQUENCY_BASED,
+                learn_idf=path,
+            )
+            await server.start()
+            try:
+                for _ in range(3):
+                    await server._summarize({"text": sample_text_long})
+                while server._learning:
+                    await asyncio.sleep(0.01)
+                health = json.loads(await server._route("GET", "/health", b""))
+            finally:
+                await server.close()
+            return health
+
+        health = asyncio.run(scenario())
+
+        assert health["idf_documents"] == 3
+        assert CorpusStatistics.load(path).num_documents == 3
@@ -104,3 +104,217 @@ class TestIntegration:
         assert result.summary_text != ""
         assert len(result.important_sentences) == 1
         assert result.statistics.compression_ratio == 0.0
+
+    def test_batch_cli_writes_outputs_and_skips_fresh_files(
+        self, sample_text_short, sample_text_long, temp_dir
+    ):
+        from click.testing import CliRunner
+
+        from src.textsummarizer.cli import cli
+
+        input_dir = temp_dir / "input"
+        input_dir.mkdir()
+        (input_dir / "short.txt").write_text(sample_text_short, encoding="utf-8")
+        (input_dir / "long.txt").write_text(sample_text_long, encoding="utf-8")
+        output_dir = temp_dir / "output"
+
+        runner = CliRunner()
+        args = ["batch", str(input_dir), "-d", str(output_dir), "--stats", "-j", "1"]
+        first = runner.invoke(cli, args)
+
+        assert first.exit_code == 0, first.output
+        assert "Обработано: 2" in first.output
+        assert (output_dir / "short_summary.txt").exists()
+        assert (output_dir / "long_stats.json").exists()
+
+        second = runner.invoke(cli, args)
+
+        assert second.exit_code == 0, second.output
+        assert "пропущено (актуальны): 2" in second.output
+
+    def test_batch_cli_counts_missing_files_as_failures(
+        self, sample_text_short, temp_dir
+    ):
+        from click.testing import CliRunner
+
+        from src.textsummarizer.cli import cli
+
+        present = temp_dir / "present.txt"
+        present.write_text(sample_text_short, encoding="utf-8")
+        output_dir = temp_dir / "output"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "batch",
+                str(present),
+                str(temp_dir / "absent.txt"),
+                "-d",
+                str(output_dir),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Обработано: 1" in result.output
+        assert "ошибок: 1" in result.output
+        assert (output_dir / "present_summary.txt").exists()
+
+    def test_batch_cli_reports_colliding_outputs(self, sample_text_short, temp_dir):
+        from click.testing import CliRunner
+
+        from src.textsummarizer.cli import cli
+
+        input_dir = temp_dir / "input"
+        for name in ("a", "b"):
+            (input_dir / name).mkdir(parents=True)
+            (input_dir / name / "x.txt").write_text(sample_text_short, encoding="utf-8")
+        output_dir = temp_dir / "output"
+        args = [
+            "batch",
+            str(input_dir),
+            "--pattern",
+            "**/*.txt",
+            "-d",
+            str(output_dir),
+            "-j",
+            "1",
+        ]
+
+        first = CliRunner().invoke(cli, args)
+        second = CliRunner().invoke(cli, args)
+
+        assert first.exit_code == 1
+        assert "Обработано: 1" in first.output
+        assert "ошибок: 1" in first.output
+        assert list(output_dir.iterdir()) == [output_dir / "x_summary.txt"]
+        assert second.exit_code == 1
+        assert "пропущено (актуальны): 1, ошибок: 1" in second.output
+
+    def test_batch_reports_vanished_file(self, sample_text_short, temp_dir):
+        from src.textsummarizer.batch import summarize_files_to_dir
+
+        present = temp_dir / "present.txt"
+        present.write_text(sample_text_short, encoding="utf-8")
+        vanished = temp_dir / "vanished.txt"
+
+        report = list(
+            summarize_files_to_dir(
+                [vanished, present], SummaryMethod.FEATURE_BASED, workers=1
+            )
+        )
+
+        errors = {path: error for path, _, _, error in report}
+        assert errors[present] is None
+        assert errors[vanished] is not None
+        assert report[0][1] == 0
+
+    def test_summarize_stream_matches_in_memory(self, sample_text_long, temp_dir):
+        filepath = temp_dir / "long.txt"
+        filepath.write_text(sample_text_long * 5, encoding="utf-8")
+
+        for method in (SummaryMethod.FREQUENCY_BASED, SummaryMethod.FEATURE_BASED):
+            summarizer = TextSummarizer(method=method)
+            expected = summarizer.summarize(sample_text_long * 5, 0.3)
+            streamed = summarizer.summarize_stream(filepath, 0.3, chunk_size=37)
+
+            assert streamed.summary_text == expected.summary_text
+            assert [s.position for s in streamed.important_sentences] == [
+                s.position for s in expected.important_sentences
+            ]
+            assert streamed.statistics == expected.statistics
+
+    def test_iter_sentences_matches_split(self, sample_text_long):
+        from src.textsummarizer.utils.text_processing import (
+            iter_sentences,
+            split_into_sentences,
+        )
+
+        text = sample_text_long + "Конец... Вопрос?! Без точки"
+        chunks = [text[i : i + 11] for i in range(0, len(text), 11)]
+
+        assert list(iter_sentences(chunks)) == split_into_sentences(text)
+
+    def test_mapped_document_offsets(self, sample_text_long, temp_dir):
+        from src.textsummarizer.utils.file_io import open_document
+        from src.textsummarizer.utils.text_processing import split_into_sentences
+
+        filepath = temp_dir / "long.txt"
+        filepath.write_text(sample_text_long, encoding="utf-8")
+
+        with open_document(filepath) as document:
+            assert list(document.iter_texts()) == split_into_sentences(sample_text_long)
+
+            sentence = document.sentence(1)
+            start, end = sentence.span
+            assert sentence.text == document.text(1)
+            assert bytes(document.summary_slices([sentence])[0]) == (
+                filepath.read_bytes()[start:end]
+            )
+
+    def test_summarize_stream_with_mmap(self, sample_text_long, temp_dir):
+        filepath = temp_dir / "long.txt"
+        filepath.write_text(sample_text_long, encoding="utf-8")
+
+        summarizer = TextSummarizer()
+        expected = summarizer.summarize(sample_text_long, 0.5)
+        mapped = summarizer.summarize_stream(filepath, 0.5, use_mmap=True)
+
+        assert mapped.summary_text == expected.summary_text
+        assert all(s.span is not None for s in mapped.important_sentences)
+        assert mapped.statistics == expected.statistics
+
+    def test_summarize_stream_with_mmap_closes_mapping(
+        self, sample_text_long, temp_dir
+    ):
+        import mmap
+        from unittest import mock
+
+        from src.textsummarizer.utils import file_io
+
+        filepath = temp_dir / "long.txt"
+        filepath.write_text(sample_text_long, encoding="utf-8")
+        opened = []
+
+        def open_document(*args, **kwargs):
+            opened.append(file_io.open_document(*args, **kwargs))
+            return opened[-1]
+
+        with mock.patch("src.textsummarizer.core.open_document", open_document):
+            result = TextSummarizer().summarize_stream(filepath, 0.5, use_mmap=True)
+
+        assert isinstance(opened[0].buffer, mmap.mmap)
+        assert opened[0].buffer.closed
+        assert all(s.source is None for s in result.important_sentences)
+        assert result.important_sentences[0].text
+
+    @pytest.mark.parametrize("encoding", ["utf-16", "utf-32-le", "no-such-codec"])
+    def test_mmap_rejects_non_ascii_compatible_encoding(self, temp_dir, encoding):
+        from src.textsummarizer.utils.file_io import MappedDocument
+
+        filepath = temp_dir / "text.txt"
+        filepath.write_text("Первое. Второе.", encoding="utf-16")
+
+        with pytest.raises(ValueError, match="кодировка|Кодировка"):
+            TextSummarizer().summarize_stream(
+                filepath, use_mmap=True, encoding=encoding
+            )
+        with pytest.raises(ValueError):
+            MappedDocument(b"", encoding=encoding)
+
+    @pytest.mark.parametrize("encoding", ["cp1251", "utf-8-sig"])
+    def test_mmap_ascii_compatible_encoding(self, temp_dir, encoding):
+        from src.textsummarizer.utils.file_io import open_document
+
+        filepath = temp_dir / "text.txt"
+        filepath.write_text("Первое. Второе!", encoding=encoding)
+
+        with open_document(filepath, encoding=encoding) as document:
+            assert list(document.iter_texts()) == ["Первое", "Второе"]
+
+    def test_mapped_document_empty_file(self, temp_dir):
+        from src.textsummarizer.utils.file_io import open_document
+
+        filepath = temp_dir / "empty.txt"
+        filepath.write_text("", encoding="utf-8")
+
+        assert len(open_document(filepath)) == 0
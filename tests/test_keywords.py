@@ -0,0 +1,78 @@
+import pytest
+from src.textsummarizer.core import TextSummarizer
+from src.textsummarizer.methods import FeatureBasedSummarizer
+from src.textsummarizer.utils.keywords import DEFAULT_KEYWORDS, KeywordSet
+
+
+class TestKeywordSet:
+    @pytest.mark.parametrize("scan_threshold", [0, 1000])
+    def test_count_matches_substring_search(self, scan_threshold):
+        keywords = KeywordSet(
+            ["метод", "методология", "лог", "ология", "he", "she", "hers"],
+            scan_threshold=scan_threshold,
+        )
+        texts = [
+            "методология и логика",
+            "ushers",
+            "ничего нет",
+            "",
+            "метод метод метод",
+        ]
+
+        for text in texts:
+            expected = sum(1 for kw in keywords.keywords if kw in text)
+            assert keywords.count(text) == expected
+
+    def test_compiles_large_sets(self):
+        assert not KeywordSet(DEFAULT_KEYWORDS).compiled
+        assert KeywordSet(DEFAULT_KEYWORDS, scan_threshold=0).compiled
+
+    def test_normalizes_keywords(self):
+        keywords = KeywordSet(["  Метод ", "", "АНАЛИЗ"])
+
+        assert set(keywords) == {"метод", "анализ"}
+
+    def test_from_file(self, temp_dir):
+        path = temp_dir / "keywords.txt"
+        path.write_text("# термины\nнейросеть\n\nтрансформер\n", encoding="utf-8")
+
+        keywords = KeywordSet.from_file(path)
+
+        assert set(keywords) == {"нейросеть", "трансформер"}
+
+    def test_from_missing_file(self, temp_dir):
+        with pytest.raises(FileNotFoundError, match="Файл ключевых слов не найден"):
+            KeywordSet.from_file(temp_dir / "missing.txt")
+
+    def test_fingerprint_ignores_order(self):
+        assert KeywordSet(["а", "б"]).fingerprint == KeywordSet(["б", "а"]).fingerprint
+        assert KeywordSet(["а"]).fingerprint != KeywordSet(["б"]).fingerprint
+
+
+class TestCustomKeywords:
+    def test_summarizer_uses_custom_keywords(self):
+        summarizer = FeatureBasedSummarizer(keywords=["нейросеть"])
+
+        features = summarizer._extract_features("Нейросеть обучена.", 0, 3)
+
+        assert features["keyword_score"] == pytest.approx(1 / 3)
+
+    def test_compiled_and_scan_paths_agree(self, sample_text_long):
+        words = list(DEFAULT_KEYWORDS) + [f"термин{i}" for i in range(300)]
+        compiled = TextSummarizer(keywords=KeywordSet(words))
+        scanned = TextSummarizer(keywords=KeywordSet(words, scan_threshold=10**6))
+
+        assert compiled.summarizer._keywords.compiled
+        assert (
+            compiled.summarize(sample_text_long).summary_text
+            == scanned.summarize(sample_text_long).summary_text
+        )
+
+    def test_keywords_file_path(self, temp_dir, sample_text_short):
+        path = temp_dir / "keywords.txt"
+        path.write_text("предложение\n", encoding="utf-8")
+
+        summarizer = TextSummarizer(keywords=str(path))
+
+        assert set(summarizer.summarizer._keywords) == {"предложение"}
+        assert summarizer.summarize(sample_text_short).summary_text
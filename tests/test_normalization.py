@@ -0,0 +1,125 @@
+import pytest
+from src.textsummarizer.core import TextSummarizer
+from src.textsummarizer.idf import CorpusStatistics, OnlineCorpusStatistics
+from src.textsummarizer.utils.normalization import DEFAULT_NORMALIZER, TextNormalizer
+from src.textsummarizer.utils.text_processing import (
+    analyze_text,
+    preprocess_text,
+    tokenize_text,
+    tokenize_words,
+)
+
+SENTENCES = [
+    "Привет, Мир! Это «тест» — 2024 год.",
+    "Hello,   World!\tIt's 42.",
+    "",
+    "   ",
+    "Ёлка и ель; (скобки) [и] {фигурные}",
+]
+
+
+class TestTextNormalizer:
+    @pytest.mark.parametrize(
+        "lowercase,remove_punctuation,remove_numbers",
+        [(True, True, False), (False, True, True), (True, False, True)],
+    )
+    def test_normalize_many_matches_normalize(
+        self, lowercase, remove_punctuation, remove_numbers
+    ):
+        flags = (lowercase, remove_punctuation, remove_numbers)
+        assert DEFAULT_NORMALIZER.normalize_many(SENTENCES, *flags) == [
+            DEFAULT_NORMALIZER.normalize(s, *flags) for s in SENTENCES
+        ]
+
+    def test_normalize(self):
+        assert (
+            DEFAULT_NORMALIZER.normalize(SENTENCES[0]) == "привет мир это тест 2024 год"
+        )
+        assert DEFAULT_NORMALIZER.normalize(SENTENCES[1]) == "hello world its 42"
+        assert DEFAULT_NORMALIZER.normalize(SENTENCES[4]) == (
+            "ёлка и ель скобки и фигурные"
+        )
+
+    def test_tokens_match_preprocess_chain(self):
+        assert DEFAULT_NORMALIZER.tokens_many(SENTENCES) == [
+            tokenize_words(preprocess_text(s)) for s in SENTENCES
+        ]
+        for sentence in SENTENCES:
+            assert DEFAULT_NORMALIZER.tokens(sentence) == tokenize_words(
+                preprocess_text(sentence)
+            )
+
+    def test_separator_inside_sentence(self):
+        sentences = ["a\0b, c", "D!"]
+        assert DEFAULT_NORMALIZER.normalize_many(sentences) == ["a\0b c", "d"]
+
+    def test_custom_punctuation(self):
+        normalizer = TextNormalizer(punctuation=".,")
+        assert normalizer.normalize("Да, нет. Может!") == "да нет может!"
+        assert normalizer.normalize_many(["Ёж, уж.", "x.y"]) == ["ёж уж", "xy"]
+
+    def test_words_and_sentences(self):
+        assert DEFAULT_NORMALIZER.words("Слово-за-слово, Дело!") == [
+            "слово",
+            "за",
+            "слово",
+            "дело",
+        ]
+        assert DEFAULT_NORMALIZER.split_sentences("Раз. Два!\nТри?..") == [
+            "Раз",
+            "Два",
+            "Три",
+        ]
+        assert DEFAULT_NORMALIZER.has_digits("в 3 часа")
+        assert not DEFAULT_NORMALIZER.has_digits("в три часа")
+
+
+class TestUnicodeTokenizer:
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Кое-как… всё — работает", ["кое", "как", "всё", "работает"]),
+            ("«Цитата»–тире; it’s 3.14!", ["цитата", "тире", "it", "s", "3", "14"]),
+            ("Ударе́ние и İstanbul", ["ударе́ние", "и", "i̇stanbul"]),
+            ("snake_case и...", ["snake_case", "и"]),
+            ("", []),
+        ],
+    )
+    def test_word_tokens(self, text, expected):
+        assert tokenize_text(text, "unicode") == expected
+        assert DEFAULT_NORMALIZER.word_tokens_many([text]) == [expected]
+
+    def test_legacy_is_preprocess_chain(self):
+        text = "Кое-как… всё — работает"
+        assert tokenize_text(text) == tokenize_words(preprocess_text(text))
+        # legacy склеивает слова через дефис и оставляет многоточие.
+        assert tokenize_text(text) == ["коекак…", "всё", "работает"]
+
+    def test_unknown_tokenizer(self):
+        with pytest.raises(ValueError, match="Неизвестный токенизатор"):
+            tokenize_text("текст", "nltk")
+
+    def test_summarizer_tokenizer(self, sample_text_long):
+        legacy = TextSummarizer()
+        unicode = TextSummarizer(tokenizer="unicode")
+
+        document = analyze_text("Кое-как… всё.", tokenizer="unicode")
+        assert document.sentences[0].tokens == ["кое", "как", "всё"]
+        assert "tokenizer" not in legacy._cache_config()
+        assert unicode._cache_config()["tokenizer"] == "unicode"
+        assert unicode.summarize(sample_text_long).summary_text
+        with pytest.raises(ValueError):
+            TextSummarizer(tokenizer="nltk")
+
+    def test_corpus_statistics_keeps_tokenizer(self, temp_dir):
+        path = temp_dir / "corpus.idf"
+        statistics = CorpusStatistics.build(["Кое-как… всё."], tokenizer="unicode")
+        statistics.save(path)
+
+        loaded = CorpusStatistics.load(path)
+
+        assert loaded.tokenizer == "unicode"
+        assert list(loaded) == ["всё", "как", "кое"]
+        assert loaded.fingerprint == statistics.fingerprint
+        with pytest.raises(ValueError):
+            OnlineCorpusStatistics(loaded, tokenizer="legacy")
@@ -0,0 +1,103 @@
+import pytest
+from src.textsummarizer.core import TextSummarizer
+from src.textsummarizer.profiling import (
+    NULL_TIMER,
+    StageTimer,
+    timings_to_prometheus,
+)
+
+
+class TestStageTimer:
+    def test_hooks_and_totals(self):
+        events = []
+        timer = StageTimer(
+            on_stage_start=lambda stage: events.append(("start", stage)),
+            on_stage_end=lambda stage, seconds: events.append(("end", stage)),
+        )
+
+        with timer.stage("split"):
+            pass
+        with timer.stage("split"):
+            pass
+
+        assert events == [
+            ("start", "split"),
+            ("end", "split"),
+            ("start", "split"),
+            ("end", "split"),
+        ]
+        assert timer.counts == {"split": 2}
+        assert timer.totals["split"] >= 0
+
+    def test_stage_recorded_on_exception(self):
+        timer = StageTimer()
+
+        with pytest.raises(ValueError):
+            with timer.stage("score"):
+                raise ValueError("сбой")
+
+        assert timer.counts == {"score": 1}
+
+    def test_null_timer(self):
+        assert not NULL_TIMER.enabled
+        with NULL_TIMER.stage("split"):
+            pass
+
+    def test_to_prometheus(self):
+        timer = StageTimer()
+        timer.totals = {"score": 0.5, "split": 0.25}
+        timer.counts = {"score": 2, "split": 2}
+
+        text = timer.to_prometheus(labels={"method": "feature"})
+
+        assert "# TYPE textsummarizer_stage_seconds summary" in text
+        lines = text.splitlines()
+        assert lines[2] == (
+            'textsummarizer_stage_seconds_sum{method="feature",stage="split"} 0.25'
+        )
+        assert (
+            'textsummarizer_stage_seconds_count{method="feature",stage="score"} 2'
+            in lines
+        )
+
+    def test_timings_to_prometheus(self):
+        text = timings_to_prometheus({"statistics": 0.125}, labels={"doc": 'a"b'})
+
+        assert 'stage="statistics"' in text
+        assert 'doc="a\\"b"' in text
+        assert text.endswith(" 0.125\n")
+
+
+class TestSummarizerTimings:
+    def test_timings_attached(self, sample_text_long):
+        stages = []
+        timer = StageTimer(on_stage_end=lambda stage, seconds: stages.append(stage))
+        summarizer = TextSummarizer(timer=timer)
+
+        result = summarizer.summarize(sample_text_long)
+
+        assert stages == ["split", "analyze", "score", "select", "statistics"]
+        assert set(result.timings) == set(stages)
+        assert all(seconds >= 0 for seconds in result.timings.values())
+
+    def test_timings_per_document(self, sample_text_short):
+        summarizer = TextSummarizer(timer=StageTimer())
+
+        summarizer.summarize(sample_text_short)
+        result = summarizer.summarize(sample_text_short)
+
+        assert summarizer.timer.counts["split"] == 2
+        assert result.timings["split"] < summarizer.timer.totals["split"] + 1e-9
+
+    def test_save_result_timed(self, sample_text_short, temp_dir):
+        summarizer = TextSummarizer(timer=StageTimer())
+        result = summarizer.summarize(sample_text_short)
+
+        summarizer.save_result(result, str(temp_dir))
+
+        assert "save" in result.timings
+
+    def test_disabled_by_default(self, sample_text_short):
+        result = TextSummarizer().summarize(sample_text_short)
+
+        assert result.timings == {}
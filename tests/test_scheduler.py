@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from src.textsummarizer.scheduler import MicroBatcher
+
+
+class TestMicroBatcher:
+    def test_flushes_when_full(self):
+        calls = []
+
+        async def run_batch(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+
+        async def scenario():
+            batcher = MicroBatcher(run_batch, max_size=3, max_delay=10)
+            return await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+
+        assert asyncio.run(scenario()) == [0, 2, 4, 6, 8, 10]
+        assert calls == [[0, 1, 2], [3, 4, 5]]
+
+    def test_flushes_after_delay(self):
+        calls = []
+
+        async def run_batch(items):
+            calls.append(list(items))
+            return items
+
+        async def scenario():
+            batcher = MicroBatcher(run_batch, max_size=100, max_delay=0.01)
+            return await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+        assert asyncio.run(scenario()) == ["a", "b"]
+        assert calls == [["a", "b"]]
+
+    def test_item_exception_is_isolated(self):
+        async def run_batch(items):
+            return [ValueError(item) if item == "bad" else item for item in items]
+
+        async def scenario():
+            batcher = MicroBatcher(run_batch, max_size=2)
+            return await asyncio.gather(
+                batcher.submit("ok"), batcher.submit("bad"), return_exceptions=True
+            )
+
+        ok, bad = asyncio.run(scenario())
+        assert ok == "ok"
+        assert isinstance(bad, ValueError)
+
+    def test_batch_exception_reaches_all(self):
+        async def run_batch(items):
+            raise RuntimeError("сбой")
+
+        async def scenario():
+            batcher = MicroBatcher(run_batch, max_size=2)
+            return await asyncio.gather(
+                batcher.submit(1), batcher.submit(2), return_exceptions=True
+            )
+
+        assert all(isinstance(r, RuntimeError) for r in asyncio.run(scenario()))
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            MicroBatcher(lambda items: items, max_size=0)
@@ -0,0 +1,116 @@
+import pytest
+from src.textsummarizer.core import TextSummarizer
+from src.textsummarizer.utils.segmenter import SentenceSegmenter
+from src.textsummarizer.utils.text_processing import (
+    iter_sentences,
+    split_into_sentences,
+)
+
+
+class TestSentenceSegmenter:
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            (
+                "Число 3.14 больше трех. Это т.е. пример!",
+                ["Число 3.14 больше трех", "Это т.е. пример"],
+            ),
+            (
+                "Он живет в г. Москва и т.д. Потом уехал.",
+                ["Он живет в г. Москва и т.д", "Потом уехал"],
+            ),
+            ("Книгу А. С. Пушкина издали.", ["Книгу А. С. Пушкина издали"]),
+            (
+                "Mr. Smith paid 2.5 dollars, e.g. a lot. Fine?!",
+                ["Mr. Smith paid 2.5 dollars, e.g. a lot", "Fine"],
+            ),
+            ("Начало. продолжение. Конец...", ["Начало. продолжение", "Конец"]),
+            ("Он сказал: «Стоп.» Затем ушел", ["Он сказал: «Стоп", "Затем ушел"]),
+            ("Строка\nс переносом. Вторая", ["Строка с переносом", "Вторая"]),
+            ("  \n ", []),
+            ("Я позвонил им. Они не ответили.", ["Я позвонил им", "Они не ответили"]),
+            ("I said no. He left.", ["I said no", "He left"]),
+            ("Всё ок. Идём дальше.", ["Всё ок", "Идём дальше"]),
+            ("Я. Ты. Мы.", ["Я", "Ты", "Мы"]),
+            ("Длина 5 см. Ширина 3 см.", ["Длина 5 см", "Ширина 3 см"]),
+            ("Use a tool, e.g.", ["Use a tool, e.g"]),
+            ("См. с. 5 и No. 7 там.", ["См. с. 5 и No. 7 там"]),
+            ("Им. Пушкина улица, им. рады.", ["Им", "Пушкина улица, им. рады"]),
+        ],
+    )
+    def test_split(self, text, expected):
+        assert SentenceSegmenter().split(text) == expected
+
+    def test_spans_point_into_text(self):
+        text = "  Первое предложение.  Второе, т.е. последнее!  "
+
+        spans = SentenceSegmenter().spans(text)
+
+        assert [text[start:end] for start, end in spans] == [
+            "Первое предложение",
+            "Второе, т.е. последнее",
+        ]
+
+    def test_custom_abbreviations(self):
+        text = "Смотри прил. Б. Готово."
+
+        assert SentenceSegmenter().split(text) == ["Смотри прил", "Б. Готово"]
+        assert SentenceSegmenter(["прил"]).split(text) == ["Смотри прил. Б. Готово"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+    def test_iter_sentences_matches_split(self, sample_text_long, chunk_size):
+        text = sample_text_long + (
+            " Число 3.14 и т.е. г. Москва. Я. Ты. Книгу А. С. Пушкина и"
+            " No. 7 издали в 5 см. Конец, e.g."
+        )
+        chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+        assert list(iter_sentences(chunks, "fast")) == split_into_sentences(
+            text, "fast"
+        )
+
+    def test_legacy_is_default(self):
+        text = "Число 3.14 больше трех."
+
+        assert split_into_sentences(text) == ["Число 3", "14 больше трех"]
+        assert split_into_sentences(text, "fast") == ["Число 3.14 больше трех"]
+
+    def test_unknown_segmenter(self):
+        with pytest.raises(ValueError, match="Неизвестный способ разбиения"):
+            split_into_sentences("Текст.", "regex")
+        with pytest.raises(ValueError, match="Неизвестный способ разбиения"):
+            TextSummarizer(segmenter="regex")
+
+
+class TestSummarizerSegmenter:
+    def test_summarize_with_fast_segmenter(self):
+        text = "В 2023 г. рост составил 3.5 процента. Это важный результат. Итог ясен."
+
+        legacy = TextSummarizer().summarize(text, compression_ratio=1.0)
+        fast = TextSummarizer(segmenter="fast").summarize(text, compression_ratio=1.0)
+
+        assert legacy.statistics.original_sentences_count == 5
+        assert fast.statistics.original_sentences_count == 3
+
+    def test_cache_key_depends_on_segmenter(self):
+        from src.textsummarizer.cache import SummaryCache
+
+        cache = SummaryCache()
+        text = "Рост 3.5 процента. Это результат."
+
+        TextSummarizer(cache=cache).summarize(text)
+        fast = TextSummarizer(cache=cache, segmenter="fast").summarize(text)
+
+        assert fast.statistics.original_sentences_count == 2
+
+    def test_stream_with_fast_segmenter(self, temp_dir):
+        path = temp_dir / "text.txt"
+        text = "В 2023 г. рост составил 3.5 процента. Это важный результат."
+        path.write_text(text, encoding="utf-8")
+        summarizer = TextSummarizer(segmenter="fast")
+
+        result = summarizer.summarize_stream(path, compression_ratio=1.0, chunk_size=8)
+
+        assert result.statistics.original_sentences_count == 2
+        with pytest.raises(ValueError, match="use_mmap"):
+            summarizer.summarize_stream(path, use_mmap=True)
@@ -0,0 +1,139 @@
+import asyncio
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.textsummarizer.core import TextSummarizer
+from src.textsummarizer.server import HTTPError, SummaryServer, _warmup
+
+
+@pytest.fixture(params=[1, 8], ids=["single", "batched"])
+def server(request):
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    server = SummaryServer(
+        port=0, workers=1, keepalive_timeout=2.0, max_batch_size=request.param
+    )
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result(timeout=30)
+    yield server
+
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result(timeout=30)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+def _post(connection, path, payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    connection.request(
+        "POST", path, body=body, headers={"Content-Type": "application/json"}
+    )
+    response = connection.getresponse()
+    return response.status, json.loads(response.read().decode("utf-8"))
+
+
+class TestSummaryServer:
+    def test_summarize(self, server, sample_text_long):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+
+        status, data = _post(
+            connection, "/summarize", {"text": sample_text_long, "ratio": 0.5}
+        )
+
+        expected = TextSummarizer().summarize(sample_text_long, compression_ratio=0.5)
+        assert status == 200
+        assert data["summary_text"] == expected.summary_text
+        assert [s["position"] for s in data["sentences"]] == [
+            s.position for s in expected.important_sentences
+        ]
+        assert (
+            data["statistics"]["summary_words_count"]
+            == expected.statistics.summary_words_count
+        )
+
+    def test_analyze(self, server, sample_text_short):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+
+        status, data = _post(connection, "/analyze", {"text": sample_text_short})
+
+        assert status == 200
+        assert data["sentences_count"] == 3
+        assert data["metrics"]["total_words"] > 0
+
+    def test_keep_alive(self, server, sample_text_short):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+
+        _post(connection, "/analyze", {"text": sample_text_short})
+        sock = connection.sock
+        status, _ = _post(connection, "/summarize", {"text": sample_text_short})
+
+        assert status == 200
+        assert connection.sock is sock
+
+    @pytest.mark.parametrize(
+        "path,payload,status",
+        [
+            ("/summarize", b"not json", 400),
+            ("/summarize", {"text": 42}, 400),
+            ("/summarize", {"text": "Текст.", "ratio": 2}, 400),
+            ("/unknown", {"text": "Текст."}, 404),
+        ],
+    )
+    def test_errors(self, server, path, payload, status):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+
+        actual, data = _post(connection, path, payload)
+
+        assert actual == status
+        assert "error" in data
+
+    def test_health(self, server):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+        connection.request("GET", "/health")
+        response = connection.getresponse()
+
+        assert response.status == 200
+        assert json.loads(response.read())["status"] == "ok"
+
+    def test_concurrent_requests(self, server, sample_text_long, sample_text_short):
+        texts = [sample_text_long, sample_text_short] * 8
+
+        def request(text):
+            connection = http.client.HTTPConnection(
+                "127.0.0.1", server.port, timeout=10
+            )
+            return _post(connection, "/summarize", {"text": text})
+
+        with ThreadPoolExecutor(max_workers=len(texts)) as executor:
+            responses = list(executor.map(request, texts))
+
+        summarizer = TextSummarizer()
+        for text, (status, data) in zip(texts, responses):
+            assert status == 200
+            assert data["summary_text"] == summarizer.summarize(text).summary_text
+
+    def test_queue_full(self):
+        async def scenario():
+            server = SummaryServer(queue_size=1)
+            # Диспетчеры не запущены, поэтому первая задача остается в очереди.
+            pending = asyncio.ensure_future(server.submit(_warmup))
+            await asyncio.sleep(0)
+            with pytest.raises(HTTPError) as error:
+                await server.submit(_warmup)
+            pending.cancel()
+            return error.value.status
+
+        assert asyncio.run(scenario()) == 503
+
+    def test_request_timeout(self):
+        async def scenario():
+            server = SummaryServer(request_timeout=0.01)
+            with pytest.raises(HTTPError) as error:
+                await server.submit(_warmup)
+            return error.value.status, server.queue.get_nowait()[2].done()
+
+        assert asyncio.run(scenario()) == (504, True)
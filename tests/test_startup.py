@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Бюджет на импорт пакета (и CLI); переопределяется для медленных CI-машин.
+IMPORT_BUDGET_MS = float(os.environ.get("TEXTSUMMARIZER_IMPORT_BUDGET_MS", "300"))
+
+HEAVY_MODULES = ("matplotlib", "numpy", "scipy", "concurrent.futures.process")
+
+
+def _run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_ms(module):
+    """Суммарное время импорта модуля по выводу python -X importtime."""
+    result = _run_python("-X", "importtime", "-c", f"import {module}")
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    raise AssertionError(f"{module} не найден в выводе -X importtime")
+
+
+class TestStartup:
+    @pytest.mark.parametrize("module", ["src.textsummarizer", "src.textsummarizer.cli"])
+    def test_heavy_modules_are_not_imported(self, module):
+        code = (
+            f"import sys, {module}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        loaded = _run_python("-c", code).stdout.strip()
+
+        assert loaded == ""
+
+    @pytest.mark.parametrize("module", ["src.textsummarizer", "src.textsummarizer.cli"])
+    def test_import_time_budget(self, module):
+        # Берем лучший из нескольких запусков, чтобы не ловить шум планировщика.
+        best = min(_cumulative_import_ms(module) for _ in range(3))
+
+        assert (
+            best < IMPORT_BUDGET_MS
+        ), f"Импорт {module} занял {best:.0f} мс (бюджет {IMPORT_BUDGET_MS:.0f} мс)"
+
+    def test_plot_functions_still_available(self):
+        code = (
+            "import sys; from src.textsummarizer.utils import plot_sentence_scores; "
+            "print('matplotlib' in sys.modules)"
+        )
+
+        assert _run_python("-c", code).stdout.strip() == "True"
@@ -80,3 +80,87 @@ class TestStatisticsCalculator:
         assert stats.original_sentences_count > 0
         assert stats.original_words_count > 0
         assert stats.original_readability.total_words > 0
+
+    def test_calculate_document_stats_matches_text_stats(self, sample_text_long):
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        calculator = StatisticsCalculator()
+        summary = "Машинное обучение использует алгоритмы."
+
+        from_text = calculator.calculate_stats(sample_text_long, summary)
+        from_documents = calculator.calculate_document_stats(
+            analyze_text(sample_text_long), analyze_text(summary)
+        )
+
+        assert from_text == from_documents
+
+    def test_analyze_text_tokenizes_each_sentence_once(self, sample_text_short):
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        document = analyze_text(sample_text_short)
+
+        assert len(document) == 3
+        assert document.sentences[0].tokens == ["это", "первое", "предложение"]
+        assert [sent.position for sent in document.sentences] == [0, 1, 2]
+        assert document.sentences[0].syllable_count == 10
+
+    def test_calculate_summary_stats_from_selected_sentences(self, sample_text_long):
+        from src.textsummarizer.methods.frequency_based import (
+            FrequencyBasedSummarizer,
+        )
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        calculator = StatisticsCalculator()
+        document = analyze_text(sample_text_long)
+        selected = FrequencyBasedSummarizer().summarize_document(document, 0.5)
+
+        stats = calculator.calculate_summary_stats(document, selected)
+        summary_text = " ".join(sent.text for sent in selected)
+        reparsed = calculator.calculate_stats(sample_text_long, summary_text)
+
+        assert stats.summary_sentences_count == len(selected)
+        assert stats.summary_words_count == reparsed.summary_words_count
+        assert (
+            stats.summary_readability.unique_words
+            == reparsed.summary_readability.unique_words
+        )
+        assert stats.original_readability == reparsed.original_readability
+
+    def test_calculate_summary_stats_reuses_original_aggregate(self, sample_text_long):
+        from src.textsummarizer.utils.text_processing import analyze_text
+
+        calculator = StatisticsCalculator()
+        document = analyze_text(sample_text_long)
+
+        calculator.calculate_summary_stats(document, [])
+        cached = document.readability
+        calculator.calculate_summary_stats(document, [])
+
+        assert cached is not None
+        assert document.readability is cached
+
+
+class TestReadability:
+    def test_tokens_readability_matches_text(self, sample_text_long):
+        from src.textsummarizer.utils.text_processing import (
+            analyze_text,
+            calculate_readability_metrics,
+            calculate_tokens_readability,
+        )
+
+        tokenized = [sent.tokens for sent in analyze_text(sample_text_long).sentences]
+
+        assert calculate_tokens_readability(tokenized) == (
+            calculate_readability_metrics(sample_text_long)
+        )
+        assert calculate_tokens_readability([]) == {}
+
+    def test_count_syllables_is_memoized(self):
+        from src.textsummarizer.utils.text_processing import count_syllables
+
+        count_syllables.cache_clear()
+
+        assert count_syllables("Предложение") == 5
+        assert count_syllables("Предложение") == 5
+        assert count_syllables("rhythm") == 1
+        assert count_syllables.cache_info().hits == 1
@@ -0,0 +1,82 @@
+import pytest
+from src.textsummarizer.idf import CorpusStatistics
+from src.textsummarizer.methods.frequency_based import FrequencyBasedSummarizer
+from src.textsummarizer.utils.text_processing import analyze_text
+from src.textsummarizer.utils.vocabulary import (
+    EncodedDocument,
+    Vocabulary,
+    encode_document,
+)
+
+
+class TestVocabulary:
+    def test_encode_decode(self):
+        vocabulary = Vocabulary(["мир", "дом"])
+        ids = vocabulary.encode(["дом", "сад", "мир", "сад"])
+
+        assert list(ids) == [1, 2, 0, 2]
+        assert vocabulary.terms == ["мир", "дом", "сад"]
+        assert vocabulary.decode(ids) == ["дом", "сад", "мир", "сад"]
+        assert len(vocabulary) == 3
+
+    def test_lookup_does_not_grow(self):
+        vocabulary = Vocabulary(["мир"])
+
+        assert vocabulary.id("мир") == 0
+        assert vocabulary.id("дом") == -1
+        assert "дом" not in vocabulary
+        assert vocabulary.ids_of(["дом", "мир", "и"]) == frozenset({0})
+        assert len(vocabulary) == 1
+        assert vocabulary.intern("дом") == 1
+
+
+class TestEncodedDocument:
+    def test_offsets(self):
+        encoded = EncodedDocument([["а", "б"], [], ["б", "в", "а"]])
+
+        assert len(encoded) == 3
+        assert list(encoded.offsets) == [0, 2, 2, 5]
+        assert [list(ids) for ids in encoded] == [[0, 1], [], [1, 2, 0]]
+        assert encoded.vocabulary.decode(encoded.sentence(2)) == ["б", "в", "а"]
+
+    def test_document_cache(self, sample_text_long):
+        document = analyze_text(sample_text_long)
+        encoded = encode_document(document)
+
+        assert encode_document(document) is encoded
+        assert len(encoded) == len(document.sentences)
+        for index, sentence in enumerate(document.sentences):
+            assert encoded.vocabulary.decode(encoded.sentence(index)) == sentence.tokens
+
+    def test_encoding_interns_tokens(self):
+        document = analyze_text("Дом стоит. Дом большой. Большой дом.")
+        tokens = [list(sentence.tokens) for sentence in document.sentences]
+        encode_document(document)
+        first = document.sentences[0].tokens[0]
+
+        assert [sentence.tokens for sentence in document.sentences] == tokens
+
+        assert document.sentences[1].tokens[0] is first
+        assert document.sentences[2].tokens[1] is first
+
+
+class TestEncodedScoring:
+    @pytest.mark.parametrize("use_idf", [False, True])
+    def test_backends_match(self, sample_text_long, use_idf):
+        idf = CorpusStatistics.build([sample_text_long]) if use_idf else None
+        scores = {}
+        for backend in ("python", "sparse"):
+            summarizer = FrequencyBasedSummarizer(backend=backend, idf=idf)
+            document = analyze_text(sample_text_long)
+            scores[backend] = summarizer._calculate_tf_isf_scores(document)
+
+        assert scores["python"] == pytest.approx(scores["sparse"])
+
+    def test_rescoring_reuses_encoding(self, sample_text_long):
+        summarizer = FrequencyBasedSummarizer()
+        document = analyze_text(sample_text_long)
+        first = summarizer._calculate_tf_isf_scores(document)
+        encoded = document.encoded
+
+        assert summarizer._calculate_tf_isf_scores(document) == first
+        assert document.encoded is encoded